@@ -0,0 +1,327 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import sys
+import struct
+import hashlib
+import tempfile
+import time
+
+try:
+    import cPickle as pickle
+
+except ImportError:
+    import pickle
+
+from pysmi.compat import encode, decode
+from pysmi import debug
+
+
+def hashKey(*parts):
+    """Turn given strings into a cache key"""
+    digest = hashlib.sha1()
+
+    for part in parts:
+        digest.update(encode(part))
+        digest.update(encode('\0'))
+
+    return digest.hexdigest()
+
+
+class DirectoryCache(object):
+    """Keep picklable Python objects in files at specified directory.
+
+    Cache is meant to be a speedup aid, so its failures never
+    affect the results. Missing or unreadable entry is reported as
+    a cache miss, entries that can't be stored are dropped.
+    """
+    suffix = '.pickle'
+
+    # readable by any Python version we support
+    pickleProtocol = 2
+
+    def __init__(self, path):
+        """Create an instance of *DirectoryCache* bound to a directory.
+
+           Args:
+               path (str): writable directory to store cached objects at
+        """
+        self._path = decode(os.path.normpath(path))
+
+    def __str__(self):
+        return '%s{"%s"}' % (self.__class__.__name__, self._path)
+
+    def get(self, key):
+        """Fetch cached object by key or return *None* if not cached"""
+        filename = os.path.join(self._path, key + self.suffix)
+
+        try:
+            f = open(filename, 'rb')
+
+        except (OSError, IOError):
+            debug.logger & debug.flagCache and debug.logger('cache miss for %s' % filename)
+            return
+
+        try:
+            try:
+                value = pickle.load(f)
+
+            finally:
+                f.close()
+
+        except Exception:
+            debug.logger & debug.flagCache and debug.logger(
+                'broken cache entry %s: %s' % (filename, sys.exc_info()[1]))
+            return
+
+        debug.logger & debug.flagCache and debug.logger('cache hit for %s' % filename)
+
+        return value
+
+    def put(self, key, value):
+        """Store picklable object in cache under the given key"""
+        filename = os.path.join(self._path, key + self.suffix)
+
+        tfile = None
+
+        try:
+            if not os.path.exists(self._path):
+                os.makedirs(self._path)
+
+            fd, tfile = tempfile.mkstemp(dir=self._path)
+            os.write(fd, pickle.dumps(value, self.pickleProtocol))
+            os.close(fd)
+            os.rename(tfile, filename)
+
+        except Exception:
+            debug.logger & debug.flagCache and debug.logger(
+                'failure caching %s: %s' % (filename, sys.exc_info()[1]))
+
+            if tfile:
+                try:
+                    os.unlink(tfile)
+
+                except OSError:
+                    pass
+
+            return
+
+        debug.logger & debug.flagCache and debug.logger('cached %s' % filename)
+
+
+class FileCache(object):
+    """Keep picklable Python objects in a single file.
+
+    Entries are appended to the end of the file, the latest entry
+    wins. File contents get indexed on first lookup, cached objects
+    are read from disk on demand.
+
+    Cache is meant to be a speedup aid, so its failures never
+    affect the results.
+    """
+    # key size, value size
+    recordHeader = struct.Struct('!II')
+
+    pickleProtocol = DirectoryCache.pickleProtocol
+
+    def __init__(self, path):
+        """Create an instance of *FileCache* bound to a file.
+
+           Args:
+               path (str): file to store cached objects at, gets created
+                           if not present
+        """
+        self._path = decode(os.path.normpath(path))
+        self._index = None
+
+    def __str__(self):
+        return '%s{"%s"}' % (self.__class__.__name__, self._path)
+
+    def __getstate__(self):
+        # do not carry index around, it may be stale by the time of use
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
+
+    def _buildIndex(self):
+        self._index = {}
+
+        try:
+            f = open(self._path, 'rb')
+
+        except (OSError, IOError):
+            return
+
+        try:
+            offset = 0
+
+            while True:
+                header = f.read(self.recordHeader.size)
+                if len(header) < self.recordHeader.size:
+                    break
+
+                keySize, valueSize = self.recordHeader.unpack(header)
+
+                key = f.read(keySize)
+                if len(key) < keySize:
+                    break
+
+                offset += self.recordHeader.size + keySize
+
+                self._index[decode(key)] = offset, valueSize
+
+                offset += valueSize
+
+                f.seek(offset)
+
+        finally:
+            f.close()
+
+        debug.logger & debug.flagCache and debug.logger(
+            'indexed %s entries at %s' % (len(self._index), self._path))
+
+    def get(self, key):
+        """Fetch cached object by key or return *None* if not cached"""
+        if self._index is None:
+            self._buildIndex()
+
+        if key not in self._index:
+            debug.logger & debug.flagCache and debug.logger('cache miss for %s at %s' % (key, self._path))
+            return
+
+        offset, size = self._index[key]
+
+        try:
+            f = open(self._path, 'rb')
+
+            try:
+                f.seek(offset)
+                value = pickle.loads(f.read(size))
+
+            finally:
+                f.close()
+
+        except Exception:
+            debug.logger & debug.flagCache and debug.logger(
+                'broken cache entry %s at %s: %s' % (key, self._path, sys.exc_info()[1]))
+            return
+
+        debug.logger & debug.flagCache and debug.logger('cache hit for %s at %s' % (key, self._path))
+
+        return value
+
+    def put(self, key, value):
+        """Store picklable object in cache under the given key"""
+        try:
+            directory = os.path.dirname(self._path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            encodedKey = encode(key)
+            encodedValue = pickle.dumps(value, self.pickleProtocol)
+
+            # the whole record goes in one write so that concurrent
+            # writers do not interleave
+            fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 438)
+
+            try:
+                offset = os.lseek(fd, 0, os.SEEK_END)
+                os.write(fd, self.recordHeader.pack(len(encodedKey), len(encodedValue)) + encodedKey + encodedValue)
+
+            finally:
+                os.close(fd)
+
+        except Exception:
+            debug.logger & debug.flagCache and debug.logger(
+                'failure caching %s at %s: %s' % (key, self._path, sys.exc_info()[1]))
+            return
+
+        if self._index is not None:
+            self._index[key] = offset + self.recordHeader.size + len(encodedKey), len(encodedValue)
+
+        debug.logger & debug.flagCache and debug.logger('cached %s at %s' % (key, self._path))
+
+
+class NotFoundCache(object):
+    """Remember failed MIB lookups for a while.
+
+    MIB compiler consults this cache before asking its readers,
+    searchers and borrowers for a MIB, so that MIBs known to be
+    unavailable at a particular place are not looked up there
+    over and over again.
+    """
+
+    def __init__(self, ttl=300, cache=None):
+        """Create an instance of *NotFoundCache*.
+
+           Keyword Args:
+               ttl (int): number of seconds to remember failed lookup for
+               cache: optional persistent cache object (e.g. :py:class:`DirectoryCache`
+                      or :py:class:`FileCache`) to share failed lookups
+                      across sessions
+        """
+        self._ttl = ttl
+        self._cache = cache
+        self._failures = {}  # k, v = lookup key, time of failure
+
+    def __str__(self):
+        return '%s{ttl=%s, %s}' % (self.__class__.__name__, self._ttl, self._cache)
+
+    @staticmethod
+    def _getKey(owner, mibname, context):
+        return hashKey(str(owner), mibname, *[str(x) for x in context])
+
+    def isNotFound(self, owner, mibname, *context):
+        """Tell if MIB lookup has failed recently.
+
+           Args:
+               owner: object (e.g. reader) that has been looking for the MIB
+               mibname (str): name of the MIB being looked up
+               context: other lookup parameters affecting the outcome
+
+           Returns:
+               *True* if MIB has not been found by *owner* within TTL
+        """
+        key = self._getKey(owner, mibname, context)
+
+        failedAt = self._failures.get(key)
+
+        if failedAt is None and self._cache is not None:
+            failedAt = self._cache.get(key)
+
+            if failedAt is not None:
+                self._failures[key] = failedAt
+
+        if not failedAt:
+            return False
+
+        if failedAt + self._ttl < time.time():
+            del self._failures[key]
+            return False
+
+        debug.logger & debug.flagCache and debug.logger(
+            'MIB %s recently not found by %s' % (mibname, owner))
+
+        return True
+
+    def setNotFound(self, owner, mibname, *context):
+        """Remember that MIB lookup has failed"""
+        key = self._getKey(owner, mibname, context)
+
+        self._failures[key] = failedAt = time.time()
+
+        if self._cache is not None:
+            self._cache.put(key, failedAt)
+
+    def forget(self, owner, mibname, *context):
+        """Forget failed MIB lookup (e.g. once MIB has appeared)"""
+        key = self._getKey(owner, mibname, context)
+
+        self._failures.pop(key, None)
+
+        if self._cache is not None and self._cache.get(key):
+            self._cache.put(key, 0)
@@ -0,0 +1,623 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+from pysmi.codegen import jenv
+from pysmi.codegen.jfilters import capfirst
+from pysmi import error
+
+import jinja2
+
+if sys.version_info[0] > 2:
+    # noinspection PyShadowingBuiltins
+    unicode = str
+
+
+class _Undefined(object):
+    """Stand-in for missing MIB context item, just like Jinja2 has"""
+
+    def __str__(self):
+        return ''
+
+    __unicode__ = __str__
+
+    def __contains__(self, item):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __getitem__(self, item):
+        raise error.PySmiCodegenError(
+            'Jinja template rendering error: no item %r in undefined value' % (item,))
+
+
+_undefined = _Undefined()
+
+
+def _getitem(obj, key):
+    # same look up rules as Jinja2 subscription follows
+    try:
+        return obj[key]
+
+    except (AttributeError, TypeError, LookupError):
+        if isinstance(key, (str, unicode)):
+            try:
+                return getattr(obj, key)
+
+            except AttributeError:
+                pass
+
+        return _undefined
+
+
+def _first(items):
+    items = list(items)
+    return [(idx == 0, idx == len(items) - 1, item) for idx, item in enumerate(items)]
+
+
+class MibDefinitionsEmitter(object):
+    """Turns intermediate MIB representation into pysnmp Python code.
+
+    Produces exactly the same text as the `pysnmp/mib-definitions.j2`
+    template does, but without the overhead of template rendering.
+    Each method corresponds to a block of the template.
+    """
+
+    def __init__(self):
+        self._wordwrap = jinja2.filters.FILTERS['wordwrap']
+        self._env = jenv.getEnvironment([jenv.templatesDir])
+
+    def wordwrap(self, text):
+        return self._wordwrap(self._env, unicode(text))
+
+    def emit(self, mib):
+        """Produce pysnmp Python code for MIB.
+
+        Args:
+            mib: MIB intermediate representation as prepared by
+                :py:class:`~pysmi.codegen.pysnmp.PySnmpCodeGen`
+
+        Returns:
+            Python source code text
+        """
+        out = []
+
+        self.docstring(out, mib)
+        self.apiVersionCheck(out, mib)
+        self.asn1Imports(out, mib)
+        self.asn1ConstraintsImports(out, mib)
+        self.smiImports(out, mib)
+        self.moduleIdentity(out, mib)
+        self.typesDefinitions(out, mib)
+        self.textualConventions(out, mib)
+        self.managedObjects(out, mib)
+        self.managedObjectsGroups(out, mib)
+        self.notificationObjects(out, mib)
+        self.notificationGroups(out, mib)
+        self.agentCapabilities(out, mib)
+        self.moduleCompliance(out, mib)
+        self.exports(out, mib)
+
+        return ''.join(out)
+
+    @staticmethod
+    def definitions(mib, *classes):
+        return [(symbol, definition) for symbol, definition in mib.items()
+                if _getitem(definition, 'class') in classes]
+
+    def docstring(self, out, mib):
+        out.append('"""SNMP MIB module (%s) expressed in pysnmp data model.\n'
+                   '\n'
+                   'This Python module is designed to be imported and executed by the\n'
+                   'pysnmp library.\n'
+                   '\n'
+                   'See http://snmplabs.com/pysnmp for further information.\n'
+                   '\n'
+                   'Notes\n'
+                   '-----\n' % (_getitem(_getitem(mib, 'meta'), 'module'),))
+
+        for comment in _getitem(_getitem(mib, 'meta'), 'comments'):
+            out.append('%s\n' % (comment,))
+
+        out.append('"""\n')
+
+    def apiVersionCheck(self, out, mib):
+        out.append("if 'mibBuilder' not in globals():\n"
+                   "    import sys\n"
+                   "\n"
+                   "    sys.stderr.write(__doc__)\n"
+                   "    sys.exit(1)\n")
+
+    def asn1Imports(self, out, mib):
+        out.append('\n'
+                   '# Import base ASN.1 objects even if this MIB does not use it\n'
+                   '\n'
+                   '(Integer,\n'
+                   ' OctetString,\n'
+                   ' ObjectIdentifier) = mibBuilder.importSymbols(\n'
+                   '    "ASN1",\n'
+                   '    "Integer",\n'
+                   '    "OctetString",\n'
+                   '    "ObjectIdentifier")\n'
+                   '\n'
+                   '(NamedValues,) = mibBuilder.importSymbols(\n'
+                   '    "ASN1-ENUMERATION",\n'
+                   '    "NamedValues")\n')
+
+    def asn1ConstraintsImports(self, out, mib):
+        out.append('(ConstraintsIntersection,\n'
+                   ' SingleValueConstraint,\n'
+                   ' ValueRangeConstraint,\n'
+                   ' ValueSizeConstraint,\n'
+                   ' ConstraintsUnion) = mibBuilder.importSymbols(\n'
+                   '    "ASN1-REFINEMENT",\n'
+                   '    "ConstraintsIntersection",\n'
+                   '    "SingleValueConstraint",\n'
+                   '    "ValueRangeConstraint",\n'
+                   '    "ValueSizeConstraint",\n'
+                   '    "ConstraintsUnion")\n')
+
+    def smiImports(self, out, mib):
+        out.append('\n'
+                   '# Import SMI symbols from the MIBs this MIB depends on\n'
+                   '\n')
+
+        for module, symbols in _getitem(mib, 'imports').items():
+            for first, last, symbol in _first(symbols):
+                symbol_ = unicode(symbol).replace('-', '_')
+
+                if first and last:
+                    out.append('(%s,) = mibBuilder.importSymbols(\n'
+                               '    "%s",\n' % (symbol_, module))
+                elif first:
+                    out.append('(%s,\n' % (symbol_,))
+                elif last:
+                    out.append(' %s) = mibBuilder.importSymbols(\n'
+                               '    "%s",\n' % (symbol_, module))
+                else:
+                    out.append(' %s,\n' % (symbol_,))
+
+            for first, last, symbol in _first(symbols):
+                if last:
+                    out.append('    "%s")\n' % (symbol,))
+                else:
+                    out.append('    "%s",\n' % (symbol,))
+
+            out.append('\n')
+
+    def setDescription(self, out, symbol, definition):
+        if 'description' in definition:
+            out.append('if mibBuilder.loadTexts:\n'
+                       '    %s.setDescription("""\\\n'
+                       '%s\n'
+                       '""")\n' % (symbol, self.wordwrap(definition['description'])))
+
+    def moduleIdentity(self, out, mib):
+        out.append('\n'
+                   '# MODULE-IDENTITY\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'moduleidentity'):
+            out.append('%s = ModuleIdentity(\n'
+                       '    %s\n'
+                       ')\n' % (symbol, _getitem(definition, 'oid')))
+
+            if 'revisions' in definition:
+                out.append('%s.setRevisions(\n' % (symbol,))
+
+                for first, last, revision in _first(definition.get('revisions', ())):
+                    revision = _getitem(revision, 'revision')
+
+                    if first and last:
+                        out.append('        ("%s",)\n' % (revision,))
+                    elif first:
+                        out.append('        ("%s",\n' % (revision,))
+                    elif last:
+                        out.append('         "%s")\n' % (revision,))
+                    else:
+                        out.append('         "%s",\n' % (revision,))
+
+                out.append(')\n')
+
+            if 'lastupdated' in definition:
+                out.append('%s.setLastUpdated("%s")\n' % (symbol, definition['lastupdated']))
+
+            if 'organization' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setOrganization("""\\\n'
+                           '%s\n'
+                           '""")\n' % (symbol, self.wordwrap(definition['organization'])))
+
+            if 'contactinfo' in definition:
+                out.append('%s.setContactInfo("""\\\n'
+                           '%s\n'
+                           '""")\n' % (symbol, self.wordwrap(definition['contactinfo'])))
+
+            self.setDescription(out, unicode(symbol).replace('-', '_'), definition)
+
+            out.append('\n')
+
+    def constraints(self, out, type, spec):
+        out.append('    subtypeSpec = %s.subtypeSpec\n' % (type,))
+
+        if 'enumeration' in spec:
+            out.append('    subtypeSpec += ConstraintsUnion(\n'
+                       '        SingleValueConstraint(\n')
+
+            for first, last, iden in _first(sorted(spec['enumeration'].values())):
+                if first and last:
+                    out.append('            %s\n' % (iden,))
+                elif first:
+                    out.append('            *(%s,\n' % (iden,))
+                elif last:
+                    out.append('              %s)\n' % (iden,))
+                else:
+                    out.append('              %s,\n' % (iden,))
+
+            out.append('        )\n'
+                       '    )\n')
+
+            self.namedValues(out, spec['enumeration'])
+
+        elif 'range' in spec:
+            out.append('    subtypeSpec += ConstraintsUnion(\n')
+
+            for range in spec['range']:
+                out.append('        ValueRangeConstraint(%s, %s),\n' % (
+                    _getitem(range, 'min'), _getitem(range, 'max')))
+
+            out.append('    )\n')
+
+        elif 'size' in spec:
+            out.append('    subtypeSpec += ConstraintsUnion(\n')
+
+            for range in spec['size']:
+                out.append('        ValueSizeConstraint(%s, %s),\n' % (
+                    _getitem(range, 'min'), _getitem(range, 'max')))
+
+            out.append('    )\n')
+
+        # macro call is followed by a line break
+        out.append('\n')
+
+    def namedValues(self, out, values):
+        out.append('    namedValues = NamedValues(\n')
+
+        for first, last, (name, iden) in _first(sorted(values.items())):
+            if first and last:
+                out.append('        ("%s", %s)\n' % (name, iden))
+            elif first:
+                out.append('        *(("%s", %s),\n' % (name, iden))
+            elif last:
+                out.append('          ("%s", %s))\n' % (name, iden))
+            else:
+                out.append('          ("%s", %s),\n' % (name, iden))
+
+        out.append('    )\n')
+
+    def default(self, out, definition):
+        default = _getitem(_getitem(definition, 'default'), 'default')
+
+        fmt = _getitem(default, 'format')
+        value = _getitem(default, 'value')
+
+        if fmt == 'decimal':
+            out.append('    defaultValue = %s\n' % (value,))
+
+        elif fmt in ('hex', 'bin'):
+            name = fmt == 'hex' and 'defaultHexValue' or 'defaultBinValue'
+
+            if _getitem(default, 'basetype') in ('Integer', 'Integer32'):
+                out.append('    %s = %s\n' % (name, value))
+            else:
+                out.append('    %s = "%s"\n' % (name, value))
+
+        elif fmt == 'string':
+            out.append('    defaultValue = OctetString("%s")\n' % (value,))
+
+        elif fmt == 'oid':
+            out.append('    defaultValue = "%s"\n' % (value,))
+
+        elif (fmt == 'enum' and 'constraints' in _getitem(definition, 'syntax') or
+                fmt == 'bits'):
+            enumeration = _getitem(_getitem(_getitem(definition, 'syntax'), 'constraints'), 'enumeration')
+            out.append('    defaultValue = %s\n' % (_getitem(enumeration, value),))
+
+        # macro call is followed by a line break
+        out.append('\n')
+
+    def typesDefinitions(self, out, mib):
+        out.append('\n'
+                   '# Types definitions\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'type'):
+            type = _getitem(_getitem(definition, 'type'), 'type')
+
+            out.append('\n'
+                       '\n'
+                       'class %s(%s):\n'
+                       '    """Custom type %s based on %s"""\n' % (symbol, type, symbol, type))
+
+            if 'default' in definition:
+                self.default(out, definition)
+
+            if 'constraints' in _getitem(definition, 'type'):
+                self.constraints(out, type, definition['type']['constraints'])
+
+            out.append('\n'
+                       '\n')
+
+    def textualConventions(self, out, mib):
+        out.append('\n'
+                   '# TEXTUAL-CONVENTIONS\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'textualconvention'):
+            type = _getitem(_getitem(definition, 'type'), 'type')
+
+            out.append('\n'
+                       '\n'
+                       'class %s(TextualConvention, %s):\n'
+                       '    status = "%s"\n' % (symbol, type, definition.get('status', 'current')))
+
+            if 'displayhint' in definition:
+                out.append('    displayHint = "%s"\n' % (definition['displayhint'],))
+
+            if 'constraints' in _getitem(definition, 'type'):
+                self.constraints(out, type, definition['type']['constraints'])
+
+            if 'description' in definition:
+                out.append('    if mibBuilder.loadTexts:\n'
+                           '        description = """\\\n'
+                           '%s\n'
+                           '"""\n' % (self.wordwrap(definition['description']),))
+
+        out.append('\n')
+
+    def syntaxDefinition(self, out, symbol, definition):
+        symbol_ = capfirst(unicode(symbol).replace('-', '_'))
+
+        syntax = definition['syntax']
+
+        type = _getitem(syntax, 'type')
+
+        if 'default' in definition or 'constraints' in syntax or 'bits' in syntax:
+            out.append('\n'
+                       '\n'
+                       'class _%s_Type(%s):\n'
+                       '    """Custom type %s based on %s"""\n' % (symbol_, type, symbol, type))
+
+            if 'default' in definition:
+                self.default(out, definition)
+
+            if 'constraints' in syntax:
+                self.constraints(out, type, syntax['constraints'])
+
+            if 'bits' in syntax:
+                self.namedValues(out, syntax['bits'])
+
+            out.append('\n')
+
+            if 'constraints' in syntax or 'bits' in syntax:
+                out.append('_%s_Type.__name__ = "%s"\n' % (symbol_, type))
+
+        else:
+            out.append('_%s_Type = %s\n' % (symbol_, type))
+
+    def managedObjects(self, out, mib):
+        out.append('\n'
+                   '# MIB Managed Objects in the order of their OIDs\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'objecttype', 'objectidentity'):
+            symbol_ = unicode(symbol).replace('-', '_')
+            Symbol_ = capfirst(symbol_)
+
+            if 'syntax' in definition:
+                self.syntaxDefinition(out, symbol, definition)
+
+            nodetype = _getitem(definition, 'nodetype')
+            oid = _getitem(definition, 'oid')
+
+            if definition['class'] == 'objectidentity':
+                out.append('_%s_ObjectIdentity = ObjectIdentity\n'
+                           '%s = _%s_ObjectIdentity(\n'
+                           '    %s\n'
+                           ')\n' % (Symbol_, symbol_, Symbol_, oid))
+
+            elif nodetype in ('scalar', 'column'):
+                out.append('_%s_Object = %s\n'
+                           '%s = _%s_Object(\n'
+                           '    %s,\n'
+                           '    _%s_Type()\n'
+                           ')\n'
+                           '%s.setMaxAccess("%s")\n' % (
+                               Symbol_, nodetype == 'scalar' and 'MibScalar' or 'MibTableColumn',
+                               symbol_, Symbol_, oid, Symbol_,
+                               symbol_, _getitem(definition, 'maxaccess')))
+
+            elif nodetype in ('table', 'row'):
+                out.append('_%s_Object = %s\n'
+                           '%s = _%s_Object(\n'
+                           '    %s\n'
+                           ')\n' % (Symbol_, nodetype == 'table' and 'MibTable' or 'MibTableRow',
+                                    symbol_, Symbol_, oid))
+
+                if nodetype == 'row' and 'indices' in definition:
+                    out.append('%s.setIndexNames(\n' % (symbol_,))
+
+                    for index in definition['indices']:
+                        out.append('    (%s, "%s", "%s"),\n' % (
+                            _getitem(index, 'implied'), _getitem(index, 'module'),
+                            _getitem(index, 'object')))
+
+                    out.append(')\n')
+
+                if nodetype == 'row' and 'augmention' in definition:
+                    augmented = _getitem(definition['augmention'], 'object')
+
+                    out.append('%s.registerAugmentions(\n'
+                               '    ("%s",\n'
+                               '     "%s")\n'
+                               ')\n'
+                               '%s.setIndexNames(*%s.getIndexNames())\n' % (
+                                   augmented, _getitem(_getitem(mib, 'meta'), 'module'),
+                                   symbol_, symbol_, augmented))
+
+            if 'status' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setStatus("%s")\n' % (symbol_, definition['status']))
+
+            if 'units' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setUnits("%s")\n' % (symbol_, definition['units']))
+
+            if 'reference' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setReference("""\\\n'
+                           '%s\n'
+                           '""")\n' % (symbol_, self.wordwrap(definition['reference'])))
+
+            self.setDescription(out, symbol_, definition)
+
+    def setObjects(self, out, symbol, definition):
+        if 'objects' not in definition:
+            return
+
+        out.append('%s.setObjects(\n' % (symbol,))
+
+        for first, last, obj in _first(definition['objects']):
+            module, name = _getitem(obj, 'module'), _getitem(obj, 'object')
+
+            if first and last:
+                out.append('    ("%s", "%s")\n' % (module, name))
+            elif first:
+                out.append('      *(("%s", "%s"),\n' % (module, name))
+            elif last:
+                out.append('        ("%s", "%s"))\n' % (module, name))
+            else:
+                out.append('        ("%s", "%s"),\n' % (module, name))
+
+        out.append(')\n')
+
+    def setStatus(self, out, symbol, definition):
+        out.append('if mibBuilder.loadTexts:\n'
+                   '    %s.setStatus(\n'
+                   '        "%s"\n'
+                   '    )\n' % (symbol, _getitem(definition, 'status')))
+
+    def managedObjectsGroups(self, out, mib):
+        out.append('\n'
+                   '# Managed Objects groups\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'objectgroup'):
+            symbol_ = unicode(symbol).replace('-', '_')
+
+            out.append('%s = ObjectGroup(\n'
+                       '    %s\n'
+                       ')\n' % (symbol_, _getitem(definition, 'oid')))
+
+            self.setObjects(out, symbol_, definition)
+
+            out.append('if mibBuilder.loadTexts:\n'
+                       '    %s.setStatus("%s")\n' % (symbol_, _getitem(definition, 'status')))
+
+            self.setDescription(out, symbol_, definition)
+
+            out.append('\n')
+
+    def notificationObjects(self, out, mib):
+        out.append('\n'
+                   '# Notification objects\n'
+                   '\n')
+
+        self.notifications(out, mib, 'notificationtype', 'NotificationType')
+
+    def notificationGroups(self, out, mib):
+        out.append('\n'
+                   '# Notifications groups\n'
+                   '\n')
+
+        self.notifications(out, mib, 'notificationgroup', 'NotificationGroup')
+
+    def notifications(self, out, mib, cls, className):
+        for symbol, definition in self.definitions(mib, cls):
+            symbol_ = unicode(symbol).replace('-', '_')
+
+            out.append('%s = %s(\n'
+                       '    %s\n'
+                       ')\n' % (symbol_, className, _getitem(definition, 'oid')))
+
+            self.setObjects(out, symbol_, definition)
+            self.setStatus(out, symbol_, definition)
+            self.setDescription(out, symbol_, definition)
+
+            out.append('\n')
+
+    def agentCapabilities(self, out, mib):
+        out.append('\n'
+                   '# Agent capabilities\n'
+                   '\n')
+
+        for symbol, definition in self.definitions(mib, 'agentcapabilities'):
+            symbol_ = unicode(symbol).replace('-', '_')
+
+            out.append('%s = AgentCapabilities(\n'
+                       '    %s\n'
+                       ')\n' % (symbol_, _getitem(definition, 'oid')))
+
+            if 'productrelease' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setProductRelease(\n'
+                           '        "%s"\n'
+                           '    )\n' % (symbol_, definition['productrelease']))
+
+            if 'reference' in definition:
+                out.append('if mibBuilder.loadTexts:\n'
+                           '    %s.setReference(\n'
+                           '        "%s"\n'
+                           '    )\n' % (symbol_, definition['reference']))
+
+            self.setStatus(out, symbol_, definition)
+            self.setDescription(out, symbol_, definition)
+
+            out.append('\n')
+
+    def moduleCompliance(self, out, mib):
+        out.append('\n'
+                   '# Module compliance\n'
+                   '\n')
+
+        self.notifications(out, mib, 'modulecompliance', 'ModuleCompliance')
+
+    def exports(self, out, mib):
+        out.append('\n'
+                   '# Export all MIB objects to the MIB builder\n'
+                   '\n'
+                   'mibBuilder.exportSymbols(\n'
+                   '    "%s",\n' % (_getitem(_getitem(mib, 'meta'), 'module'),))
+
+        definitions = self.definitions(
+            mib, 'moduleidentity', 'objecttype', 'agentcapabilities',
+            'modulecompliance', 'notificationgroup', 'notificationtype',
+            'objectgroup', 'objectidentity', 'textualconvention')
+
+        for first, last, (symbol, definition) in _first(definitions):
+            symbol_ = unicode(symbol).replace('-', '_')
+
+            if first and last:
+                out.append('    **{"%s": %s}\n' % (symbol, symbol_))
+            elif first:
+                out.append('    **{"%s": %s,\n' % (symbol, symbol_))
+            elif last:
+                out.append('       "%s": %s}\n' % (symbol, symbol_))
+            else:
+                out.append('       "%s": %s,\n' % (symbol, symbol_))
+
+        out.append(')\n')
@@ -13,9 +13,12 @@ except ImportError:
     from ordereddict import OrderedDict
 from pysmi.mibinfo import MibInfo
 from pysmi.codegen.base import AbstractCodeGen
+from pysmi.codegen import jenv
 from pysmi import error
 from pysmi import debug
 
+import jinja2
+
 if sys.version_info[0] > 2:
     unicode = str
     long = int
@@ -73,6 +76,38 @@ class IntermediateCodeGen(AbstractCodeGen):
         self.moduleName = ['DUMMY']
         self.genRules = {'text': True}
         self.symbolTable = {}
+        self._bytecodeCache = None
+
+    def setBytecodeCache(self, cache):
+        """Keep compiled Jinja2 templates in a persistent cache.
+
+           Args:
+               cache: cache object (e.g. :py:class:`pysmi.cache.DirectoryCache`)
+                      to keep compiled templates at or *None* to keep them
+                      in memory only
+        """
+        self._bytecodeCache = cache and jenv.BytecodeCache(cache)
+
+    def renderTemplate(self, templateName, context, dstTemplate=None):
+        """Render MIB intermediate representation with Jinja2 template.
+
+           Args:
+               templateName (str): template name relative to pysmi templates
+               context: MIB intermediate representation
+
+           Keyword Args:
+               dstTemplate (str): path to custom template to use instead
+
+           Returns:
+               rendered text
+        """
+        try:
+            tmpl = jenv.getTemplate(templateName, dstTemplate, self._bytecodeCache)
+            return tmpl.render(mib=context)
+
+        except jinja2.exceptions.TemplateError:
+            err = sys.exc_info()[1]
+            raise error.PySmiCodegenError('Jinja template rendering error: %s' % err)
 
     @staticmethod
     def transOpers(symbol):
@@ -0,0 +1,119 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import threading
+from pysmi.codegen import jfilters
+from pysmi import debug
+
+import jinja2
+
+templatesDir = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Jinja2 environments not using bytecode cache by template search path
+_environments = {}
+_lock = threading.Lock()
+
+
+class BytecodeCache(jinja2.BytecodeCache):
+    """Keep compiled Jinja2 templates in pysmi cache object.
+
+    Jinja2 checks template source checksum and Python version of
+    the cached bytecode, so stale entries are just ignored.
+    """
+
+    def __init__(self, cache):
+        """Create an instance of *BytecodeCache*.
+
+           Args:
+               cache: cache object (e.g. :py:class:`pysmi.cache.DirectoryCache`)
+                      to keep compiled templates at
+        """
+        self._cache = cache
+        self._environments = {}  # environments using this cache
+
+    def load_bytecode(self, bucket):
+        data = self._cache.get(bucket.key)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket):
+        self._cache.put(bucket.key, bucket.bytecode_to_string())
+
+
+def getEnvironment(searchPath, bytecodeCache=None):
+    """Return Jinja2 environment loading templates from given directories.
+
+    Environments are created once and reused, so that each template
+    is read and compiled just once. Environments using bytecode cache
+    are kept by the cache adapter and go away along with it.
+
+    Args:
+        searchPath (list): directories to look up templates at
+
+    Keyword Args:
+        bytecodeCache: optional :py:class:`BytecodeCache` to keep compiled
+            templates at
+
+    Returns:
+        :py:class:`jinja2.Environment` object
+    """
+    key = tuple(searchPath)
+
+    if bytecodeCache is None:
+        environments = _environments
+
+    else:
+        environments = bytecodeCache._environments
+
+    _lock.acquire()
+
+    try:
+        try:
+            return environments[key]
+
+        except KeyError:
+            pass
+
+        debug.logger & debug.flagCodegen and debug.logger(
+            'creating Jinja2 environment for %s' % ', '.join(searchPath))
+
+        env = jinja2.Environment(loader=jinja2.FileSystemLoader(list(searchPath)),
+                                 bytecode_cache=bytecodeCache,
+                                 auto_reload=False,
+                                 trim_blocks=True, lstrip_blocks=True)
+
+        env.filters['capfirst'] = jfilters.capfirst
+
+        environments[key] = env
+
+        return env
+
+    finally:
+        _lock.release()
+
+
+def getTemplate(templateName, dstTemplate=None, bytecodeCache=None):
+    """Return Jinja2 template object.
+
+    Args:
+        templateName (str): template name relative to pysmi templates directory
+
+    Keyword Args:
+        dstTemplate (str): path to custom template to use instead
+        bytecodeCache: optional :py:class:`BytecodeCache` to keep compiled
+            templates at
+
+    Returns:
+        :py:class:`jinja2.Template` object
+    """
+    searchPath = [templatesDir]
+
+    if dstTemplate:
+        searchPath.insert(0, os.path.dirname(os.path.abspath(dstTemplate)))
+        templateName = os.path.basename(dstTemplate)
+
+    return getEnvironment(searchPath, bytecodeCache).get_template(templateName)
@@ -5,7 +5,6 @@
 # License: http://snmplabs.com/pysmi/license.html
 #
 import sys
-import os
 try:
     import json
 except ImportError:
@@ -15,12 +14,9 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 from pysmi.codegen.intermediate import IntermediateCodeGen
-from pysmi.codegen import jfilters
 from pysmi import error
 from pysmi import debug
 
-import jinja2
-
 
 if sys.version_info[0] > 2:
     # noinspection PyShadowingBuiltins
@@ -43,26 +39,8 @@ class JsonCodeGen(IntermediateCodeGen):
     def genCode(self, ast, symbolTable, **kwargs):
         mibInfo, context = IntermediateCodeGen.genCode(self, ast, symbolTable, **kwargs)
 
-        # TODO: reduce code duplication with the other codegens
-
-        searchPath = os.path.join(os.path.dirname(__file__), 'templates')
-
         dstTemplate = kwargs.get('dstTemplate')
-        if dstTemplate:
-            searchPath.insert(0, os.path.dirname(os.path.abspath(dstTemplate)))
-
-        env = jinja2.Environment(loader=jinja2.FileSystemLoader(searchPath),
-                                 trim_blocks=True, lstrip_blocks=True)
-
-        env.filters['capfirst'] = jfilters.capfirst
-
-        try:
-            tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
-            text = tmpl.render(mib=context)
-
-        except jinja2.exceptions.TemplateError:
-            err = sys.exc_info()[1]
-            raise error.PySmiCodegenError('Jinja template rendering error: %s' % err)
+        text = self.renderTemplate(self.TEMPLATE_NAME, context, dstTemplate)
 
         debug.logger & debug.flagCodegen and debug.logger(
             'canonical MIB name %s (%s), imported MIB(s) %s, rendered from '
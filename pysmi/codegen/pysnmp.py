@@ -5,18 +5,14 @@
 # License: http://snmplabs.com/pysmi/license.html
 #
 import sys
-import os
 try:
     from collections import OrderedDict
 except ImportError:
     from ordereddict import OrderedDict
 from pysmi.codegen.intermediate import IntermediateCodeGen
-from pysmi.codegen import jfilters
-from pysmi import error
+from pysmi.codegen.emitter import MibDefinitionsEmitter
 from pysmi import debug
 
-import jinja2
-
 
 if sys.version_info[0] > 2:
     # noinspection PyShadowingBuiltins
@@ -88,6 +84,18 @@ class PySnmpCodeGen(IntermediateCodeGen):
                 'TRANSPORT-ADDRESS-MIB',
                 'INET-ADDRESS-MIB') + IntermediateCodeGen.baseMibs
 
+    def __init__(self, nativeEmitter=False):
+        """Create an instance of *PySnmpCodeGen*.
+
+           Keyword Args:
+               nativeEmitter (bool): produce Python code right from Python
+                   code rather than rendering Jinja2 template, unless custom
+                   template is requested. The outcome is the same, just faster.
+        """
+        IntermediateCodeGen.__init__(self)
+
+        self._emitter = nativeEmitter and MibDefinitionsEmitter() or None
+
     def genCode(self, ast, symbolTable, **kwargs):
         mibInfo, context = IntermediateCodeGen.genCode(self, ast, symbolTable, **kwargs)
 
@@ -136,26 +144,13 @@ class PySnmpCodeGen(IntermediateCodeGen):
 
         # Render Python code
 
-        searchPath = [os.path.join(os.path.dirname(__file__), 'templates')]
-
-        # TODO: add unit test on custom template
-
         dstTemplate = kwargs.get('dstTemplate')
-        if dstTemplate:
-            searchPath.insert(0, os.path.dirname(os.path.abspath(dstTemplate)))
-
-        env = jinja2.Environment(loader=jinja2.FileSystemLoader(searchPath),
-                                 trim_blocks=True, lstrip_blocks=True)
-
-        env.filters['capfirst'] = jfilters.capfirst
 
-        try:
-            tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
-            text = tmpl.render(mib=context)
+        if self._emitter and not dstTemplate:
+            text = self._emitter.emit(context)
 
-        except jinja2.exceptions.TemplateError:
-            err = sys.exc_info()[1]
-            raise error.PySmiCodegenError('Jinja template rendering error: %s' % err)
+        else:
+            text = self.renderTemplate(self.TEMPLATE_NAME, context, dstTemplate)
 
         debug.logger & debug.flagCodegen and debug.logger(
             'canonical MIB name %s (%s), imported MIB(s) %s, rendered from '
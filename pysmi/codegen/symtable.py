@@ -7,6 +7,7 @@
 # Build an internally used symbol table for each passed MIB.
 #
 import sys
+from collections import deque
 from keyword import iskeyword
 from pysmi.mibinfo import MibInfo
 from pysmi.codegen.base import AbstractCodeGen, dorepr
@@ -83,6 +84,7 @@ class SymtableCodeGen(AbstractCodeGen):
         self._cols = {}  # k, v = name, datatype
         self._exports = set()
         self._postponedSyms = {}  # k, v = symbol, (parents, properties)
+        self._waitingSyms = {}  # k, v = missing parent, [postponed symbols]
         self._parentOids = set()
         self._importMap = {}  # k, v = symbol, MIB
         self._symsOrder = []
@@ -159,43 +161,62 @@ class SymtableCodeGen(AbstractCodeGen):
 
         return {}, tuple(sorted(imports))
 
-    def allParentsExists(self, parents):
-        parentsExists = True
+    def _getMissingParent(self, parents):
         for parent in parents:
             if not (parent in self._out or
                     parent in self._importMap or
                     parent in self.baseTypes or
                     parent in ('MibTable', 'MibTableRow', 'MibTableColumn') or
                     parent in self._rows):
-                parentsExists = False
-                break
+                return parent
 
-        return parentsExists
+    def allParentsExists(self, parents):
+        return self._getMissingParent(parents) is None
 
     def regSym(self, symbol, symProps, parents=()):
         if symbol in self._out or symbol in self._postponedSyms:  # add to strict mode - or symbol in self._importMap:
             raise error.PySmiSemanticError('Duplicate symbol found: %s' % symbol)
 
-        if self.allParentsExists(parents):
+        missingParent = self._getMissingParent(parents)
+
+        if missingParent is None:
             self._out[symbol] = symProps
             self._symsOrder.append(symbol)
-            self.regPostponedSyms()
+            self.regPostponedSyms(symbol)
 
         else:
             self._postponedSyms[symbol] = (parents, symProps)
+            self._waitingSyms.setdefault(missingParent, []).append(symbol)
+
+    def regPostponedSyms(self, *symbols):
+        """Register postponed symbols which parents are all known now.
+
+           Each postponed symbol waits for just one of its missing
+           parents at a time, symbols being registered may let their
+           dependents be registered in turn.
+
+           Args:
+               symbols: newly registered symbols
+        """
+        symbols = deque(symbols)
+
+        # table rows are known before being registered
+        symbols.extend([x for x in self._rows if x in self._waitingSyms])
+
+        while symbols:
+            for sym in self._waitingSyms.pop(symbols.popleft(), ()):
+                parents, symProps = self._postponedSyms[sym]
 
-    def regPostponedSyms(self):
-        regedSyms = []
-        for sym, val in self._postponedSyms.items():
-            parents, symProps = val
+                missingParent = self._getMissingParent(parents)
 
-            if self.allParentsExists(parents):
-                self._out[sym] = symProps
-                self._symsOrder.append(sym)
-                regedSyms.append(sym)
+                if missingParent is None:
+                    del self._postponedSyms[sym]
+                    self._out[sym] = symProps
+                    self._symsOrder.append(sym)
+                    symbols.append(sym)
 
-        for sym in regedSyms:
-            self._postponedSyms.pop(sym)
+                else:
+                    self._waitingSyms.setdefault(missingParent, []).append(sym)
 
         # Clause handlers
 
@@ -600,6 +621,7 @@ class SymtableCodeGen(AbstractCodeGen):
         self._parentOids.clear()
         self._symsOrder = []
         self._postponedSyms.clear()
+        self._waitingSyms.clear()
         self._importMap.clear()
         self._out = {}  # should be new object, do not use `clear` method
         self.moduleName[0], moduleOid, imports, declarations = ast
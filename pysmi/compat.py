@@ -6,6 +6,12 @@
 #
 import sys
 
+try:
+    import asyncio
+
+except ImportError:
+    asyncio = None
+
 if sys.version_info[0] > 2:
     def encode(s):
         if isinstance(s, str):
@@ -28,3 +34,13 @@ else:
         if isinstance(s, str):
             s = s.decode('utf-8', 'ignore')
         return s
+
+
+def getRunningLoop():
+    """Return asyncio event loop running in current thread"""
+    try:
+        return asyncio.get_running_loop()
+
+    except AttributeError:
+        # Python < 3.7
+        return asyncio.get_event_loop()
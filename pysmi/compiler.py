@@ -7,16 +7,30 @@
 import sys
 import os
 import time
+import pickle
+from collections import deque
+from functools import partial
 
 try:
     from pwd import getpwuid
 except ImportError:
     # noinspection PyPep8
     getpwuid = lambda x: ['<unknown>']
+try:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = ThreadPoolExecutor = None
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
 from pysmi import __name__ as packageName
 from pysmi import __version__ as packageVersion
 from pysmi.mibinfo import MibInfo
+from pysmi.lexer.header import scanHeader
 from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi.cache import hashKey
+from pysmi.compat import getRunningLoop
 from pysmi import error
 from pysmi import debug
 
@@ -51,6 +65,147 @@ statusUnprocessed = MibStatus('unprocessed')
 statusMissing = MibStatus('missing')
 statusBorrowed = MibStatus('borrowed')
 
+# parser objects owned by a worker process, by their pickled form
+_workerParsers = {}
+
+
+def _parseInWorker(parserState, fileData, **kwargs):
+    # parser is unpickled once per worker process and then reused
+    parser = _workerParsers.get(parserState)
+
+    if parser is None:
+        parser = _workerParsers[parserState] = pickle.loads(parserState)
+
+    return parser.parse(fileData, **kwargs)
+
+
+class _ParseResult(object):
+    """Parse MIB in-place mimicking `concurrent.futures.Future` interface"""
+    def __init__(self, parse, fileData, **kwargs):
+        self._exc = self._ast = None
+
+        try:
+            self._ast = parse(fileData, **kwargs)
+
+        except error.PySmiError:
+            self._exc = sys.exc_info()[1]
+
+    def result(self):
+        if self._exc:
+            raise self._exc
+
+        return self._ast
+
+
+class _CachedMib(object):
+    """Stand-in for parse result holding MIB symbol tables taken from cache.
+
+    MIB AST is built on demand as it is only needed for MIB
+    transformation.
+    """
+    def __init__(self, symbolTables, fileData, **kwargs):
+        self._symbolTables = symbolTables
+        self._fileData = fileData
+        self._kwargs = kwargs
+
+    def result(self):
+        return self._symbolTables
+
+    def getMibTree(self, parser, mibname):
+        for mibTree in parser.parse(self._fileData, **self._kwargs):
+            if mibTree[0] == mibname:
+                return mibTree
+
+        raise error.PySmiError('MIB module %s not found on re-parsing' % mibname)
+
+
+class _CompileState(object):
+    """MIBs bookkeeping of a single *MibCompiler.compile* call"""
+    def __init__(self, mibnames, options, streaming=False):
+        self.mibnames = mibnames
+        self.options = options
+        self.streaming = streaming  # write and report MIBs one by one
+        self.processed = {}
+        self.reported = set()
+        self.pendingReports = deque()  # MIBs with not yet reported status
+        self.deferredReports = []  # MIBs reported only at the very end
+        self.parsedMibs = {}
+        self.failedMibs = {}
+        self.builtMibs = {}
+        self.symbolTableMap = {}
+        self.canonicalMibNames = {}
+        self.handledMibs = set()  # MIBs passed code generation stage
+        self.loop = None  # asyncio event loop MIBs are fetched in
+        self.parserState = None  # pickled parser for worker processes
+
+    def setStatus(self, mibname, status):
+        self.processed[mibname] = status
+        self.pendingReports.append(mibname)
+
+
+class _MibScheduler(object):
+    """Tell when parsed MIB is ready for code generation.
+
+    MIB is ready once all the MIBs it imports, directly or indirectly,
+    are either parsed or known to be unavailable.
+    """
+    def __init__(self):
+        self._settled = set()
+        self._waitingOn = {}  # k, v = MIB name, names of MIBs it waits for
+        self._dependents = {}  # k, v = MIB name, MIBs waiting for it
+        self._readyMibs = []
+
+    def isSettled(self, mibname):
+        return mibname in self._settled
+
+    def addMib(self, mibname, imported):
+        """Register parsed MIB along with the names of MIBs it imports"""
+        if mibname in self._settled or mibname in self._waitingOn:
+            return
+
+        waitingOn = set([x for x in imported if x != mibname and x not in self._settled])
+
+        self._waitingOn[mibname] = waitingOn
+
+        for dependency in waitingOn:
+            if dependency in self._dependents:
+                self._dependents[dependency].append(mibname)
+            else:
+                self._dependents[dependency] = [mibname]
+
+        if not waitingOn:
+            self._release(mibname)
+
+    def settle(self, mibname):
+        """Tell that this MIB name won't bring in any more parsed MIBs"""
+        if mibname not in self._waitingOn:
+            self._release(mibname)
+
+    def _release(self, mibname):
+        released = [mibname]
+
+        while released:
+            mibname = released.pop(0)
+
+            if mibname in self._settled:
+                continue
+
+            self._settled.add(mibname)
+
+            if mibname in self._waitingOn:
+                del self._waitingOn[mibname]
+                self._readyMibs.append(mibname)
+
+            for dependent in self._dependents.pop(mibname, ()):
+                waitingOn = self._waitingOn[dependent]
+                waitingOn.discard(mibname)
+                if not waitingOn:
+                    released.append(dependent)
+
+    def popReadyMibs(self):
+        readyMibs, self._readyMibs = self._readyMibs, []
+        return readyMibs
+
 
 class MibCompiler(object):
     """Top-level, user-facing, composite MIB compiler object.
@@ -75,6 +230,9 @@ class MibCompiler(object):
     """
     indexFile = 'index'
 
+    # read MIBs imports, as reported by MIB header scanner, ahead of time
+    prefetchImports = False
+
     def __init__(self, parser, codegen, writer):
         """Creates an instance of *MibCompiler* class.
 
@@ -90,6 +248,8 @@ class MibCompiler(object):
         self._sources = []
         self._searchers = []
         self._borrowers = []
+        self._symtableCache = None
+        self._notFoundCache = None
 
     def addSources(self, *sources):
         """Add more ASN.1 MIB source repositories.
@@ -156,6 +316,54 @@ class MibCompiler(object):
 
         return self
 
+    def setSymbolTableCache(self, cache):
+        """Use persistent cache of MIB symbol tables.
+
+        Symbol tables are cached along with MIB information under the
+        hash of ASN.1 MIB text, parser grammar and PySMI version. Whenever
+        fetched MIB is found in the cache, *MibCompiler* will not parse it
+        unless MIB is to be transformed.
+
+        Args:
+            cache: cache object e.g. *DirectoryCache* or *None* to disable caching
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._symtableCache = cache
+
+        debug.logger & debug.flagCompiler and debug.logger('MIB symbol tables cache: %s' % cache)
+
+        return self
+
+    def setNotFoundCache(self, cache):
+        """Remember MIBs that could not be found.
+
+        Once *readers* or *borrowers* report a MIB as missing for sure,
+        they won't be asked for it again till cache entry expires.
+        *Searchers* are always consulted as compiled MIBs come and go
+        locally.
+
+        Only not found errors with true *missing* attribute get cached.
+        Remote readers set it on genuine not found answers (e.g. HTTP 404
+        or FTP 550), but not on network failures. Local readers never
+        set it, so that MIBs added locally are found right away.
+
+        Args:
+            cache: :py:class:`~pysmi.cache.NotFoundCache` object or *None*
+                to disable caching
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._notFoundCache = cache
+
+        debug.logger & debug.flagCompiler and debug.logger('not found MIBs cache: %s' % cache)
+
+        return self
+
     def _get_system_info(self):
 
         try:
@@ -172,6 +380,331 @@ class MibCompiler(object):
 
         return platform_info, user_info
 
+    def _getParserExecutor(self, workers):
+        if not workers or workers < 2:
+            return
+
+        if ProcessPoolExecutor is None:
+            debug.logger & debug.flagCompiler and debug.logger(
+                'parallel parsing is not supported on this platform, parsing MIBs sequentially')
+            return
+
+        debug.logger & debug.flagCompiler and debug.logger('parsing MIBs with %s worker processes' % workers)
+
+        return ProcessPoolExecutor(max_workers=workers)
+
+    def _readMib(self, mibname, sourceIdx, state, executor, hints=None):
+        """Fetch MIB from the first source that has it and schedule its parsing.
+
+        Returns index of the source MIB is read from, MIB file information,
+        pending parse result, symbol tables cache key and a list of
+        (source, error) pairs met on the way. Index and parse result are
+        *None* if no source could provide the MIB.
+
+        If *hints* list is given, names of MIBs being imported, as
+        reported by the MIB header scanner, are appended to it.
+        """
+        errors = []
+
+        for sourceIdx in range(sourceIdx, len(self._sources)):
+            source = self._sources[sourceIdx]
+
+            debug.logger & debug.flagCompiler and debug.logger('trying source %s' % source)
+
+            if self._notFoundCache and self._notFoundCache.isNotFound(source, mibname):
+                continue
+
+            try:
+                fileInfo, fileData = source.getData(mibname)
+
+            except error.PySmiReaderFileNotFoundError:
+                debug.logger & debug.flagCompiler and debug.logger('no %s found at %s' % (mibname, source))
+
+                if self._notFoundCache and getattr(sys.exc_info()[1], 'missing', False):
+                    self._notFoundCache.setNotFound(source, mibname)
+
+                continue
+
+            except error.PySmiError:
+                errors.append((source, sys.exc_info()[1]))
+                continue
+
+            return self._prepareMib(mibname, sourceIdx, fileInfo, fileData, errors, state, executor, hints)
+
+        return None, None, None, None, errors
+
+    def _readMibs(self, mibnames, state, executor, hints=None):
+        """Read many MIBs, return a list of *_readMib* results"""
+        return [self._readMib(mibname, 0, state, executor, hints) for mibname in mibnames]
+
+    def _prepareMib(self, mibname, sourceIdx, fileInfo, fileData, errors, state, executor, hints):
+        """Look up fetched MIB in symbol tables cache or schedule its parsing"""
+        # texts are not worth building unless they make it to the output
+        parseOptions = dict(genTexts=bool(state.options.get('genTexts')))
+
+        symtableKey = None
+
+        if self._symtableCache:
+            symtableKey = hashKey(
+                packageVersion, self._parser.__class__.__name__,
+                repr(sorted(getattr(self._parser, 'grammarOptions', {}).items())),
+                fileData
+            )
+
+            symbolTables = self._symtableCache.get(symtableKey)
+
+            if symbolTables is not None:
+                debug.logger & debug.flagCompiler and debug.logger(
+                    'symbol tables of %s taken from %s' % (mibname, self._symtableCache))
+
+                return sourceIdx, fileInfo, _CachedMib(symbolTables, fileData, **parseOptions), None, errors
+
+        if hints is not None and (executor or self.prefetchImports):
+            try:
+                hints.extend(scanHeader(fileData).imported)
+
+            except error.PySmiError:
+                debug.logger & debug.flagCompiler and debug.logger(
+                    'MIB %s header scan failed: %s' % (mibname, sys.exc_info()[1]))
+
+        if executor:
+            parseResult = executor.submit(_parseInWorker, state.parserState, fileData, **parseOptions)
+
+        else:
+            parseResult = _ParseResult(self._parser.parse, fileData, **parseOptions)
+
+        return sourceIdx, fileInfo, parseResult, symtableKey, errors
+
+    def _genSymbolTables(self, parseResult, symtableKey, symbolTableMap):
+        """Yield AST, MIB information and symbol table of each parsed MIB module"""
+        if isinstance(parseResult, _CachedMib):
+            for mibInfo, symbolTable in parseResult.result():
+                yield parseResult, mibInfo, symbolTable
+
+            return
+
+        symbolTables = []
+
+        for mibTree in parseResult.result():
+            mibInfo, symbolTable = self._symbolgen.genCode(
+                mibTree, symbolTableMap
+            )
+
+            symbolTables.append((mibInfo, symbolTable))
+
+            yield mibTree, mibInfo, symbolTable
+
+        if symtableKey:
+            self._symtableCache.put(symtableKey, symbolTables)
+
+    @staticmethod
+    def _markFailed(mibname, source, exc, state):
+        exc.source = source
+        exc.mibname = mibname
+        exc.msg += ' at MIB %s' % mibname
+
+        debug.logger & debug.flagCompiler and debug.logger('%serror %s from %s' % (
+            state.options.get('ignoreErrors') and 'ignoring ' or 'failing on ', exc, source))
+
+        state.failedMibs[mibname] = exc
+
+        state.setStatus(mibname, statusFailed.setOptions(error=exc))
+
+    def _checkMib(self, mibname, mtime, state):
+        """Tell if MIB needs to be (re)built judging from *searchers*"""
+        debug.logger & debug.flagCompiler and debug.logger('checking if %s requires updating' % mibname)
+
+        for searcher in self._searchers:
+            try:
+                searcher.fileExists(mibname, mtime, rebuild=state.options.get('rebuild'))
+
+            except error.PySmiFileNotFoundError:
+                debug.logger & debug.flagCompiler and debug.logger(
+                    'no compiled MIB %s available through %s' % (mibname, searcher))
+                continue
+
+            except error.PySmiFileNotModifiedError:
+                debug.logger & debug.flagCompiler and debug.logger(
+                    'will be using existing compiled MIB %s found by %s' % (mibname, searcher))
+                return False
+
+            except error.PySmiError:
+                exc_class, exc, tb = sys.exc_info()
+                exc.searcher = searcher
+                exc.mibname = mibname
+                exc.msg += ' at MIB %s' % mibname
+                debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (searcher, exc))
+                continue
+
+        debug.logger & debug.flagCompiler and debug.logger(
+            'no suitable compiled MIB %s found anywhere' % mibname)
+
+        return True
+
+    def _genMib(self, mibname, state):
+        """Run code generator against parsed MIB unless it is up to date"""
+        fileInfo, mibInfo, mibTree = state.parsedMibs.pop(mibname)
+
+        state.handledMibs.add(mibname)
+
+        if not self._checkMib(mibname, fileInfo.mtime, state):
+            state.setStatus(mibname, statusUntouched)
+            return
+
+        if state.options.get('noDeps') and mibname not in state.canonicalMibNames:
+            debug.logger & debug.flagCompiler and debug.logger(
+                'excluding imported MIB %s from code generation' % mibname)
+            state.setStatus(mibname, statusUntouched)
+            return
+
+        if isinstance(mibTree, _CachedMib):
+            try:
+                mibTree = mibTree.getMibTree(self._parser, mibname)
+
+            except error.PySmiError:
+                exc_class, exc, tb = sys.exc_info()
+                exc.mibname = mibname
+                exc.msg += ' at MIB %s' % mibname
+
+                debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (self._parser, exc))
+
+                state.setStatus(mibname, statusFailed.setOptions(error=exc))
+                state.failedMibs[mibname] = exc
+                return
+
+        debug.logger & debug.flagCompiler and debug.logger('compiling %s read from %s' % (mibname, fileInfo.path))
+
+        platform_info, user_info = self._get_system_info()
+
+        comments = [
+            'ASN.1 source %s' % fileInfo.path,
+            'Produced by %s-%s at %s' % (packageName, packageVersion, time.asctime()),
+            'On host %s platform %s version %s by user %s' % (platform_info[1], platform_info[0],
+                                                              platform_info[2], user_info[0]),
+            'Using Python version %s' % sys.version.split('\n')[0]
+        ]
+
+        try:
+            mibInfo, mibData = self._codegen.genCode(
+                mibTree,
+                state.symbolTableMap,
+                comments=comments,
+                dstTemplate=state.options.get('dstTemplate'),
+                genTexts=state.options.get('genTexts'),
+                textFilter=state.options.get('textFilter')
+            )
+
+            state.builtMibs[mibname] = fileInfo, mibInfo, mibData
+
+            debug.logger & debug.flagCompiler and debug.logger(
+                '%s read from %s and compiled by %s' % (mibname, fileInfo.path, self._writer))
+
+        except error.PySmiError:
+            exc_class, exc, tb = sys.exc_info()
+            exc.handler = self._codegen
+            exc.mibname = mibname
+            exc.msg += ' at MIB %s' % mibname
+
+            debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (self._codegen, exc))
+
+            state.setStatus(mibname, statusFailed.setOptions(error=exc))
+
+            state.failedMibs[mibname] = exc
+
+    def _genReadyMibs(self, scheduler, state):
+        """Build MIBs which have all their dependencies parsed, yield finished ones"""
+        for mibname in scheduler.popReadyMibs():
+            if mibname not in state.parsedMibs:
+                continue
+
+            self._genMib(mibname, state)
+
+            # failure of any MIB would void all the writes unless errors
+            # are ignored or MIBs are reported as soon as they are written
+            if mibname in state.builtMibs and (state.streaming or state.options.get('ignoreErrors')):
+                self._storeMib(mibname, state)
+
+            for x in self._reportMibs(state):
+                yield x
+
+    @staticmethod
+    def _reportMibs(state, final=False):
+        """Yield MIB names along with their status once it is final"""
+        pendingReports = state.pendingReports
+
+        if final:
+            pendingReports.extendleft(reversed(state.deferredReports))
+            state.deferredReports = []
+
+        while pendingReports:
+            mibname = pendingReports.popleft()
+
+            if mibname in state.reported:
+                continue
+
+            # failed MIBs may still get borrowed
+            if not final and state.processed[mibname] not in ('compiled', 'untouched'):
+                state.deferredReports.append(mibname)
+                continue
+
+            state.reported.add(mibname)
+
+            if state.streaming:
+                yield mibname, state.processed.pop(mibname)
+
+            else:
+                yield mibname, state.processed[mibname]
+
+    def _storeMib(self, mibname, state):
+        fileInfo, mibInfo, mibData = state.builtMibs.pop(mibname)
+
+        try:
+            if state.options.get('writeMibs', True):
+                self._writer.putData(
+                    mibname, mibData, dryRun=state.options.get('dryRun')
+                )
+
+            debug.logger & debug.flagCompiler and debug.logger('%s stored by %s' % (mibname, self._writer))
+
+            if mibname not in state.processed:
+                state.setStatus(mibname, statusCompiled.setOptions(
+                    path=fileInfo.path,
+                    file=fileInfo.file,
+                    alias=fileInfo.name,
+                    oid=mibInfo.oid,
+                    oids=mibInfo.oids,
+                    identity=mibInfo.identity,
+                    revision=mibInfo.revision,
+                    enterprise=mibInfo.enterprise,
+                    compliance=mibInfo.compliance,
+                ))
+
+        except error.PySmiError:
+            exc_class, exc, tb = sys.exc_info()
+            exc.handler = self._codegen
+            exc.mibname = mibname
+            exc.msg += ' at MIB %s' % mibname
+
+            debug.logger & debug.flagCompiler and debug.logger('error %s from %s' % (exc, self._writer))
+
+            state.setStatus(mibname, statusFailed.setOptions(error=exc))
+            state.failedMibs[mibname] = exc
+
+    def _flushMibs(self, state):
+        """Complete postponed writes, fail MIBs writer could not store"""
+        for mibname, exc in self._writer.flush().items():
+            exc.handler = self._writer
+            exc.mibname = mibname
+            exc.msg += ' at MIB %s' % mibname
+
+            debug.logger & debug.flagCompiler and debug.logger('error %s from %s' % (exc, self._writer))
+
+            state.setStatus(mibname, statusFailed.setOptions(error=exc))
+            state.failedMibs[mibname] = exc
+
+            # MIB may have been reported as compiled
+            state.reported.discard(mibname)
+
     def compile(self, *mibnames, **options):
         """Transform requested and possibly referred MIBs.
 
@@ -191,194 +724,243 @@ class MibCompiler(object):
         *mibnames* and may be performed for all MIBs referred to from
         MIBs being processed.
 
+        MIB transformation starts as soon as the MIB and all the MIBs
+        it imports, directly or indirectly, are parsed. If *ignoreErrors*
+        option is set, transformed MIB is written out right away. Otherwise
+        writing is postponed till all MIBs are processed.
+
         Args:
             mibnames: list of ASN.1 MIBs names
             options: options that affect the way PySMI components work
 
+        Keyword Args:
+            workers (int): number of worker processes to parse MIBs in
+                parallel. MIBs imports are quickly figured out from MIB
+                headers so that imported MIBs can be fetched and parsed
+                ahead of time. Default is to parse MIBs one by one.
+
         Returns:
             A dictionary of MIB module names processed (keys) and *MibStatus*
             class instances (values)
 
         """
-        processed = {}
-        parsedMibs = {}
-        failedMibs = {}
+        state = _CompileState(mibnames, options)
+
+        for mibname, status in self._compile(state):
+            pass
+
+        return state.processed
+
+    def icompile(self, *mibnames, **options):
+        """Transform requested and possibly referred MIBs one by one.
+
+        Works like :py:meth:`compile`, but reports each MIB as soon as
+        it is written (or found up to date) and forgets its AST and
+        transformed data right away. That keeps memory footprint low
+        when many MIBs are processed in one go.
+
+        Since reported MIBs can't be taken back, each transformed MIB
+        is written out right away as if *ignoreErrors* option is set.
+        MIBs that failed, went missing or got borrowed are reported
+        at the very end. If writer fails to complete postponed write
+        of already reported MIB (e.g. deferred byte-compilation), such
+        MIB is reported once again as failed.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            options: options that affect the way PySMI components work
+                (same as :py:meth:`compile` takes)
+
+        Returns:
+            Iterator over pairs of MIB module name and *MibStatus*
+            class instance
+        """
+        state = _CompileState(mibnames, options, streaming=True)
+
+        for mibname, status in self._compile(state):
+            yield mibname, status
+
+    def _compile(self, state):
+        """Yield MIB names and statuses while processing MIBs"""
+        mibnames = state.mibnames
+        options = state.options
+
+        processed = state.processed
+        parsedMibs = state.parsedMibs
+        failedMibs = state.failedMibs
         borrowedMibs = {}
-        builtMibs = {}
-        symbolTableMap = {}
+        builtMibs = state.builtMibs
+        symbolTableMap = state.symbolTableMap
         mibsToParse = [x for x in mibnames]
-        canonicalMibNames = {}
+        canonicalMibNames = state.canonicalMibNames
 
-        while mibsToParse:
-            mibname = mibsToParse.pop(0)
+        scheduler = _MibScheduler()
 
-            if mibname in parsedMibs:
-                debug.logger & debug.flagCompiler and debug.logger('MIB %s already parsed' % mibname)
-                continue
+        # requested MIBs should all be read before deciding on code generation
+        requestedMibsRead = False
 
-            if mibname in failedMibs:
-                debug.logger & debug.flagCompiler and debug.logger('MIB %s already failed' % mibname)
-                continue
+        executor = self._getParserExecutor(options.get('workers'))
 
-            for source in self._sources:
-                debug.logger & debug.flagCompiler and debug.logger('trying source %s' % source)
+        if executor:
+            state.parserState = pickle.dumps(self._parser, pickle.HIGHEST_PROTOCOL)
 
-                try:
-                    fileInfo, fileData = source.getData(mibname)
+        # MIBs likely to be imported, fetched and handed over to
+        # workers ahead of time
+        prefetchedMibs = {}
+        hints = []
 
-                    for mibTree in self._parser.parse(fileData):
-                        mibInfo, symbolTable = self._symbolgen.genCode(
-                            mibTree, symbolTableMap
-                        )
+        try:
+            while mibsToParse:
+                # fetch MIBs of the same discovery round and let the
+                # parser crunch them, possibly concurrently
+                pendingMibs = []
+                pendingNames = set()
 
-                        symbolTableMap[mibInfo.name] = symbolTable
+                while mibsToParse:
+                    mibname = mibsToParse.pop(0)
 
-                        parsedMibs[mibInfo.name] = fileInfo, mibInfo, mibTree
+                    if mibname in symbolTableMap:
+                        debug.logger & debug.flagCompiler and debug.logger('MIB %s already parsed' % mibname)
+                        continue
 
-                        if mibname in failedMibs:
-                            del failedMibs[mibname]
+                    if mibname in failedMibs:
+                        debug.logger & debug.flagCompiler and debug.logger('MIB %s already failed' % mibname)
+                        continue
 
-                        mibsToParse.extend(mibInfo.imported)
+                    if mibname in pendingNames:
+                        continue
 
-                        if fileInfo.name in mibnames:
-                            if mibInfo.name not in canonicalMibNames:
-                                canonicalMibNames[mibInfo.name] = []
-                            canonicalMibNames[mibInfo.name].append(fileInfo.name)
+                    pendingNames.add(mibname)
 
-                        debug.logger & debug.flagCompiler and debug.logger(
-                            '%s (%s) read from %s, immediate dependencies: %s' % (
-                                mibInfo.name, mibname, fileInfo.path, ', '.join(mibInfo.imported) or '<none>'))
+                    pendingMibs.append(mibname)
 
-                    break
+                mibsToRead = [x for x in pendingMibs if x not in prefetchedMibs]
 
-                except error.PySmiReaderFileNotFoundError:
-                    debug.logger & debug.flagCompiler and debug.logger('no %s found at %s' % (mibname, source))
-                    continue
+                prefetchedMibs.update(zip(mibsToRead, self._readMibs(mibsToRead, state, executor, hints)))
 
-                except error.PySmiError:
-                    exc_class, exc, tb = sys.exc_info()
-                    exc.source = source
-                    exc.mibname = mibname
-                    exc.msg += ' at MIB %s' % mibname
+                pendingMibs = [(x, prefetchedMibs.pop(x)) for x in pendingMibs]
 
-                    debug.logger & debug.flagCompiler and debug.logger('%serror %s from %s' % (
-                        options.get('ignoreErrors') and 'ignoring ' or 'failing on ', exc, source))
+                # keep workers busy with the MIBs of the next rounds
+                while hints:
+                    mibsToRead = []
 
-                    failedMibs[mibname] = exc
+                    while hints:
+                        mibname = hints.pop(0)
 
-                    processed[mibname] = statusFailed.setOptions(error=exc)
+                        if (mibname in symbolTableMap or mibname in failedMibs or
+                                mibname in pendingNames or mibname in prefetchedMibs or
+                                mibname in mibsToRead):
+                            continue
 
-            else:
-                exc = error.PySmiError('MIB source %s not found' % mibname)
-                exc.mibname = mibname
-                debug.logger & debug.flagCompiler and debug.logger('no %s found everywhere' % mibname)
+                        debug.logger & debug.flagCompiler and debug.logger('prefetching MIB %s' % mibname)
 
-                if mibname not in failedMibs:
-                    failedMibs[mibname] = exc
+                        mibsToRead.append(mibname)
 
-                if mibname not in processed:
-                    processed[mibname] = statusMissing
+                    prefetchedMibs.update(zip(mibsToRead, self._readMibs(mibsToRead, state, executor, hints)))
 
-        debug.logger & debug.flagCompiler and debug.logger(
-            'MIBs analyzed %s, MIBs failed %s' % (len(parsedMibs), len(failedMibs)))
+                # collect parsed MIBs in the order of discovery
+                for mibname, (sourceIdx, fileInfo, parseResult, symtableKey, errors) in pendingMibs:
 
-        #
-        # See what MIBs need generating
-        #
+                    if mibname in symbolTableMap:
+                        debug.logger & debug.flagCompiler and debug.logger('MIB %s already parsed' % mibname)
+                        continue
 
-        for mibname in tuple(parsedMibs):
-            fileInfo, mibInfo, mibTree = parsedMibs[mibname]
+                    while True:
+                        for source, exc in errors:
+                            self._markFailed(mibname, source, exc, state)
 
-            debug.logger & debug.flagCompiler and debug.logger('checking if %s requires updating' % mibname)
+                        if parseResult is None:
+                            break
 
-            for searcher in self._searchers:
-                try:
-                    searcher.fileExists(mibname, fileInfo.mtime, rebuild=options.get('rebuild'))
+                        source = self._sources[sourceIdx]
 
-                except error.PySmiFileNotFoundError:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'no compiled MIB %s available through %s' % (mibname, searcher))
-                    continue
+                        try:
+                            for mibTree, mibInfo, symbolTable in self._genSymbolTables(
+                                    parseResult, symtableKey, symbolTableMap):
 
-                except error.PySmiFileNotModifiedError:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'will be using existing compiled MIB %s found by %s' % (mibname, searcher))
-                    del parsedMibs[mibname]
-                    processed[mibname] = statusUntouched
-                    break
+                                symbolTableMap[mibInfo.name] = symbolTable
 
-                except error.PySmiError:
-                    exc_class, exc, tb = sys.exc_info()
-                    exc.searcher = searcher
-                    exc.mibname = mibname
-                    exc.msg += ' at MIB %s' % mibname
-                    debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (searcher, exc))
-                    continue
+                                if mibInfo.name in state.handledMibs:
+                                    debug.logger & debug.flagCompiler and debug.logger(
+                                        'MIB %s already processed' % mibInfo.name)
 
-            else:
-                debug.logger & debug.flagCompiler and debug.logger(
-                    'no suitable compiled MIB %s found anywhere' % mibname)
+                                else:
+                                    parsedMibs[mibInfo.name] = fileInfo, mibInfo, mibTree
 
-                if options.get('noDeps') and mibname not in canonicalMibNames:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'excluding imported MIB %s from code generation' % mibname)
-                    del parsedMibs[mibname]
-                    processed[mibname] = statusUntouched
-                    continue
+                                    scheduler.addMib(mibInfo.name, mibInfo.imported)
 
-        debug.logger & debug.flagCompiler and debug.logger(
-            'MIBs parsed %s, MIBs failed %s' % (len(parsedMibs), len(failedMibs)))
+                                if mibname in failedMibs:
+                                    del failedMibs[mibname]
 
-        #
-        # Generate code for parsed MIBs
-        #
+                                mibsToParse.extend(mibInfo.imported)
 
-        for mibname in parsedMibs.copy():
-            fileInfo, mibInfo, mibTree = parsedMibs[mibname]
+                                if fileInfo.name in mibnames:
+                                    if mibInfo.name not in canonicalMibNames:
+                                        canonicalMibNames[mibInfo.name] = []
+                                    canonicalMibNames[mibInfo.name].append(fileInfo.name)
 
-            debug.logger & debug.flagCompiler and debug.logger('compiling %s read from %s' % (mibname, fileInfo.path))
+                                debug.logger & debug.flagCompiler and debug.logger(
+                                    '%s (%s) read from %s, immediate dependencies: %s' % (
+                                        mibInfo.name, mibname, fileInfo.path, ', '.join(mibInfo.imported) or '<none>'))
 
-            platform_info, user_info = self._get_system_info()
+                            break
 
-            comments = [
-                'ASN.1 source %s' % fileInfo.path,
-                'Produced by %s-%s at %s' % (packageName, packageVersion, time.asctime()),
-                'On host %s platform %s version %s by user %s' % (platform_info[1], platform_info[0],
-                                                                  platform_info[2], user_info[0]),
-                'Using Python version %s' % sys.version.split('\n')[0]
-            ]
+                        except error.PySmiError:
+                            errors = [(source, sys.exc_info()[1])]
 
-            try:
-                mibInfo, mibData = self._codegen.genCode(
-                    mibTree,
-                    symbolTableMap,
-                    comments=comments,
-                    dstTemplate=options.get('dstTemplate'),
-                    genTexts=options.get('genTexts'),
-                    textFilter=options.get('textFilter')
-                )
+                            # try the rest of the sources
+                            sourceIdx, fileInfo, parseResult, symtableKey, moreErrors = self._readMib(
+                                mibname, sourceIdx + 1, state, executor
+                            )
 
-                builtMibs[mibname] = fileInfo, mibInfo, mibData
-                del parsedMibs[mibname]
+                            errors.extend(moreErrors)
 
-                debug.logger & debug.flagCompiler and debug.logger(
-                    '%s read from %s and compiled by %s' % (mibname, fileInfo.path, self._writer))
+                    if parseResult is None:
+                        exc = error.PySmiError('MIB source %s not found' % mibname)
+                        exc.mibname = mibname
+                        debug.logger & debug.flagCompiler and debug.logger('no %s found everywhere' % mibname)
 
-            except error.PySmiError:
-                exc_class, exc, tb = sys.exc_info()
-                exc.handler = self._codegen
-                exc.mibname = mibname
-                exc.msg += ' at MIB %s' % mibname
+                        if mibname not in failedMibs:
+                            failedMibs[mibname] = exc
+
+                        if mibname not in processed:
+                            state.setStatus(mibname, statusMissing)
+
+                    if mibname not in parsedMibs:
+                        # this name won't bring in any more symbols
+                        scheduler.settle(mibname)
+
+                    if requestedMibsRead:
+                        for x in self._genReadyMibs(scheduler, state):
+                            yield x
+
+                requestedMibsRead = True
+
+                for x in self._genReadyMibs(scheduler, state):
+                    yield x
+
+        finally:
+            if executor:
+                executor.shutdown()
+
+        debug.logger & debug.flagCompiler and debug.logger(
+            'MIBs analyzed %s, MIBs failed %s' % (len(symbolTableMap), len(failedMibs)))
+
+        #
+        # Generate code for the rest of parsed MIBs (e.g. circular imports)
+        #
 
-                debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (self._codegen, exc))
+        for mibname in tuple(parsedMibs):
+            self._genMib(mibname, state)
 
-                processed[mibname] = statusFailed.setOptions(error=exc)
+            if mibname in builtMibs and state.streaming:
+                self._storeMib(mibname, state)
 
-                failedMibs[mibname] = exc
-                del parsedMibs[mibname]
+            for x in self._reportMibs(state):
+                yield x
 
         debug.logger & debug.flagCompiler and debug.logger(
-            'MIBs built %s, MIBs failed %s' % (len(parsedMibs), len(failedMibs)))
+            'MIBs built %s, MIBs failed %s' % (len(builtMibs), len(failedMibs)))
 
         #
         # Try to borrow pre-compiled MIBs for failed ones
@@ -390,6 +972,10 @@ class MibCompiler(object):
                 continue
 
             for borrower in self._borrowers:
+                if self._notFoundCache and self._notFoundCache.isNotFound(
+                        borrower, mibname, bool(options.get('genTexts'))):
+                    continue
+
                 debug.logger & debug.flagCompiler and debug.logger('trying to borrow %s from %s' % (mibname, borrower))
                 try:
                     fileInfo, fileData = borrower.getData(
@@ -404,6 +990,12 @@ class MibCompiler(object):
                     debug.logger & debug.flagCompiler and debug.logger('%s borrowed with %s' % (mibname, borrower))
                     break
 
+                except (error.PySmiFileNotFoundError, error.PySmiReaderFileNotFoundError):
+                    debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (borrower, sys.exc_info()[1]))
+
+                    if self._notFoundCache and getattr(sys.exc_info()[1], 'missing', False):
+                        self._notFoundCache.setNotFound(borrower, mibname, bool(options.get('genTexts')))
+
                 except error.PySmiError:
                     debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (borrower, sys.exc_info()[1]))
 
@@ -419,50 +1011,24 @@ class MibCompiler(object):
 
             fileInfo, mibInfo, mibData = borrowedMibs[mibname]
 
-            for searcher in self._searchers:
-                try:
-                    searcher.fileExists(mibname, fileInfo.mtime, rebuild=options.get('rebuild'))
-
-                except error.PySmiFileNotFoundError:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'no compiled MIB %s available through %s' % (mibname, searcher))
-                    continue
-
-                except error.PySmiFileNotModifiedError:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'will be using existing compiled MIB %s found by %s' % (mibname, searcher))
-                    del borrowedMibs[mibname]
-                    processed[mibname] = statusUntouched
-                    break
-
-                except error.PySmiError:
-                    exc_class, exc, tb = sys.exc_info()
-                    exc.searcher = searcher
-                    exc.mibname = mibname
-                    exc.msg += ' at MIB %s' % mibname
-
-                    debug.logger & debug.flagCompiler and debug.logger('error from %s: %s' % (searcher, exc))
+            if not self._checkMib(mibname, fileInfo.mtime, state):
+                state.setStatus(mibname, statusUntouched)
 
-                    continue
-            else:
+            elif options.get('noDeps') and mibname not in canonicalMibNames:
                 debug.logger & debug.flagCompiler and debug.logger(
-                    'no suitable compiled MIB %s found anywhere' % mibname)
-
-                if options.get('noDeps') and mibname not in canonicalMibNames:
-                    debug.logger & debug.flagCompiler and debug.logger(
-                        'excluding imported MIB %s from borrowing' % mibname)
-                    processed[mibname] = statusUntouched
+                    'excluding imported MIB %s from borrowing' % mibname)
+                state.setStatus(mibname, statusUntouched)
 
-                else:
-                    debug.logger & debug.flagCompiler and debug.logger('will borrow MIB %s' % mibname)
-                    builtMibs[mibname] = borrowedMibs[mibname]
+            else:
+                debug.logger & debug.flagCompiler and debug.logger('will borrow MIB %s' % mibname)
+                builtMibs[mibname] = borrowedMibs[mibname]
 
-                    processed[mibname] = statusBorrowed.setOptions(
-                        path=fileInfo.path, file=fileInfo.file,
-                        alias=fileInfo.name
-                    )
+                state.setStatus(mibname, statusBorrowed.setOptions(
+                    path=fileInfo.path, file=fileInfo.file,
+                    alias=fileInfo.name
+                ))
 
-                del borrowedMibs[mibname]
+            del borrowedMibs[mibname]
 
         debug.logger & debug.flagCompiler and debug.logger(
             'MIBs built %s, MIBs failed %s' % (len(builtMibs), len(failedMibs)))
@@ -475,9 +1041,14 @@ class MibCompiler(object):
             debug.logger & debug.flagCompiler and debug.logger('failing with problem MIBs %s' % ', '.join(failedMibs))
 
             for mibname in builtMibs:
-                processed[mibname] = statusUnprocessed
+                state.setStatus(mibname, statusUnprocessed)
+
+            self._flushMibs(state)
+
+            for mibname, status in self._reportMibs(state, final=True):
+                yield mibname, status
 
-            return processed
+            return
 
         debug.logger & debug.flagCompiler and debug.logger(
             'proceeding with built MIBs %s, failed MIBs %s' % (', '.join(builtMibs), ', '.join(failedMibs)))
@@ -486,48 +1057,16 @@ class MibCompiler(object):
         # Store compiled MIBs
         #
 
-        for mibname in builtMibs.copy():
-            fileInfo, mibInfo, mibData = builtMibs[mibname]
-
-            try:
-                if options.get('writeMibs', True):
-                    self._writer.putData(
-                        mibname, mibData, dryRun=options.get('dryRun')
-                    )
-
-                debug.logger & debug.flagCompiler and debug.logger('%s stored by %s' % (mibname, self._writer))
-
-                del builtMibs[mibname]
-
-                if mibname not in processed:
-                    processed[mibname] = statusCompiled.setOptions(
-                        path=fileInfo.path,
-                        file=fileInfo.file,
-                        alias=fileInfo.name,
-                        oid=mibInfo.oid,
-                        oids=mibInfo.oids,
-                        identity=mibInfo.identity,
-                        revision=mibInfo.revision,
-                        enterprise=mibInfo.enterprise,
-                        compliance=mibInfo.compliance,
-                    )
-
-            except error.PySmiError:
-                exc_class, exc, tb = sys.exc_info()
-                exc.handler = self._codegen
-                exc.mibname = mibname
-                exc.msg += ' at MIB %s' % mibname
-
-                debug.logger & debug.flagCompiler and debug.logger('error %s from %s' % (exc, self._writer))
+        for mibname in tuple(builtMibs):
+            self._storeMib(mibname, state)
 
-                processed[mibname] = statusFailed.setOptions(error=exc)
-                failedMibs[mibname] = exc
-                del builtMibs[mibname]
+        self._flushMibs(state)
 
         debug.logger & debug.flagCompiler and debug.logger(
             'MIBs modified: %s' % ', '.join([x for x in processed if processed[x] in ('compiled', 'borrowed')]))
 
-        return processed
+        for mibname, status in self._reportMibs(state, final=True):
+            yield mibname, status
 
     def buildIndex(self, processedMibs, **options):
         platform_info, user_info = self._get_system_info()
@@ -549,6 +1088,10 @@ class MibCompiler(object):
                 ),
                 dryRun=options.get('dryRun')
             )
+
+            for exc in self._writer.flush().values():
+                raise exc
+
         except error.PySmiError:
             exc_class, exc, tb = sys.exc_info()
             exc.msg += ' at MIB index %s' % self.indexFile
@@ -562,3 +1105,159 @@ class MibCompiler(object):
                 raise exc.with_traceback(tb)
             else:
                 raise exc
+
+
+class AsyncMibCompiler(MibCompiler):
+    """MIB compiler fetching MIBs concurrently.
+
+    *AsyncMibCompiler* fetches all MIBs known to be needed at once
+    through readers' *getDataAsync* method. MIB imports are figured
+    out from MIB headers right upon fetch, so that imported MIBs can
+    be fetched while MIBs importing them are being parsed. That
+    mostly helps with remote MIB sources where MIB fetching is
+    bound by network latency.
+
+    Readers do not do asynchronous I/O on their own. Their blocking
+    fetches are run by a pool of up to *maxFetches* threads (see
+    :py:meth:`~pysmi.reader.base.AbstractReader.getDataAsync`).
+
+    MIB compilation can be run in the background with *compileAsync*.
+    """
+    prefetchImports = True
+
+    def __init__(self, parser, codegen, writer, maxFetches=16):
+        """Creates an instance of *AsyncMibCompiler* class.
+
+           Args:
+               parser: ASN.1 MIB parser object
+               codegen: MIB transformation object
+               writer: transformed MIB storing object
+
+           Keyword Args:
+               maxFetches (int): maximum number of blocking MIB fetches
+                   to run at once
+        """
+        if asyncio is None:
+            raise error.PySmiError('asyncio is not available')
+
+        MibCompiler.__init__(self, parser, codegen, writer)
+
+        self._maxFetches = maxFetches
+
+    def _fetchMib(self, mibname, loop):
+        """Fetch MIB from the first source that has it.
+
+        Returns asyncio future resolving to index of the source MIB
+        is read from (or *None*), MIB file information, MIB text and a
+        list of (source, error) pairs met on the way.
+        """
+        future = loop.create_future()
+
+        errors = []
+
+        def fetch(sourceIdx):
+            while sourceIdx < len(self._sources):
+                source = self._sources[sourceIdx]
+
+                if not (self._notFoundCache and self._notFoundCache.isNotFound(source, mibname)):
+                    debug.logger & debug.flagCompiler and debug.logger('trying source %s' % source)
+
+                    try:
+                        source.getDataAsync(mibname, loop=loop).add_done_callback(
+                            lambda x: cbFun(x, sourceIdx))
+
+                    except error.PySmiError:
+                        errors.append((source, sys.exc_info()[1]))
+
+                    else:
+                        return
+
+                sourceIdx += 1
+
+            future.set_result((None, None, None, errors))
+
+        def cbFun(fetched, sourceIdx):
+            source = self._sources[sourceIdx]
+
+            exc = fetched.exception()
+
+            if exc is None:
+                fileInfo, fileData = fetched.result()
+                future.set_result((sourceIdx, fileInfo, fileData, errors))
+                return
+
+            if isinstance(exc, error.PySmiReaderFileNotFoundError):
+                debug.logger & debug.flagCompiler and debug.logger('no %s found at %s' % (mibname, source))
+
+                if self._notFoundCache and getattr(exc, 'missing', False):
+                    self._notFoundCache.setNotFound(source, mibname)
+
+            elif isinstance(exc, error.PySmiError):
+                errors.append((source, exc))
+
+            else:
+                future.set_exception(exc)
+                return
+
+            fetch(sourceIdx + 1)
+
+        fetch(0)
+
+        return future
+
+    def _readMibs(self, mibnames, state, executor, hints=None):
+        if not mibnames:
+            return []
+
+        debug.logger & debug.flagCompiler and debug.logger('fetching MIBs %s' % ', '.join(mibnames))
+
+        fetched = state.loop.run_until_complete(
+            asyncio.gather(*[self._fetchMib(x, state.loop) for x in mibnames])
+        )
+
+        readMibs = []
+
+        for mibname, (sourceIdx, fileInfo, fileData, errors) in zip(mibnames, fetched):
+            if sourceIdx is None:
+                readMibs.append((None, None, None, None, errors))
+
+            else:
+                readMibs.append(self._prepareMib(
+                    mibname, sourceIdx, fileInfo, fileData, errors, state, executor, hints))
+
+        return readMibs
+
+    def _compile(self, state):
+        state.loop = asyncio.new_event_loop()
+
+        fetchExecutor = ThreadPoolExecutor(max_workers=self._maxFetches)
+
+        state.loop.set_default_executor(fetchExecutor)
+
+        try:
+            for x in MibCompiler._compile(self, state):
+                yield x
+
+        finally:
+            state.loop.close()
+            state.loop = None
+
+            fetchExecutor.shutdown()
+
+    def compileAsync(self, *mibnames, **options):
+        """Run :py:meth:`compile` in the background.
+
+        Compilation is run by the event loop executor thread.
+
+        Keyword Args:
+            loop: asyncio event loop to run compilation in, default is
+                the running loop
+
+        Returns:
+            asyncio future resolving to the dictionary of MIB module
+            names processed (keys) and *MibStatus* class instances (values)
+        """
+        loop = options.pop('loop', None) or getRunningLoop()
+
+        return loop.run_in_executor(None, partial(self.compile, *mibnames, **options))
+
@@ -18,6 +18,7 @@ flagCodegen = 0x0020
 flagWriter = 0x0040
 flagCompiler = 0x0080
 flagBorrower = 0x0100
+flagCache = 0x0200
 flagAll = 0xffff
 
 flagMap = {
@@ -30,6 +31,7 @@ flagMap = {
     'writer': flagWriter,
     'compiler': flagCompiler,
     'borrower': flagBorrower,
+    'cache': flagCache,
     'all': flagAll
 }
 
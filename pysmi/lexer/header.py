@@ -0,0 +1,133 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import re
+from time import strptime, strftime
+from pysmi.mibinfo import MibInfo
+from pysmi import error
+from pysmi import debug
+
+# comments, quoted strings, identifiers/numbers, punctuation
+TOKEN_RE = re.compile(
+    r'--[^\r\n]*|"[^"]*"|::=|[A-Za-z0-9][-A-Za-z0-9]*|[^\s]', re.DOTALL
+)
+
+
+def _tokenize(data):
+    for match in TOKEN_RE.finditer(data):
+        token = match.group()
+        if not token.startswith('--'):
+            yield token
+
+
+def _expect(tokens, *expected):
+    for token in tokens:
+        if not expected or token in expected:
+            return token
+        break
+
+    raise error.PySmiLexerError(
+        'MIB header is malformed, expected %s' % ' or '.join(expected))
+
+
+def _skipTo(tokens, *terminators):
+    for token in tokens:
+        if token in terminators:
+            return token
+
+
+def _genTime(timeStr):
+    # same conversion as done by code generators
+    timeStr = timeStr.strip('"')
+
+    if len(timeStr) == 11:
+        timeStr = '19' + timeStr
+
+    try:
+        return strftime('%Y-%m-%d %H:%M', strptime(timeStr, '%Y%m%d%H%MZ'))
+
+    except ValueError:
+        return strftime('%Y-%m-%d %H:%M', strptime('197001010000Z', '%Y%m%d%H%MZ'))
+
+
+def scanHeader(data):
+    """Quickly figure out MIB module name, imports and revision.
+
+    Unlike the MIB parser, the scanner does not look into MIB body
+    beyond IMPORTS clause and MODULE-IDENTITY macro. That makes it
+    suitable for building MIB dependency graph or for telling MIB
+    revision, but not for validating MIB. When MIB text holds many
+    modules, only the first one is considered.
+
+    Args:
+        data (str): ASN.1 MIB text
+
+    Returns:
+        :py:class:`~pysmi.mibinfo.MibInfo` object carrying MIB module
+        *name*, *imported* MIB names as they appear in the IMPORTS
+        clause and the latest *revision* (or *None*)
+
+    Raises:
+        PySmiLexerError: if MIB module header can't be figured out
+    """
+    tokens = _tokenize(data)
+
+    name = _expect(tokens)
+
+    if _expect(tokens, '{', 'DEFINITIONS') == '{':
+        # module OID
+        _skipTo(tokens, '}')
+        _expect(tokens, 'DEFINITIONS')
+
+    _expect(tokens, '::=')
+    _expect(tokens, 'BEGIN')
+
+    imported = []
+    revision = None
+
+    token = _expect(tokens)
+
+    if token == 'EXPORTS':
+        _skipTo(tokens, ';')
+        token = _expect(tokens)
+
+    if token == 'IMPORTS':
+        for token in tokens:
+            if token == ';':
+                break
+
+            if token == 'FROM':
+                module = _expect(tokens)
+                if module not in imported:
+                    imported.append(module)
+
+        token = _expect(tokens)
+
+    # MODULE-IDENTITY is supposed to follow IMPORTS, but may be
+    # preceded by some SMIv1 declarations
+    while token and token != 'END':
+        if token == 'MODULE-IDENTITY':
+            token = _expect(tokens)
+
+            if token == 'MACRO':
+                _skipTo(tokens, 'END')
+
+            else:
+                token = _skipTo(tokens, 'REVISION', '::=')
+                if token == 'REVISION':
+                    revision = _genTime(_expect(tokens))
+                break
+
+        elif token == 'MACRO':
+            _skipTo(tokens, 'END')
+
+        token = _skipTo(tokens, 'MACRO', 'MODULE-IDENTITY', 'END')
+
+    debug.logger & debug.flagLexer and debug.logger(
+        'scanned MIB %s header, revision %s, imported MIB(s) %s' % (
+            name, revision, ', '.join(imported) or '<none>'))
+
+    return MibInfo(name=name, imported=tuple(imported), revision=revision)
@@ -81,6 +81,10 @@ class SmiV2Lexer(AbstractLexer):
 
     literals = '[]{}():;,-.|'
 
+    # clauses whose text does not make it to the output unless
+    # MIB texts are generated
+    skippableTexts = ('DESCRIPTION', 'REFERENCE', 'CONTACT_INFO', 'ORGANIZATION')
+
     t_DOT_DOT = r'\.\.'
     t_COLON_COLON_EQUAL = r'::='
 
@@ -114,6 +118,10 @@ class SmiV2Lexer(AbstractLexer):
                                  debuglog=debuglogger,
                                  errorlog=logger)
 
+        # the parser may ask for not building useless texts
+        self.lexer.skipTexts = False
+        self.lexer.textClause = None
+
     def t_newline(self, t):
         r'\r\n|\n|\r'
         t.lexer.lineno += 1
@@ -201,6 +209,13 @@ class SmiV2Lexer(AbstractLexer):
 
         t.type = self.reserved.get(t.value, 'UPPERCASE_IDENTIFIER')
 
+        if t.lexer.skipTexts:
+            # revision descriptions are always reported
+            if t.type == 'DESCRIPTION' and t.lexer.textClause == 'REVISION':
+                t.lexer.textClause = None
+            else:
+                t.lexer.textClause = t.type
+
         return t
 
     def t_LOWERCASE_IDENTIFIER(self, t):
@@ -254,8 +269,29 @@ class SmiV2Lexer(AbstractLexer):
         return t
 
     def t_QUOTED_STRING(self, t):
-        r'\"[^\"]*\"'
-        t.lexer.lineno += len(re.findall(r'\r\n|\n|\r', t.value))
+        r'\"'
+        lexer = t.lexer
+
+        # look up closing quote without copying potentially long text
+        end = lexer.lexdata.find('"', lexer.lexpos)
+        if end < 0:
+            raise error.PySmiLexerError("Unterminated quoted string", lineno=t.lineno)
+
+        start = t.lexpos
+
+        lexer.lineno += (lexer.lexdata.count('\n', start, end) +
+                         lexer.lexdata.count('\r', start, end) -
+                         lexer.lexdata.count('\r\n', start, end))
+
+        lexer.lexpos = end + 1
+
+        if lexer.skipTexts and lexer.textClause in self.skippableTexts:
+            lexer.textClause = None
+            t.value = '""'
+
+        else:
+            t.value = lexer.lexdata[start:end + 1]
+
         return t
 
     def t_error(self, t):
@@ -347,7 +383,16 @@ relaxedGrammar = {
 }
 
 
+# specialized lexer classes by grammar options
+lexerClasses = {}
+
+
 def lexerFactory(**grammarOptions):
+    key = tuple(sorted(grammarOptions.items()))
+
+    if key in lexerClasses:
+        return lexerClasses[key]
+
     classAttr = {}
 
     for option in grammarOptions:
@@ -361,4 +406,4 @@ def lexerFactory(**grammarOptions):
                 else:
                     classAttr[func.func_name] = func()
 
-    return type('SmiLexer', (SmiV2Lexer,), classAttr)
+    return lexerClasses.setdefault(key, type('SmiLexer', (SmiV2Lexer,), classAttr))
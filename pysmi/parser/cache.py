@@ -0,0 +1,76 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import marshal
+from pysmi.parser.base import AbstractParser
+from pysmi.cache import hashKey
+from pysmi import __version__ as packageVersion
+from pysmi import debug
+
+
+class CachingParser(AbstractParser):
+    """Reuse previously produced MIB ASTs instead of parsing MIBs again.
+
+    Wraps a parser object produced by *parserFactory* so that ASTs it
+    returns get stored in a cache keyed by the hash of MIB text
+    and parser grammar. On a cache hit, the parser is not called at all.
+    """
+
+    def __init__(self, parser, cache):
+        """Create an instance of *CachingParser* wrapping a parser.
+
+           Args:
+               parser: parser object to produce ASTs of uncached MIBs
+               cache: cache object (e.g. :py:class:`pysmi.cache.DirectoryCache`
+                      or :py:class:`pysmi.cache.FileCache`) to keep ASTs at
+        """
+        self._parser = parser
+        self._cache = cache
+
+        # ASTs are marshal'ed which is Python version specific
+        self._keyPrefix = (
+            packageVersion,
+            '%s.%s' % sys.version_info[:2],
+            str(marshal.version),
+            repr(sorted(self.grammarOptions.items())),
+            str(getattr(parser, '_startSym', ''))
+        )
+
+    def __str__(self):
+        return '%s{%s, %s}' % (self.__class__.__name__, self._parser, self._cache)
+
+    @property
+    def grammarOptions(self):
+        return getattr(self._parser, 'grammarOptions', {})
+
+    def reset(self):
+        self._parser.reset()
+
+    def parse(self, data, **kwargs):
+        # parsing options (e.g. genTexts) affect AST
+        key = hashKey(*self._keyPrefix + (repr(sorted(kwargs.items())), data))
+
+        value = self._cache.get(key)
+
+        if value is not None:
+            try:
+                ast = marshal.loads(value)
+
+            except Exception:
+                debug.logger & debug.flagParser and debug.logger(
+                    'broken AST taken from %s: %s' % (self._cache, sys.exc_info()[1]))
+
+            else:
+                debug.logger & debug.flagParser and debug.logger(
+                    'AST of %s characters source MIB taken from %s' % (len(data), self._cache))
+                return ast
+
+        ast = self._parser.parse(data, **kwargs)
+
+        self._cache.put(key, marshal.dumps(ast))
+
+        return ast
@@ -0,0 +1,92 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import threading
+from pysmi.parser.base import AbstractParser
+from pysmi.parser.smi import parserFactory
+from pysmi import debug
+
+
+class ParserPool(AbstractParser):
+    """Keep ready to use parser objects of the same grammar.
+
+    Building parser object involves Ply lexer and parser tables
+    set up. To avoid doing that over and over again, parsers can
+    be checked out from the pool and checked back in once done.
+
+    Each checked out parser is owned by the caller exclusively, so
+    the pool can be shared by many threads. The pool itself can be
+    used as a parser object.
+    """
+
+    def __init__(self, maxIdle=8, **grammarOptions):
+        """Create an instance of *ParserPool*.
+
+           Keyword Args:
+               maxIdle (int): number of unused parser objects to keep
+               grammarOptions: grammar relaxation options to pass
+                   to :py:func:`~pysmi.parser.smi.parserFactory`
+        """
+        self._parserClass = parserFactory(**grammarOptions)
+        self._maxIdle = maxIdle
+        self._idleParsers = []
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return '%s{%s idle}' % (self.__class__.__name__, len(self._idleParsers))
+
+    def __getstate__(self):
+        # idle parsers are not worth shipping to other processes
+        return self._parserClass.grammarOptions, self._maxIdle
+
+    def __setstate__(self, state):
+        grammarOptions, maxIdle = state
+        self.__init__(maxIdle, **grammarOptions)
+
+    @property
+    def grammarOptions(self):
+        return self._parserClass.grammarOptions
+
+    def checkout(self):
+        """Take parser object out of the pool, create one if none is idle"""
+        self._lock.acquire()
+
+        try:
+            if self._idleParsers:
+                return self._idleParsers.pop()
+
+        finally:
+            self._lock.release()
+
+        debug.logger & debug.flagParser and debug.logger('%s: creating new parser' % self)
+
+        return self._parserClass()
+
+    def checkin(self, parser):
+        """Return previously checked out parser object to the pool"""
+        parser.reset()
+
+        self._lock.acquire()
+
+        try:
+            if len(self._idleParsers) < self._maxIdle:
+                self._idleParsers.append(parser)
+
+        finally:
+            self._lock.release()
+
+    def reset(self):
+        pass
+
+    def parse(self, data, **kwargs):
+        """Parse MIB text with one of the pooled parsers"""
+        parser = self.checkout()
+
+        try:
+            return parser.parse(data, **kwargs)
+
+        finally:
+            self.checkin(parser)
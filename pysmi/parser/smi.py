@@ -6,9 +6,11 @@
 #
 import os
 import sys
+import copy
 import ply.yacc as yacc
 from pysmi.lexer.smi import lexerFactory
 from pysmi.parser.base import AbstractParser
+from pysmi.parser.dialect import smiV2, smiV1, smiV1Relaxed
 from pysmi import error
 from pysmi import debug
 
@@ -18,8 +20,15 @@ YACC_VERSION = [int(x) for x in yacc.__version__.split('.')]
 # noinspection PyMethodMayBeStatic,PyIncorrectDocstring
 class SmiV2Parser(AbstractParser):
     defaultLexer = lexerFactory()
+    grammarOptions = {}
+
+    # pre-built parser tables module, if any
+    tabModule = None
 
     def __init__(self, startSym='mibFile', tempdir=''):
+        self._startSym = startSym
+        self._tempdir = tempdir
+
         if tempdir:
             tempdir = os.path.join(tempdir, startSym)
             try:
@@ -50,25 +59,57 @@ class SmiV2Parser(AbstractParser):
             else:
                 debuglogger = None
 
-            self.parser = yacc.yacc(module=self,
-                                    start=startSym,
-                                    write_tables=bool(tempdir),
-                                    debug=False,
-                                    outputdir=tempdir,
-                                    debuglog=debuglogger,
-                                    errorlog=logger)
+            if self.tabModule and startSym == 'mibFile':
+                # Ply rebuilds tables if packaged ones do not match grammar
+                self.parser = yacc.yacc(module=self,
+                                        start=startSym,
+                                        tabmodule=self.tabModule,
+                                        write_tables=False,
+                                        debug=False,
+                                        debuglog=debuglogger,
+                                        errorlog=logger)
+
+            else:
+                self.parser = yacc.yacc(module=self,
+                                        start=startSym,
+                                        write_tables=bool(tempdir),
+                                        debug=False,
+                                        outputdir=tempdir,
+                                        debuglog=debuglogger,
+                                        errorlog=logger)
+
+    def __reduce__(self):
+        # specialized parser classes are created at run time, so they
+        # can't be pickled by reference -- rebuild them on unpickling
+        key = tuple(sorted(self.grammarOptions.items()))
+
+        if parserClasses.get(key) is self.__class__:
+            return restoreParser, (self.grammarOptions, self._startSym, self._tempdir)
+
+        # user subclasses are pickled by reference
+        return self.__class__, (self._startSym, self._tempdir)
 
     def reset(self):
-        # Ply requires lexer reinitialization for (at least) resetting lineno
-        self.lexer.reset()
+        # each parse() call runs on its own copy of Ply lexer and
+        # parser state, nothing is left over to reset
+        pass
 
     def parse(self, data, **kwargs):
         debug.logger & debug.flagParser and debug.logger(
             'source MIB size is %s characters, first 50 characters are "%s..."' % (len(data), data[:50]))
 
-        ast = self.parser.parse(data, lexer=self.lexer.lexer)
+        # Ply keeps parsing state in lexer and parser objects, cloning
+        # them makes parsing re-entrant and thread-safe
+        lexer = self.lexer.lexer.clone()
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        lexer.lineno = 1
 
-        self.reset()
+        # DESCRIPTION, REFERENCE etc. texts become empty strings
+        lexer.skipTexts = not kwargs.get('genTexts', True)
+        lexer.textClause = None
+
+        ast = copy.copy(self.parser).parse(data, lexer=lexer)
 
         if ast and ast[0] == 'mibFile' and ast[1]:  # mibfile is not empty
             return ast[1]
@@ -1403,6 +1444,28 @@ relaxedGrammar = {
     'noCells': [NoCells.p_CreationPart]
 }
 
+# specialized parser classes by grammar options
+parserClasses = {}
+
+# Pre-built parser tables shipped with pysmi
+parserTables = (
+    (smiV2, 'pysmi.parser.tables.smiv2tab'),
+    (smiV1, 'pysmi.parser.tables.smiv1tab'),
+    (smiV1Relaxed, 'pysmi.parser.tables.smiv1relaxedtab')
+)
+
+
+def getTabModule(grammarOptions):
+    """Return the name of pre-built parser tables module for given grammar.
+
+       Returns *None* if no tables are shipped for this grammar.
+    """
+    enabledOptions = sorted([x for x in grammarOptions if grammarOptions[x]])
+
+    for dialect, tabModule in parserTables:
+        if enabledOptions == sorted([x for x in dialect if dialect[x]]):
+            return tabModule
+
 
 def parserFactory(**grammarOptions):
     """Factory function producing custom specializations of base *SmiV2Parser*
@@ -1413,7 +1476,8 @@ def parserFactory(**grammarOptions):
                            enabling particular set of SMIv2 grammar relaxations.
 
        Returns:
-           Specialized copy of *SmiV2Parser* class.
+           Specialized copy of *SmiV2Parser* class. The same class is
+           returned for the same set of grammar options.
 
        Notes:
            The following SMIv2 grammar relaxation parameters are defined:
@@ -1434,6 +1498,11 @@ def parserFactory(**grammarOptions):
        >>> SmiV1Parser = smi.parserFactory(supportSmiV1Keywords=True, supportIndex=True)
 
     """
+    key = tuple(sorted(grammarOptions.items()))
+
+    if key in parserClasses:
+        return parserClasses[key]
+
     classAttr = {}
 
     for option in grammarOptions:
@@ -1448,5 +1517,65 @@ def parserFactory(**grammarOptions):
                     classAttr[func.func_name] = func
 
     classAttr['defaultLexer'] = lexerFactory(**grammarOptions)
+    classAttr['grammarOptions'] = dict(grammarOptions)
+    classAttr['tabModule'] = getTabModule(grammarOptions)
+
+    # concurrent callers should all end up with the same class
+    return parserClasses.setdefault(key, type('SmiParser', (SmiV2Parser,), classAttr))
+
+
+def restoreParser(grammarOptions, startSym='mibFile', tempdir=''):
+    """Re-create parser object from its grammar options.
+
+       Used for unpickling parser objects produced by *parserFactory*
+       e.g. when handing them over to a worker process.
+    """
+    return parserFactory(**grammarOptions)(startSym=startSym, tempdir=tempdir)
+
+
+def writeParserTables(outputdir):
+    """Build parser tables for all pre-configured SMI dialects.
+
+       Tables are written into *outputdir* as Python modules unless
+       they are up to date already.
+    """
+    for grammarOptions, tabModule in parserTables:
+        debug.logger & debug.flagParser and debug.logger('building parser tables %s' % tabModule)
+
+        yacc.yacc(module=parserFactory(**grammarOptions)(),
+                  start='mibFile',
+                  tabmodule=tabModule,
+                  outputdir=outputdir,
+                  debug=False,
+                  errorlog=yacc.NullLogger())
+
+
+def checkParserTables():
+    """Figure out which of pre-built parser tables do not match the grammar.
+
+       Returns:
+           A list of names of stale (or missing) parser tables modules
+    """
+    staleModules = []
+
+    for grammarOptions, tabModule in parserTables:
+        parser = parserFactory(**grammarOptions)()
+
+        pdict = dict([(x, getattr(parser, x)) for x in dir(parser)])
+        pdict['start'] = 'mibFile'
+
+        pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+        pinfo.get_all()
+
+        try:
+            module = __import__(tabModule, {}, {}, ['_lr_signature'])
+
+        except ImportError:
+            staleModules.append(tabModule)
+            continue
+
+        if (getattr(module, '_tabversion', None) != yacc.__tabversion__ or
+                getattr(module, '_lr_signature', None) != pinfo.signature()):
+            staleModules.append(tabModule)
 
-    return type('SmiParser', (SmiV2Parser,), classAttr)
+    return staleModules
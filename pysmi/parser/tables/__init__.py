@@ -0,0 +1,8 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+# Pre-built parser tables, see pysmi.parser.smi.writeParserTables()
+#
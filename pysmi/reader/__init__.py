@@ -8,5 +8,7 @@ from pysmi.reader.callback import CallbackReader
 from pysmi.reader.ftpclient import FtpReader
 from pysmi.reader.httpclient import HttpReader
 from pysmi.reader.zipreader import ZipReader
+from pysmi.reader.tarreader import TarReader
 from pysmi.reader.localfile import FileReader
+from pysmi.reader.cache import CachingReader
 from pysmi.reader.url import getReadersFromUrls
@@ -5,6 +5,16 @@
 # License: http://snmplabs.com/pysmi/license.html
 #
 import os
+from functools import partial
+
+try:
+    import asyncio
+
+except ImportError:
+    asyncio = None
+
+from pysmi.compat import getRunningLoop
+from pysmi import error
 
 
 class AbstractReader(object):
@@ -50,3 +60,26 @@ class AbstractReader(object):
 
     def getData(self, filename, **options):
         raise NotImplementedError()
+
+    def getDataAsync(self, mibname, loop=None, **options):
+        """Fetch MIB asynchronously.
+
+        Blocking *getData* is run by the event loop executor thread,
+        readers do not do asynchronous I/O on their own.
+
+        Args:
+            mibname (str): MIB name to fetch
+
+        Keyword Args:
+            loop: asyncio event loop to run fetch in, default is the running loop
+
+        Returns:
+            asyncio future resolving to a pair of
+            :py:class:`~pysmi.mibinfo.MibInfo` object and MIB text
+        """
+        if asyncio is None:
+            raise error.PySmiError('asyncio is not available')
+
+        loop = loop or getRunningLoop()
+
+        return loop.run_in_executor(None, partial(self.getData, mibname, **options))
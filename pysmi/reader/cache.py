@@ -0,0 +1,112 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+from pysmi.reader.base import AbstractReader
+from pysmi.cache import hashKey
+from pysmi import error
+from pysmi import debug
+
+
+class CachingReader(AbstractReader):
+    """Keep local copies of MIBs fetched from remote sources.
+
+    Wraps a reader object (e.g. :py:class:`~pysmi.reader.httpclient.HttpReader`
+    or :py:class:`~pysmi.reader.ftpclient.FtpReader`) so that MIB texts it
+    returns get stored in a cache along with their validators (e.g.
+    *ETag* or modification time). Next time the same MIB is requested,
+    the local copy is revalidated with the remote source and served
+    unless MIB has changed.
+
+    If the remote source can't be reached, the local copy is served
+    as it is.
+    """
+
+    def __init__(self, reader, cache, offline=False):
+        """Create an instance of *CachingReader* wrapping a reader.
+
+           Args:
+               reader: reader object to fetch uncached MIBs with
+               cache: cache object (e.g. :py:class:`pysmi.cache.DirectoryCache`)
+                   to keep MIB texts at
+
+           Keyword Args:
+               offline (bool): serve MIBs from cache only, never
+                   calling the wrapped reader
+        """
+        self._reader = reader
+        self._cache = cache
+        self._offline = offline
+
+    def __str__(self):
+        return '%s{%s, %s}' % (self.__class__.__name__, self._reader, self._cache)
+
+    def setOptions(self, **kwargs):
+        self._reader.setOptions(**kwargs)
+        return self
+
+    def getData(self, mibname, **options):
+        key = hashKey(str(self._reader), mibname, repr(sorted(options.items())))
+
+        value = self._cache.get(key)
+
+        if value is not None:
+            mibinfo, data = value
+
+            if self._offline:
+                debug.logger & debug.flagReader and debug.logger(
+                    'MIB %s taken from %s' % (mibname, self._cache))
+                return mibinfo, data
+
+            getDataIfModified = getattr(self._reader, 'getDataIfModified', None)
+
+            try:
+                if getDataIfModified:
+                    value = getDataIfModified(mibinfo, **options)
+
+                else:
+                    value = self._reader.getData(mibname, **options)
+
+            except error.PySmiReaderFileNotModifiedError:
+                debug.logger & debug.flagReader and debug.logger(
+                    'MIB %s not modified, taken from %s' % (mibname, self._cache))
+                return mibinfo, data
+
+            except error.PySmiReaderFileNotFoundError:
+                # only go for full fetch once MIB is surely gone
+                if not getDataIfModified or not getattr(sys.exc_info()[1], 'missing', False):
+                    debug.logger & debug.flagReader and debug.logger(
+                        'MIB %s fetch failed: %s, taken from %s' % (mibname, sys.exc_info()[1], self._cache))
+                    return mibinfo, data
+
+                debug.logger & debug.flagReader and debug.logger(
+                    'MIB %s revalidation failed: %s' % (mibname, sys.exc_info()[1]))
+
+                # MIB might have moved
+                try:
+                    value = self._reader.getData(mibname, **options)
+
+                except error.PySmiError:
+                    debug.logger & debug.flagReader and debug.logger(
+                        'MIB %s fetch failed: %s, taken from %s' % (mibname, sys.exc_info()[1], self._cache))
+                    return mibinfo, data
+
+            except error.PySmiError:
+                # remote source is unreachable
+                debug.logger & debug.flagReader and debug.logger(
+                    'MIB %s revalidation failed: %s, taken from %s' % (mibname, sys.exc_info()[1], self._cache))
+                return mibinfo, data
+
+        elif self._offline:
+            raise error.PySmiReaderFileNotFoundError(
+                'source MIB %s not found in %s' % (mibname, self._cache), reader=self)
+
+        else:
+            value = self._reader.getData(mibname, **options)
+
+        self._cache.put(key, value)
+
+        return value
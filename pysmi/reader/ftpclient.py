@@ -6,6 +6,9 @@
 #
 import sys
 import time
+import socket
+import calendar
+import threading
 import ftplib  # nosec
 from pysmi.reader.base import AbstractReader
 from pysmi.mibinfo import MibInfo
@@ -18,7 +21,16 @@ class FtpReader(AbstractReader):
     """Fetch ASN.1 MIB text by name from FTP server.
        *FtpReader* class instance tries to download ASN.1 MIB files
        by name and return their contents to caller.
+
+       FTP connection is kept open between MIB fetches and re-established
+       if server drops it. Unless @mib@ placeholder is not the last
+       component of the location, remote directory gets listed once
+       so that only existing files are fetched.
     """
+    # errors after which FTP connection is not worth reusing
+    connectionErrors = (EOFError, IOError, OSError, socket.error,
+                        ftplib.error_temp, ftplib.error_proto,
+                        ftplib.error_reply)
 
     def __init__(  # nosec
             self, host, locationTemplate, timeout=5,
@@ -49,10 +61,21 @@ class FtpReader(AbstractReader):
         if '@mib@' not in locationTemplate:
             raise error.PySmiError('@mib@ placeholder not specified in location at %s' % self)
 
+        self._conn = None
+        self._lock = threading.Lock()
+        self._dirIndex = None  # k, v = lower-cased file name, file names
+        self._dirIndexLoaded = False
+        self._mtimes = {}  # file modification times as listed by server
+
     def __str__(self):
         return '%s{"ftp://%s%s"}' % (self.__class__.__name__, self._host, self._locationTemplate)
 
-    def getData(self, mibname, **options):
+    @staticmethod
+    def _parseTime(timeStr):
+        # FTP timestamps are in UTC, possibly with fraction of a second
+        return calendar.timegm(time.strptime(timeStr[:14], '%Y%m%d%H%M%S'))
+
+    def _connect(self):
         if self._ssl:
             conn = ftplib.FTP_TLS()  # nosec
         else:
@@ -72,53 +95,235 @@ class FtpReader(AbstractReader):
             conn.close()
             raise error.PySmiReaderFileNotFoundError('failed to log in to FTP server %s:%s as %s/%s: %s' % (self._host, self._port, self._user, self._password, sys.exc_info()[1]), reader=self)
 
-        mibname = decode(mibname)
+        debug.logger & debug.flagReader and debug.logger(
+            'connected to FTP server %s:%s' % (self._host, self._port))
 
-        debug.logger & debug.flagReader and debug.logger('looking for MIB %s' % mibname)
+        return conn
 
-        for mibalias, mibfile in self.getMibVariants(mibname, **options):
-            location = self._locationTemplate.replace('@mib@', mibfile)
+    def close(self):
+        """Close FTP connection, if any"""
+        conn, self._conn = self._conn, None
+
+        if conn is not None:
+            try:
+                conn.close()
+
+            except ftplib.all_errors:
+                pass
+
+    def _execute(self, command, *args):
+        """Run command against FTP connection, reconnect once if it fails"""
+        if self._conn is not None:
+            try:
+                return command(self._conn, *args)
+
+            except self.connectionErrors:
+                debug.logger & debug.flagReader and debug.logger(
+                    'FTP server %s:%s connection failure: %s, reconnecting' % (
+                        self._host, self._port, sys.exc_info()[1]))
+
+                self.close()
+
+        self._conn = self._connect()
+
+        return command(self._conn, *args)
+
+    def _listDirectory(self, conn, location):
+        self._mtimes.clear()
+
+        try:
+            filenames = []
+
+            for filename, facts in conn.mlsd(location, facts=['type', 'modify']):
+                if facts.get('type', 'file') != 'file':
+                    continue
+
+                filenames.append(filename)
 
-            mtime = time.time()
+                if 'modify' in facts:
+                    self._mtimes[filename] = self._parseTime(facts['modify'])
 
+            return filenames
+
+        except (AttributeError, ftplib.error_perm):
             debug.logger & debug.flagReader and debug.logger(
-                'trying to fetch MIB %s from %s:%s' % (location, self._host, self._port))
+                'server %s:%s does not support MLSD command, listing with NLST' % (self._host, self._port))
+
+        # some servers report full paths
+        return [x.split('/')[-1] for x in conn.nlst(*location and [location] or [])]
 
-            data = []
+    def getDirIndex(self):
+        """List remote directory the MIBs are fetched from.
+
+        Directory is listed only once.
+
+        Returns:
+            a dictionary of lower-cased file names (keys) and lists
+            of actual file names (values) or *None* if remote
+            directory can't be listed
+        """
+        if not self._dirIndexLoaded:
+            location, _, placeholder = self._locationTemplate.rpartition('/')
+
+            if placeholder != '@mib@' or '@mib@' in location:
+                self._dirIndexLoaded = True
+                return
+
+            if not location and self._locationTemplate.startswith('/'):
+                location = '/'
 
             try:
-                try:
-                    response = conn.sendcmd('MDTM %s' % location)
+                filenames = self._execute(self._listDirectory, location)
+
+            except ftplib.all_errors:
+                debug.logger & debug.flagReader and debug.logger(
+                    'failed to list %s at %s:%s: %s' % (location, self._host, self._port, sys.exc_info()[1]))
+                self._dirIndexLoaded = True
+                return
 
-                except ftplib.all_errors:
-                    debug.logger & debug.flagReader and debug.logger(
-                        'server %s:%s does not support MDTM command, fetching file %s' % (
-                        self._host, self._port, location))
+            self._dirIndexLoaded = True
 
-                else:
-                    debug.logger & debug.flagReader and debug.logger(
-                        'server %s:%s MDTM response is %s' % (self._host, self._port, response))
+            self._dirIndex = {}
 
-                    if response[:3] == 213:
-                        mtime = time.mktime(time.strptime(response[4:], "%Y%m%d%H%M%S"))
+            for filename in filenames:
+                filename = decode(filename)
+                self._dirIndex.setdefault(filename.lower(), []).append(filename)
 
-                debug.logger & debug.flagReader and debug.logger('fetching source MIB %s, mtime %s' % (location, time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(mtime))))
+            debug.logger & debug.flagReader and debug.logger(
+                'listed %s file(s) at %s:%s%s' % (len(filenames), self._host, self._port, location))
+
+        return self._dirIndex
+
+    def _getMtime(self, conn, location):
+        try:
+            response = conn.sendcmd('MDTM %s' % location)
+
+        except ftplib.error_perm:
+            debug.logger & debug.flagReader and debug.logger(
+                'server %s:%s does not support MDTM command, fetching file %s' % (
+                    self._host, self._port, location))
+            return
 
-                conn.retrlines('RETR %s' % location, lambda x, y=data: y.append(x))
+        debug.logger & debug.flagReader and debug.logger(
+            'server %s:%s MDTM response is %s' % (self._host, self._port, response))
+
+        if response[:3] == '213':
+            return self._parseTime(response[4:].strip())
+
+    @staticmethod
+    def _retrieve(conn, location):
+        data = []
+
+        conn.retrlines('RETR %s' % location, data.append)
+
+        return data
+
+    def getData(self, mibname, **options):
+        self._lock.acquire()
+
+        try:
+            return self._getData(decode(mibname), **options)
+
+        finally:
+            self._lock.release()
+
+    def _getData(self, mibname, **options):
+        debug.logger & debug.flagReader and debug.logger('looking for MIB %s' % mibname)
+
+        dirIndex = self.getDirIndex()
+
+        tried = set()
+
+        missing = True
+
+        for mibalias, mibfile in self.getMibVariants(mibname, **options):
+            if dirIndex is not None:
+                # file names match case-insensitively, exact match wins
+                filenames = dirIndex.get(mibfile.lower())
+
+                if not filenames:
+                    continue
+
+                if mibfile not in filenames:
+                    mibfile = filenames[0]
+
+            if mibfile in tried:
+                continue
+
+            tried.add(mibfile)
+
+            location = self._locationTemplate.replace('@mib@', mibfile)
+
+            debug.logger & debug.flagReader and debug.logger(
+                'trying to fetch MIB %s from %s:%s' % (location, self._host, self._port))
+
+            try:
+                lastModified = self._mtimes.get(mibfile)
+
+                if lastModified is None:
+                    lastModified = self._execute(self._getMtime, location)
+
+                return self._fetchMib(location, lastModified, file=mibfile, name=mibalias)
 
             except ftplib.all_errors:
+                exc = sys.exc_info()[1]
+
                 debug.logger & debug.flagReader and debug.logger(
-                    'failed to fetch MIB %s from %s:%s: %s' % (location, self._host, self._port, sys.exc_info()[1]))
+                    'failed to fetch MIB %s from %s:%s: %s' % (location, self._host, self._port, exc))
+
+                # only "file unavailable" reply tells MIB does not exist
+                if not str(exc).startswith('550'):
+                    missing = False
+
                 continue
 
-            data = decode('\n'.join(data))
+        raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self, missing=missing)
 
-            debug.logger & debug.flagReader and debug.logger('fetched %s bytes in %s' % (len(data), location))
+    def _fetchMib(self, location, lastModified, **kwargs):
+        mtime = lastModified or time.time()
 
-            conn.close()
+        debug.logger & debug.flagReader and debug.logger('fetching source MIB %s, mtime %s' % (location, time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(mtime))))
+
+        data = decode('\n'.join(self._execute(self._retrieve, location)))
+
+        debug.logger & debug.flagReader and debug.logger('fetched %s bytes in %s' % (len(data), location))
+
+        return MibInfo(path='ftp://%s%s' % (self._host, location), mtime=mtime,
+                       lastModified=lastModified, **kwargs), data
+
+    def getDataIfModified(self, mibinfo, **options):
+        """Fetch MIB again unless it has not changed since last fetch.
 
-            return MibInfo(path='ftp://%s%s' % (self._host, location), file=mibfile, name=mibalias, mtime=mtime), data
+        MIB is revalidated by comparing its modification time reported
+        by MDTM command with the one seen on original fetch.
 
-        conn.close()
+        Args:
+            mibinfo: :py:class:`~pysmi.mibinfo.MibInfo` object returned
+                along with MIB text by this reader before
+
+        Returns:
+            a tuple of :py:class:`~pysmi.mibinfo.MibInfo` object and
+            MIB text
+
+        Raises:
+            PySmiReaderFileNotModifiedError: if MIB has not changed
+            PySmiReaderFileNotFoundError: if MIB can't be fetched
+        """
+        location = mibinfo.path[len('ftp://%s' % self._host):]
+
+        self._lock.acquire()
+
+        try:
+            lastModified = self._execute(self._getMtime, location)
+
+            if lastModified and lastModified == getattr(mibinfo, 'lastModified', None):
+                raise error.PySmiReaderFileNotModifiedError('source MIB %s not modified' % mibinfo.path, reader=self)
+
+            return self._fetchMib(location, lastModified, file=mibinfo.file, name=mibinfo.name)
+
+        except ftplib.all_errors:
+            raise error.PySmiReaderFileNotFoundError(
+                'failed to fetch MIB %s from %s:%s: %s' % (location, self._host, self._port, sys.exc_info()[1]), reader=self)
 
-        raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self)
+        finally:
+            self._lock.release()
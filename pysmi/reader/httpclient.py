@@ -4,21 +4,33 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysmi/license.html
 #
+import base64
 import socket
 import sys
 import time
+import threading
+
+try:
+    import asyncio
+
+except ImportError:
+    asyncio = None
 
 try:
     # noinspection PyUnresolvedReferences
-    from urllib2 import Request, urlopen
+    import httplib
+    import urlparse
+    from urllib import getproxies, proxy_bypass
+
 except ImportError:
     # noinspection PyUnresolvedReferences
-    from urllib.request import Request
-    from urllib.request import urlopen
+    from http import client as httplib
+    from urllib import parse as urlparse
+    from urllib.request import getproxies, proxy_bypass
 
 from pysmi.reader.base import AbstractReader
 from pysmi.mibinfo import MibInfo
-from pysmi.compat import decode
+from pysmi.compat import encode, decode, getRunningLoop
 from pysmi import __version__ as pysmi_version
 from pysmi import error
 from pysmi import debug
@@ -29,15 +41,21 @@ class HttpReader(AbstractReader):
 
     *HttpReader* class instance tries to download ASN.1 MIB files
     by name and return their contents to caller.
+
+    HTTP/1.1 connections are kept open and reused for subsequent
+    requests to the same web server.
     """
     MIB_MAGIC = '@mib@'
+    maxIdle = 4  # idle connections to keep per web server
+    maxRedirects = 5
+    missingStatuses = (404, 410)  # HTTP responses telling MIB does not exist
 
     def __init__(self, host, port, locationTemplate, timeout=5, ssl=False):
         """Create an instance of *HttpReader* bound to specific URL.
 
            Note:
                The `http_proxy` and `https_proxy` environment variables are
-               respected by the underlying `urllib` stdlib module.
+               respected.
 
            Args:
                host (str): domain name or IP address of web server
@@ -53,54 +71,345 @@ class HttpReader(AbstractReader):
         self._url = '%s://%s:%d%s' % (ssl and 'https' or 'http',
                                       host, port, decode(locationTemplate))
 
-        socket.setdefaulttimeout(timeout)
+        self._timeout = timeout
         self._user_agent = 'pysmi-%s; python-%s.%s.%s; %s' % (
             pysmi_version, sys.version_info[0], sys.version_info[1],
             sys.version_info[2], sys.platform
         )
+        self._idleConns = {}  # k, v = (scheme, netloc), connections
+        self._lock = threading.Lock()
 
     def __str__(self):
         return self._url
 
-    def getData(self, mibname, **options):
+    @staticmethod
+    def _getProxy(scheme, host):
+        """Return proxy host, port and authorization header value, if any"""
+        proxy = getproxies().get(scheme)
+
+        if proxy and not proxy_bypass(host):
+            proxy = urlparse.urlsplit(proxy)
+
+            auth = None
+
+            if proxy.username is not None:
+                credentials = '%s:%s' % (urlparse.unquote(proxy.username),
+                                         urlparse.unquote(proxy.password or ''))
+                auth = 'Basic ' + decode(base64.b64encode(encode(credentials)))
+
+            return proxy.hostname, proxy.port, auth
+
+    def _connect(self, scheme, netloc, proxy):
+        url = urlparse.urlsplit('%s://%s' % (scheme, netloc))
+
+        port = url.port or (scheme == 'https' and 443 or 80)
+
+        debug.logger & debug.flagReader and debug.logger(
+            'connecting to %s:%s%s' % (url.hostname, port, proxy and ' via proxy %s:%s' % proxy[:2] or ''))
+
+        if scheme == 'https':
+            if proxy:
+                conn = httplib.HTTPSConnection(proxy[0], proxy[1] or 443, timeout=self._timeout)
+                conn.set_tunnel(url.hostname, port,
+                                headers=proxy[2] and {'Proxy-Authorization': proxy[2]} or None)
+
+            else:
+                conn = httplib.HTTPSConnection(url.hostname, port, timeout=self._timeout)
+
+        elif proxy:
+            conn = httplib.HTTPConnection(proxy[0], proxy[1] or 80, timeout=self._timeout)
+
+        else:
+            conn = httplib.HTTPConnection(url.hostname, port, timeout=self._timeout)
+
+        return conn
+
+    def _checkout(self, key):
+        self._lock.acquire()
+
+        try:
+            if self._idleConns.get(key):
+                return self._idleConns[key].pop(), True
+
+        finally:
+            self._lock.release()
+
+        return None, False
+
+    def _checkin(self, key, conn):
+        self._lock.acquire()
+
+        try:
+            idleConns = self._idleConns.setdefault(key, [])
+
+            if len(idleConns) < self.maxIdle:
+                idleConns.append(conn)
+                return
+
+        finally:
+            self._lock.release()
+
+        conn.close()
+
+    def close(self):
+        """Close all idle HTTP connections"""
+        self._lock.acquire()
+
+        try:
+            idleConns, self._idleConns = self._idleConns, {}
+
+        finally:
+            self._lock.release()
+
+        for conns in idleConns.values():
+            for conn in conns:
+                conn.close()
+
+    def _fetch(self, url, headers):
+        """Send GET request over a persistent connection.
+
+        Returns HTTP response and up to *maxMibSize* bytes of its body.
+        """
+        parts = urlparse.urlsplit(url)
+
+        scheme, netloc, path, query = parts[:4]
+
+        proxy = self._getProxy(scheme, parts.hostname)
+
+        # plain HTTP proxy wants absolute URL
+        if proxy and scheme == 'http':
+            target = url
+
+            if proxy[2]:
+                headers = dict(headers, **{'Proxy-Authorization': proxy[2]})
+
+        else:
+            target = (path or '/') + (query and '?' + query or '')
+
+        key = scheme, netloc
+
+        while True:
+            conn, reused = self._checkout(key)
+
+            if conn is None:
+                conn = self._connect(scheme, netloc, proxy)
+
+            try:
+                conn.request('GET', target, headers=headers)
+                response = conn.getresponse()
+                data = response.read(self.maxMibSize)
+
+            except (httplib.HTTPException, socket.error, IOError):
+                conn.close()
+
+                # server might have closed idle connection
+                if reused:
+                    debug.logger & debug.flagReader and debug.logger(
+                        'persistent connection to %s failed: %s, reconnecting' % (netloc, sys.exc_info()[1]))
+                    continue
+
+                raise
+
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+
+            else:
+                conn.close()
+
+            return response, data
+
+    def _get(self, url, headers):
+        """Fetch URL following redirects.
+
+        Returns final URL, HTTP response and response body.
+        """
+        for _ in range(self.maxRedirects + 1):
+            response, data = self._fetch(url, headers)
+
+            location = response.getheader('Location')
+
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                break
+
+            url = urlparse.urljoin(url, location)
+
+            debug.logger & debug.flagReader and debug.logger('redirected to %s' % url)
+
+        return url, response, data
+
+    def _getMibInfo(self, url, response, **kwargs):
+        lastModified = response.getheader('Last-Modified')
+
+        try:
+            mtime = time.mktime(time.strptime(lastModified, "%a, %d %b %Y %H:%M:%S %Z"))
+
+        except Exception:
+            debug.logger & debug.flagReader and debug.logger('malformed HTTP headers: %s' % sys.exc_info()[1])
+            mtime = time.time()
+
+        debug.logger & debug.flagReader and debug.logger(
+            'fetching source MIB %s, mtime %s' % (url, lastModified))
+
+        return MibInfo(path=url, mtime=mtime, etag=response.getheader('ETag'),
+                       lastModified=lastModified, **kwargs)
+
+    def _getVariants(self, mibname, **options):
+        for mibalias, mibfile in self.getMibVariants(mibname, **options):
+            if self.MIB_MAGIC in self._url:
+                url = self._url.replace(self.MIB_MAGIC, mibfile)
+            else:
+                url = self._url + mibfile
+
+            yield mibalias, mibfile, url
+
+    def _getVariant(self, mibalias, mibfile, url):
+        """Fetch one of MIB name variants.
+
+        Return *None* if server reports it missing, *False* on other failures.
+        """
         headers = {
             'Accept': 'text/plain',
             'User-Agent': self._user_agent
         }
 
+        debug.logger & debug.flagReader and debug.logger('trying to fetch MIB from %s' % url)
+
+        try:
+            url, response, data = self._get(url, headers)
+
+        except Exception:
+            debug.logger & debug.flagReader and debug.logger('failed to fetch MIB from %s: %s' % (url, sys.exc_info()[1]))
+            return False
+
+        debug.logger & debug.flagReader and debug.logger('HTTP response %s' % response.status)
+
+        if response.status == 200:
+            return self._getMibInfo(url, response, file=mibfile, name=mibalias), decode(data)
+
+        if response.status not in self.missingStatuses:
+            return False
+
+    def getData(self, mibname, **options):
         mibname = decode(mibname)
 
         debug.logger & debug.flagReader and debug.logger('looking for MIB %s' % mibname)
 
-        for mibalias, mibfile in self.getMibVariants(mibname, **options):
-            if self.MIB_MAGIC in self._url:
-                url = self._url.replace(self.MIB_MAGIC, mibfile)
-            else:
-                url = self._url + mibfile
+        missing = True
 
-            debug.logger & debug.flagReader and debug.logger('trying to fetch MIB from %s' % url)
+        for mibalias, mibfile, url in self._getVariants(mibname, **options):
+            result = self._getVariant(mibalias, mibfile, url)
 
-            try:
-                req = Request(url, headers=headers)
-                response = urlopen(req)  # nosec
+            if result:
+                return result
+
+            if result is not None:
+                missing = False
+
+        raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self, missing=missing)
+
+    def getDataAsync(self, mibname, loop=None, **options):
+        """Fetch MIB asynchronously probing all MIB name variants at once.
+
+        Each variant is fetched by blocking HTTP client code run by
+        the event loop executor thread.
+
+        Args:
+            mibname (str): MIB name to fetch
+
+        Keyword Args:
+            loop: asyncio event loop to run fetch in, default is the running loop
+
+        Returns:
+            asyncio future resolving to a pair of
+            :py:class:`~pysmi.mibinfo.MibInfo` object and MIB text
+        """
+        if asyncio is None:
+            raise error.PySmiError('asyncio is not available')
+
+        loop = loop or getRunningLoop()
+
+        mibname = decode(mibname)
+
+        debug.logger & debug.flagReader and debug.logger('looking for MIB %s concurrently' % mibname)
+
+        variants = []
+
+        for variant in self._getVariants(mibname, **options):
+            if variant[2] not in [x[2] for x in variants]:
+                variants.append(variant)
+
+        future = loop.create_future()
+
+        def cbFun(probes):
+            if future.cancelled():
+                return
+
+            if probes.exception():
+                future.set_exception(probes.exception())
+                return
+
+            # the first variant wins just like in a sequential search
+            for result in probes.result():
+                if result:
+                    future.set_result(result)
+                    return
+
+            future.set_exception(
+                error.PySmiReaderFileNotFoundError(
+                    'source MIB %s not found' % mibname, reader=self,
+                    missing=all([x is None for x in probes.result()])))
+
+        asyncio.gather(
+            *[loop.run_in_executor(None, self._getVariant, *x) for x in variants]
+        ).add_done_callback(cbFun)
+
+        return future
+
+    def getDataIfModified(self, mibinfo, **options):
+        """Fetch MIB again unless it has not changed since last fetch.
+
+        MIB is revalidated with a conditional HTTP request built from
+        the *ETag* and *Last-Modified* headers of the original response.
+
+        Args:
+            mibinfo: :py:class:`~pysmi.mibinfo.MibInfo` object returned
+                along with MIB text by this reader before
+
+        Returns:
+            a tuple of :py:class:`~pysmi.mibinfo.MibInfo` object and
+            MIB text
+
+        Raises:
+            PySmiReaderFileNotModifiedError: if MIB has not changed
+            PySmiReaderFileNotFoundError: if MIB can't be fetched
+        """
+        headers = {
+            'Accept': 'text/plain',
+            'User-Agent': self._user_agent
+        }
+
+        if getattr(mibinfo, 'etag', None):
+            headers['If-None-Match'] = mibinfo.etag
+
+        if getattr(mibinfo, 'lastModified', None):
+            headers['If-Modified-Since'] = mibinfo.lastModified
 
-            except Exception:
-                debug.logger & debug.flagReader and debug.logger('failed to fetch MIB from %s: %s' % (url, sys.exc_info()[1]))
-                continue
+        debug.logger & debug.flagReader and debug.logger('revalidating MIB at %s' % mibinfo.path)
 
-            debug.logger & debug.flagReader and debug.logger('HTTP response %s' % response.code)
+        try:
+            url, response, data = self._get(mibinfo.path, headers)
 
-            if response.code == 200:
-                try:
-                    mtime = time.mktime(time.strptime(response.getheader('Last-Modified'), "%a, %d %b %Y %H:%M:%S %Z"))
+        except Exception:
+            raise error.PySmiReaderFileNotFoundError(
+                'failed to fetch MIB from %s: %s' % (mibinfo.path, sys.exc_info()[1]), reader=self)
 
-                except Exception:
-                    debug.logger & debug.flagReader and debug.logger('malformed HTTP headers: %s' % sys.exc_info()[1])
-                    mtime = time.time()
+        debug.logger & debug.flagReader and debug.logger('HTTP response %s' % response.status)
 
-                debug.logger & debug.flagReader and debug.logger(
-                    'fetching source MIB %s, mtime %s' % (url, response.getheader('Last-Modified')))
+        if response.status == 304:
+            raise error.PySmiReaderFileNotModifiedError('source MIB %s not modified' % url, reader=self)
 
-                return MibInfo(path=url, file=mibfile, name=mibalias, mtime=mtime), decode(response.read(self.maxMibSize))
+        if response.status == 200:
+            return self._getMibInfo(url, response, file=mibinfo.file, name=mibinfo.name), decode(data)
 
-        raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self)
+        raise error.PySmiReaderFileNotFoundError(
+            'source MIB %s not found' % url, reader=self, missing=response.status in self.missingStatuses)
@@ -7,7 +7,18 @@
 import os
 import sys
 import time
+import codecs
+import tempfile
+import threading
+
+try:
+    import mmap
+
+except ImportError:
+    mmap = None
+
 from pysmi.reader.base import AbstractReader
+from pysmi.lexer.header import scanHeader
 from pysmi.mibinfo import MibInfo
 from pysmi.compat import decode
 from pysmi import debug
@@ -19,9 +30,17 @@ class FileReader(AbstractReader):
 
     *FileReader* class instance tries to locate ASN.1 MIB files
     by name, fetch and return their contents to caller.
+
+    Directory listings are read once and kept in memory for as long
+    as directory modification time stays the same, so that MIB file
+    name variants are looked up without hitting the filesystem.
     """
     useIndexFile = True  # optional .index file mapping MIB to file name
     indexFile = '.index'
+    indexVersion = 1
+    indexHeader = '# pysmi MIB index version '
+    autoIndex = True  # rebuild stale, pysmi-made .index file in background
+    mmapThreshold = 256 * 1024  # memory-map MIB files of this size and larger
 
     def __init__(self, path, recursive=True, ignoreErrors=True):
         """Create an instance of *FileReader* serving a directory.
@@ -38,30 +57,79 @@ class FileReader(AbstractReader):
         self._ignoreErrors = ignoreErrors
         self._indexLoaded = False
         self._mibIndex = None
+        self._listings = {}  # k, v = directory, (mtime, subdirs, files)
+        self._lock = threading.Lock()  # index may be rebuilt in background
 
     def __str__(self):
         return '%s{"%s"}' % (self.__class__.__name__, self._path)
 
-    def getSubdirs(self, path, recursive=True, ignoreErrors=True):
-        if not recursive:
-            return [path]
+    def getListing(self, path, ignoreErrors=True):
+        """Return subdirectories and files of a directory.
 
-        dirs = [path]
+        Directory contents is cached until directory modification
+        time changes.
 
+        Args:
+            path (str): directory to list
+
+        Keyword Args:
+            ignoreErrors (bool): treat inaccessible directory as empty
+
+        Returns:
+            a list of subdirectories paths and a dictionary of
+            lower-cased file names (keys) and lists of actual file
+            names (values)
+        """
         try:
-            subdirs = os.listdir(path)
+            mtime = os.stat(path).st_mtime
+
+            with self._lock:
+                listing = self._listings.get(path)
+
+            if listing and listing[0] == mtime:
+                return listing[1:]
+
+            entries = os.listdir(path)
 
         except OSError:
+            with self._lock:
+                self._listings.pop(path, None)
+
             if ignoreErrors:
-                return dirs
+                return [], {}
 
-            else:
-                raise error.PySmiError('directory %s access error: %s' % (path, sys.exc_info()[1]))
+            raise error.PySmiError('directory %s access error: %s' % (path, sys.exc_info()[1]))
 
-        for d in subdirs:
-            d = os.path.join(decode(path), decode(d))
-            if os.path.isdir(d):
-                dirs.extend(self.getSubdirs(d, recursive))
+        subdirs = []
+        files = {}
+
+        for entry in entries:
+            entry = decode(entry)
+            f = os.path.join(decode(path), entry)
+
+            if os.path.isdir(f):
+                subdirs.append(f)
+
+            elif os.path.isfile(f):
+                files.setdefault(entry.lower(), []).append(entry)
+
+        debug.logger & debug.flagReader and debug.logger(
+            'indexed directory %s, %s file(s), %s subdirectories' % (
+                path, sum([len(x) for x in files.values()]), len(subdirs)))
+
+        with self._lock:
+            self._listings[path] = mtime, subdirs, files
+
+        return subdirs, files
+
+    def getSubdirs(self, path, recursive=True, ignoreErrors=True):
+        if not recursive:
+            return [path]
+
+        dirs = [path]
+
+        for d in self.getListing(path, ignoreErrors)[0]:
+            dirs.extend(self.getSubdirs(d, recursive, ignoreErrors))
 
         return dirs
 
@@ -72,7 +140,8 @@ class FileReader(AbstractReader):
             try:
                 f = open(indexFile)
                 mibIndex = dict(
-                    [x.split()[:2] for x in f.readlines()]
+                    [x.split()[:2] for x in f.readlines()
+                     if x.strip() and not x.startswith('#')]
                 )
                 f.close()
                 debug.logger & debug.flagReader and debug.logger(
@@ -83,56 +152,288 @@ class FileReader(AbstractReader):
 
         return mibIndex
 
+    @classmethod
+    def saveIndex(cls, indexFile, mibIndex):
+        """Atomically write MIB index file.
+
+        Args:
+            indexFile (str): path to MIB index file
+            mibIndex (dict): MIB names (keys) and file names (values)
+
+        Raises:
+            PySmiError: if index file can't be written
+        """
+        try:
+            fd, tmpFile = tempfile.mkstemp(
+                dir=os.path.dirname(indexFile) or os.curdir,
+                prefix=os.path.basename(indexFile) + '.'
+            )
+
+        except (OSError, IOError):
+            raise error.PySmiError('index file %s write failure: %s' % (indexFile, sys.exc_info()[1]))
+
+        try:
+            f = os.fdopen(fd, 'w')
+
+            try:
+                f.write('%s%s\n' % (cls.indexHeader, cls.indexVersion))
+
+                for mibname in sorted(mibIndex):
+                    f.write('%s %s\n' % (mibname, mibIndex[mibname]))
+
+            finally:
+                f.close()
+
+            os.chmod(tmpFile, 0o644)
+
+            if hasattr(os, 'replace'):
+                os.replace(tmpFile, indexFile)
+
+            else:
+                os.rename(tmpFile, indexFile)
+
+            # make index file not older than its directory
+            os.utime(indexFile, None)
+
+        except (OSError, IOError):
+            try:
+                os.remove(tmpFile)
+
+            except OSError:
+                pass
+
+            raise error.PySmiError('index file %s write failure: %s' % (indexFile, sys.exc_info()[1]))
+
+        debug.logger & debug.flagReader and debug.logger(
+            'saved MIB index map to %s file, %s entries' % (indexFile, len(mibIndex)))
+
+    def buildIndex(self):
+        """Map canonical names of MIBs to their files.
+
+        Scans all files in the directory (and subdirectories, if
+        recursive) for ASN.1 MIB module headers.
+
+        Returns:
+            a dictionary of MIB names (keys) and file names (values)
+            relative to the served directory
+        """
+        mibIndex = {}
+
+        for path in self.getSubdirs(self._path, self._recursive, self._ignoreErrors):
+            files = self.getListing(path, self._ignoreErrors)[1]
+
+            for filename in sorted([x for filenames in files.values() for x in filenames]):
+                f = os.path.join(decode(path), filename)
+
+                mibfile = os.path.relpath(f, self._path)
+
+                # index files and names the index format can't hold
+                if filename.startswith(self.indexFile) or len(mibfile.split()) != 1:
+                    continue
+
+                try:
+                    mibname = scanHeader(self.readFile(f)).name
+
+                except (OSError, IOError, error.PySmiError):
+                    debug.logger & debug.flagReader and debug.logger(
+                        'skipping file %s: %s' % (f, sys.exc_info()[1]))
+                    continue
+
+                if mibname not in mibIndex:
+                    mibIndex[mibname] = mibfile
+
+        debug.logger & debug.flagReader and debug.logger(
+            'found %s MIB(s) at %s' % (len(mibIndex), self._path))
+
+        return mibIndex
+
+    def writeIndex(self):
+        """Build and store MIB index file in the served directory.
+
+        Returns:
+            a dictionary of MIB names (keys) and file names (values)
+
+        Raises:
+            PySmiError: if index file can't be written
+        """
+        mibIndex = self.buildIndex()
+
+        self.saveIndex(os.path.join(self._path, self.indexFile), mibIndex)
+
+        return mibIndex
+
+    def isIndexStale(self):
+        """Tell if pysmi-made MIB index file is out of date.
+
+        Index file is considered stale if it was produced by a different
+        version of index format or any of the directories it covers have
+        changed after the index has been written. Hand-written index files
+        are never considered stale.
+        """
+        indexFile = os.path.join(self._path, self.indexFile)
+
+        try:
+            f = open(indexFile)
+            header = f.readline().strip()
+            f.close()
+
+            mtime = os.stat(indexFile).st_mtime
+
+        except (OSError, IOError):
+            return False
+
+        if not header.startswith(self.indexHeader):
+            return False
+
+        if header != '%s%s' % (self.indexHeader, self.indexVersion):
+            return True
+
+        for path in self.getSubdirs(self._path, self._recursive, self._ignoreErrors):
+            try:
+                dirMtime = os.stat(path).st_mtime
+
+            except OSError:
+                continue
+
+            if dirMtime > mtime:
+                debug.logger & debug.flagReader and debug.logger(
+                    'directory %s is newer than MIB index %s' % (path, indexFile))
+                return True
+
+        return False
+
+    def _rebuildIndex(self):
+        try:
+            mibIndex = self.writeIndex()
+
+        except error.PySmiError:
+            debug.logger & debug.flagReader and debug.logger(
+                'MIB index rebuild failed: %s' % sys.exc_info()[1])
+            return
+
+        with self._lock:
+            self._mibIndex = mibIndex
+
     def getMibVariants(self, mibname, **options):
         if self.useIndexFile:
             if not self._indexLoaded:
-                self._mibIndex = self.loadIndex(
+                mibIndex = self.loadIndex(
                     os.path.join(self._path, self.indexFile)
                 )
+
+                with self._lock:
+                    self._mibIndex = mibIndex
+
                 self._indexLoaded = True
 
-            if mibname in self._mibIndex:
+                if self.autoIndex and self.isIndexStale():
+                    debug.logger & debug.flagReader and debug.logger(
+                        'rebuilding MIB index at %s' % self._path)
+
+                    thread = threading.Thread(target=self._rebuildIndex)
+                    thread.daemon = True
+                    thread.start()
+
+            with self._lock:
+                mibIndex = self._mibIndex
+
+            if mibname in mibIndex:
                 debug.logger & debug.flagReader and debug.logger(
-                    'found %s in MIB index: %s' % (mibname, self._mibIndex[mibname]))
-                return [(mibname, self._mibIndex[mibname])]
+                    'found %s in MIB index: %s' % (mibname, mibIndex[mibname]))
+
+                # index might be out of date
+                return [(mibname, mibIndex[mibname])] + list(
+                    super(FileReader, self).getMibVariants(mibname, **options))
 
         return super(FileReader, self).getMibVariants(mibname, **options)
 
+    def readFile(self, filename):
+        """Read and decode MIB file.
+
+        Files of at least *mmapThreshold* bytes are memory-mapped and
+        decoded right from the mapping, not through a copy of file
+        contents.
+
+        Args:
+            filename (str): path to MIB file
+
+        Returns:
+            MIB text
+
+        Raises:
+            IOError: if file can't be read or is *maxMibSize* bytes or larger
+        """
+        fp = open(filename, mode='rb')
+
+        try:
+            size = os.fstat(fp.fileno()).st_size
+
+            if size >= self.maxMibSize:
+                raise IOError('MIB %s too large' % filename)
+
+            if mmap is None or not size or size < self.mmapThreshold:
+                return decode(fp.read(self.maxMibSize))
+
+            mibData = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                return codecs.utf_8_decode(mibData, 'ignore', True)[0]
+
+            finally:
+                mibData.close()
+
+        finally:
+            fp.close()
+
     def getData(self, mibname, **options):
         debug.logger & debug.flagReader and debug.logger(
             '%slooking for MIB %s' % (self._recursive and 'recursively ' or '', mibname))
 
         for path in self.getSubdirs(self._path, self._recursive, self._ignoreErrors):
 
+            files = self.getListing(path, self._ignoreErrors)[1]
+
             for mibalias, mibfile in self.getMibVariants(mibname, **options):
-                f = os.path.join(decode(path), decode(mibfile))
+                mibfile = decode(mibfile)
+
+                debug.logger & debug.flagReader and debug.logger(
+                    'trying MIB %s' % os.path.join(decode(path), mibfile))
+
+                # MIB index may refer to files in subdirectories
+                if os.path.basename(mibfile) != mibfile:
+                    if not os.path.isfile(os.path.join(decode(path), mibfile)):
+                        continue
+
+                else:
+                    # file names match case-insensitively, exact match wins
+                    filenames = files.get(mibfile.lower())
+
+                    if not filenames:
+                        continue
 
-                debug.logger & debug.flagReader and debug.logger('trying MIB %s' % f)
+                    if mibfile not in filenames:
+                        mibfile = filenames[0]
 
-                if os.path.exists(f) and os.path.isfile(f):
-                    try:
-                        mtime = os.stat(f)[8]
+                f = os.path.join(decode(path), mibfile)
 
-                        debug.logger & debug.flagReader and debug.logger(
-                            'source MIB %s mtime is %s, fetching data...' % (
-                                f, time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(mtime))))
+                try:
+                    mtime = os.stat(f)[8]
 
-                        fp = open(f, mode='rb')
-                        mibData = fp.read(self.maxMibSize)
-                        fp.close()
+                    debug.logger & debug.flagReader and debug.logger(
+                        'source MIB %s mtime is %s, fetching data...' % (
+                            f, time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(mtime))))
 
-                        if len(mibData) == self.maxMibSize:
-                            raise IOError('MIB %s too large' % f)
+                    mibData = self.readFile(f)
 
-                        return MibInfo(path='file://%s' % f, file=mibfile, name=mibalias, mtime=mtime), decode(mibData)
+                    return MibInfo(path='file://%s' % f, file=mibfile, name=mibalias, mtime=mtime), mibData
 
-                    except (OSError, IOError):
-                        debug.logger & debug.flagReader and debug.logger(
-                            'source file %s open failure: %s' % (f, sys.exc_info()[1]))
+                except (OSError, IOError):
+                    debug.logger & debug.flagReader and debug.logger(
+                        'source file %s open failure: %s' % (f, sys.exc_info()[1]))
 
-                        if not self._ignoreErrors:
-                            raise error.PySmiError('file %s access error: %s' % (f, sys.exc_info()[1]))
+                    if not self._ignoreErrors:
+                        raise error.PySmiError('file %s access error: %s' % (f, sys.exc_info()[1]))
 
-                    raise error.PySmiReaderFileNotModifiedError('source MIB %s is older than needed' % f, reader=self)
+                raise error.PySmiReaderFileNotModifiedError('source MIB %s is older than needed' % f, reader=self)
 
         raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self)
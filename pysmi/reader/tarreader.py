@@ -0,0 +1,189 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import sys
+import time
+import shutil
+import tarfile
+import tempfile
+import threading
+from pysmi.reader.base import AbstractReader
+from pysmi.mibinfo import MibInfo
+from pysmi.compat import decode
+from pysmi import debug
+from pysmi import error
+
+
+class TarReader(AbstractReader):
+    """Fetch ASN.1 MIB text by name from a TAR archive.
+
+    *TarReader* class instance tries to locate ASN.1 MIB files
+    by name, fetch and return their contents to caller.
+
+    TAR archive is scanned just once to build MIB files index.
+    Plain TAR archive is then read at known offsets. Compressed TAR
+    archives do not allow random access, so their MIB files get
+    copied into a temporary storage which is kept in memory unless
+    it grows beyond *maxMemorySize* bytes.
+    """
+    maxMemorySize = 16 * 1024 * 1024  # bytes of MIBs to keep in memory
+    extensions = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+    def __init__(self, path, ignoreErrors=True):
+        """Create an instance of *TarReader* serving a TAR archive.
+
+           Args:
+               path (str): path to TAR archive containing MIB files,
+                   possibly gzip, bzip2 or xz compressed
+
+           Keyword Args:
+               ignoreErrors (bool): ignore TAR archive access errors
+        """
+        self._name = path
+        self._members = {}
+        self._pendingError = None
+        self._fileObj = None
+        self._lock = threading.Lock()
+
+        try:
+            self._members = self._readTarDirectory(path)
+
+        except Exception:
+            debug.logger & debug.flagReader and debug.logger(
+                'TAR file %s open failure: %s' % (self._name, sys.exc_info()[1]))
+
+            if not ignoreErrors:
+                self._pendingError = error.PySmiError('file %s access error: %s' % (self._name, sys.exc_info()[1]))
+
+    @classmethod
+    def isTarFile(cls, path):
+        """Tell whether file name looks like a TAR archive"""
+        return path.lower().endswith(cls.extensions)
+
+    def _addMember(self, members, member, offset):
+        filename = os.path.basename(member.name)
+
+        while filename in members:
+            filename += '+'
+
+        members[filename] = offset, member.size, member.mtime
+
+    def _readTarDirectory(self, path):
+        members = {}
+
+        try:
+            archive = tarfile.open(path, 'r:')
+
+        except tarfile.ReadError:
+            # compressed archive, read members in one pass
+            archive = tarfile.open(path, 'r|*')
+
+            fileObj = tempfile.SpooledTemporaryFile(max_size=self.maxMemorySize)
+
+            try:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+
+                    if member.size >= self.maxMibSize:
+                        self._addMember(members, member, None)
+                        continue
+
+                    offset = fileObj.tell()
+
+                    shutil.copyfileobj(archive.extractfile(member), fileObj)
+
+                    self._addMember(members, member, offset)
+
+            except Exception:
+                fileObj.close()
+                raise
+
+            finally:
+                archive.close()
+
+            self._fileObj = fileObj
+
+            debug.logger & debug.flagReader and debug.logger(
+                '%s MIB files of %s copied to temporary storage' % (len(members), self._name))
+
+        else:
+            try:
+                for member in archive.getmembers():
+                    if not member.isfile():
+                        continue
+
+                    if member.size >= self.maxMibSize:
+                        self._addMember(members, member, None)
+                        continue
+
+                    self._addMember(members, member, member.offset_data)
+
+            finally:
+                archive.close()
+
+            self._fileObj = open(path, 'rb')
+
+        return members
+
+    def _readTarFile(self, offset, size):
+        self._lock.acquire()
+
+        try:
+            self._fileObj.seek(offset)
+
+            return self._fileObj.read(size)
+
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """Close TAR archive and drop MIB files copied from it"""
+        self._lock.acquire()
+
+        try:
+            if self._fileObj:
+                self._fileObj.close()
+
+            self._members = {}
+
+        finally:
+            self._lock.release()
+
+    def __str__(self):
+        return '%s{"%s"}' % (self.__class__.__name__, self._name)
+
+    def getData(self, mibname, **options):
+        debug.logger & debug.flagReader and debug.logger('looking for MIB %s at %s' % (mibname, self._name))
+
+        if self._pendingError:
+            raise self._pendingError
+
+        for mibalias, mibfile in self.getMibVariants(mibname, **options):
+
+            debug.logger & debug.flagReader and debug.logger('trying MIB %s' % mibfile)
+
+            try:
+                offset, size, mtime = self._members[mibfile]
+
+            except KeyError:
+                continue
+
+            if offset is None:
+                raise error.PySmiReaderFileNotFoundError(
+                    'source MIB %s/%s too large' % (self._name, mibfile), reader=self)
+
+            mibData = self._readTarFile(offset, size)
+
+            debug.logger & debug.flagReader and debug.logger(
+                'source MIB %s, mtime %s, read from %s/%s' % (mibfile, time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(mtime)), self._name, mibfile)
+            )
+
+            return MibInfo(path='tar://%s/%s' % (self._name, mibfile),
+                           file=mibfile, name=mibalias, mtime=mtime), decode(mibData)
+
+        raise error.PySmiReaderFileNotFoundError('source MIB %s not found' % mibname, reader=self)
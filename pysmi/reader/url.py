@@ -18,6 +18,7 @@ except ImportError:
 
 from pysmi.reader.localfile import FileReader
 from pysmi.reader.zipreader import ZipReader
+from pysmi.reader.tarreader import TarReader
 from pysmi.reader.httpclient import HttpReader
 from pysmi.reader.ftpclient import FtpReader
 from pysmi import error
@@ -44,18 +45,27 @@ def getReadersFromUrls(*sourceUrls, **options):
 
                 setattr(mibSource, k, v)
 
-        if mibSource.scheme in ('', 'file', 'zip'):
+        if mibSource.scheme in ('', 'file', 'zip', 'tar'):
             scheme = mibSource.scheme
             filePath = url2pathname(mibSource.path)
             if scheme != 'file' and (filePath.endswith('.zip') or
                                      filePath.endswith('.ZIP')):
                 scheme = 'zip'
 
+            elif scheme == 'tar':
+                # tar://mibs.tar.gz
+                filePath = url2pathname(mibSource.netloc + mibSource.path)
+
+            elif scheme != 'file' and TarReader.isTarFile(filePath):
+                scheme = 'tar'
+
             else:
                 scheme = 'file'
 
             if scheme == 'file':
                 readers.append(FileReader(filePath).setOptions(**options))
+            elif scheme == 'tar':
+                readers.append(TarReader(filePath).setOptions(**options))
             else:
                 readers.append(ZipReader(filePath).setOptions(**options))
 
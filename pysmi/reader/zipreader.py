@@ -9,6 +9,8 @@ import sys
 import time
 import datetime
 import zipfile
+import threading
+from collections import OrderedDict
 from pysmi.reader.base import AbstractReader
 from pysmi.mibinfo import MibInfo
 from pysmi.compat import decode
@@ -50,6 +52,9 @@ class FileLike(object):
     def tell(self):
         return self.pos
 
+    def seekable(self):
+        return True
+
     def read(self, n=-1):
         if self.buflist:
             self.buf += self.null.join(self.buflist)
@@ -72,8 +77,15 @@ class ZipReader(AbstractReader):
 
     *ZipReader* class instance tries to locate ASN.1 MIB files
     by name, fetch and return their contents to caller.
+
+    ZIP archive is kept open for as long as *ZipReader* is in use.
+    ZIP archives nested into the main one are decompressed once
+    and kept in memory unless they exceed *maxCacheSize* bytes
+    altogether. In the latter case least recently used inner
+    archives are dropped.
     """
     useIndexFile = False
+    maxCacheSize = 32 * 1024 * 1024  # bytes of inner ZIP archives to keep
 
     def __init__(self, path, ignoreErrors=True):
         """Create an instance of *ZipReader* serving a ZIP archive.
@@ -87,9 +99,16 @@ class ZipReader(AbstractReader):
         self._name = path
         self._members = {}
         self._pendingError = None
+        self._fileObj = None
+        self._archive = None
+        self._innerArchives = OrderedDict()
+        self._cacheSize = 0
+        self._lock = threading.Lock()
 
         try:
-            self._members = self._readZipDirectory(fileObj=open(path, 'rb'))
+            self._fileObj = open(path, 'rb')
+            self._archive = zipfile.ZipFile(self._fileObj)
+            self._members = self._readZipDirectory(self._archive, ())
 
         except Exception:
             debug.logger & debug.flagReader and debug.logger(
@@ -98,13 +117,7 @@ class ZipReader(AbstractReader):
             if not ignoreErrors:
                 self._pendingError = error.PySmiError('file %s access error: %s' % (self._name, sys.exc_info()[1]))
 
-    def _readZipDirectory(self, fileObj):
-
-        archive = zipfile.ZipFile(fileObj)
-
-        if isinstance(fileObj, FileLike):
-            fileObj = None
-
+    def _readZipDirectory(self, archive, path):
         members = {}
 
         for member in archive.infolist():
@@ -116,42 +129,94 @@ class ZipReader(AbstractReader):
             if (member.filename.endswith('.zip') or
                     member.filename.endswith('.ZIP')):
 
-                innerZipBlob = archive.read(member.filename)
+                innerPath = path + (member.filename,)
+
+                innerArchive = self._openInnerArchive(archive, innerPath)
 
-                innerMembers = self._readZipDirectory(FileLike(innerZipBlob, member.filename))
+                innerMembers = self._readZipDirectory(innerArchive, innerPath)
 
                 for innerFilename, ref in innerMembers.items():
 
                     while innerFilename in members:
                         innerFilename += '+'
 
-                    members[innerFilename] = [[fileObj, member.filename, None]]
-                    members[innerFilename].extend(ref)
+                    members[innerFilename] = ref
 
             else:
                 mtime = time.mktime(datetime.datetime(*member.date_time[:6]).timetuple())
 
-                members[filename] = [[fileObj, member.filename, mtime]]
+                members[filename] = path, member.filename, mtime
 
         return members
 
-    def _readZipFile(self, refs):
+    def _openInnerArchive(self, archive, path):
+        innerZipBlob = archive.read(path[-1])
 
-        for fileObj, filename, mtime in refs:
+        innerArchive = zipfile.ZipFile(FileLike(innerZipBlob, path[-1]))
 
-            if not fileObj:
-                fileObj = FileLike(dataObj, name=self._name)
+        size = len(innerZipBlob)
 
-            archive = zipfile.ZipFile(fileObj)
+        if size <= self.maxCacheSize:
+            self._innerArchives[path] = innerArchive, size
+            self._cacheSize += size
 
-            try:
-                dataObj = archive.read(filename)
+            while self._cacheSize > self.maxCacheSize:
+                _, (_, size) = self._innerArchives.popitem(last=False)
+                self._cacheSize -= size
+
+        return innerArchive
+
+    def _getArchive(self, path):
+        if not path:
+            return self._archive
+
+        try:
+            innerArchive, size = self._innerArchives.pop(path)
+
+        except KeyError:
+            debug.logger & debug.flagReader and debug.logger(
+                'decompressing inner ZIP archive %s' % '/'.join(path))
+
+            return self._openInnerArchive(self._getArchive(path[:-1]), path)
+
+        # most recently used go last
+        self._innerArchives[path] = innerArchive, size
+
+        return innerArchive
+
+    def _readZipFile(self, ref):
+        path, filename, mtime = ref
+
+        self._lock.acquire()
+
+        try:
+            return self._getArchive(path).read(filename), mtime
+
+        except Exception:
+            debug.logger & debug.flagReader and debug.logger('ZIP read component %s read error: %s' % (filename, sys.exc_info()[1]))
+            return '', 0
+
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """Close ZIP archive and drop decompressed inner archives"""
+        self._lock.acquire()
+
+        try:
+            self._innerArchives.clear()
+            self._cacheSize = 0
+
+            if self._archive:
+                self._archive.close()
+                self._archive = None
 
-            except Exception:
-                debug.logger & debug.flagReader and debug.logger('ZIP read component %s read error: %s' % (fileObj.name, sys.exc_info()[1]))
-                return '', 0
+            if self._fileObj:
+                self._fileObj.close()
+                self._fileObj = None
 
-        return dataObj, mtime
+        finally:
+            self._lock.release()
 
     def __str__(self):
         return '%s{"%s"}' % (self.__class__.__name__, self._name)
@@ -170,12 +235,12 @@ class ZipReader(AbstractReader):
             debug.logger & debug.flagReader and debug.logger('trying MIB %s' % mibfile)
 
             try:
-                refs = self._members[mibfile]
+                ref = self._members[mibfile]
 
             except KeyError:
                 continue
 
-            mibData, mtime = self._readZipFile(refs)
+            mibData, mtime = self._readZipFile(ref)
 
             if not mibData:
                 continue
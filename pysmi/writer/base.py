@@ -14,5 +14,14 @@ class AbstractWriter(object):
     def putData(self, mibname, data, comments=(), dryRun=False):
         raise NotImplementedError()
 
+    def flush(self):
+        """Complete postponed MIB writes.
+
+           Returns:
+               a dictionary of MIB names (keys) which could not be stored
+               and :py:class:`~pysmi.error.PySmiWriterError` exceptions (values)
+        """
+        return {}
+
     def getData(self, filename):
         raise NotImplementedError()
@@ -6,38 +6,72 @@
 #
 import os
 import sys
+import time
+import struct
+import marshal
 import tempfile
-import py_compile
 
 try:
-    import importlib
+    import importlib.machinery
+    import importlib.util
 
-    try:
-        SOURCE_SUFFIXES = importlib.machinery.SOURCE_SUFFIXES
+    SOURCE_SUFFIXES = importlib.machinery.SOURCE_SUFFIXES
+    BYTECODE_SUFFIXES = importlib.machinery.BYTECODE_SUFFIXES
 
-    except Exception:
-        raise ImportError()
+    MAGIC_NUMBER = importlib.util.MAGIC_NUMBER
+    cache_from_source = importlib.util.cache_from_source
 
-except ImportError:
+except (ImportError, AttributeError):
     import imp
 
     SOURCE_SUFFIXES = [s[0] for s in imp.get_suffixes()
                        if s[2] == imp.PY_SOURCE]
+    BYTECODE_SUFFIXES = [s[0] for s in imp.get_suffixes()
+                         if s[2] == imp.PY_COMPILED]
+
+    MAGIC_NUMBER = imp.get_magic()
+    cache_from_source = None
 
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
 from pysmi.writer.base import AbstractWriter
 from pysmi.compat import encode, decode
 from pysmi import debug
 from pysmi import error
 
 
+def _compileInWorker(writer, pyfile):
+    try:
+        writer.compileFile(pyfile)
+
+    except error.PySmiError:
+        return str(sys.exc_info()[1])
+
+
 class PyFileWriter(AbstractWriter):
     """Stores transformed MIB modules as Python files at specified location.
 
        User is expected to pass *PyFileWriter* class instance to
        *MibCompiler* on instantiation. The rest is internal to *MibCompiler*.
+
+       Unless *pyCompile* option is off, Python code is compiled in
+       memory right away and the bytecode is stored along with the
+       Python source the same way as :py:mod:`py_compile` does.
+       With *pySource* option off, only the bytecode file is stored
+       in place of the Python source, so that Python would import
+       it as a sourceless module.
+
+       With *pyCompileWorkers* option set, byte-compilation is deferred
+       until :py:meth:`flush` is called. Then all the stored Python
+       modules get compiled in one go, possibly by a pool of worker
+       processes.
     """
     pyCompile = True
     pyOptimizationLevel = -1
+    pySource = True
+    pyCompileWorkers = 0
 
     def __init__(self, path):
         """Creates an instance of *PyFileWriter* class.
@@ -46,6 +80,7 @@ class PyFileWriter(AbstractWriter):
                path: writable directory to store Python modules
         """
         self._path = decode(os.path.normpath(path))
+        self._pendingFiles = []
 
     def __str__(self):
         return '%s{"%s"}' % (self.__class__.__name__, self._path)
@@ -69,42 +104,209 @@ class PyFileWriter(AbstractWriter):
         pyfile = os.path.join(self._path, decode(mibname))
         pyfile += SOURCE_SUFFIXES[0]
 
-        tfile = None
+        try:
+            source = encode(data)
+
+        except UnicodeEncodeError:
+            raise error.PySmiWriterError('failure encoding %s: %s' % (pyfile, sys.exc_info()[1]), file=pyfile, writer=self)
+
+        code = compileError = None
+
+        if self.pyCompile and not self.pyCompileWorkers:
+            try:
+                code = self.compileData(pyfile, source)
+
+            except error.PySmiWriterError:
+                compileError = sys.exc_info()[1]
+
+        if self.pySource or self.pyCompileWorkers or code is None:
+            self._writeFile(pyfile, source)
+
+            debug.logger & debug.flagWriter and debug.logger('created file %s' % pyfile)
+
+        else:
+            # stale Python source would take precedence over bytecode
+            self._removeFile(pyfile)
+
+        if code is not None:
+            self._storeBytecode(pyfile, source, code)
 
+        elif self.pyCompile and self.pyCompileWorkers:
+            self._pendingFiles.append((mibname, pyfile))
+
+        if compileError:
+            raise compileError
+
+        debug.logger & debug.flagWriter and debug.logger('%s stored' % mibname)
+
+    def flush(self):
+        """Byte-compile Python modules which compilation has been deferred.
+
+           With *pyCompileWorkers* option set, Python modules are
+           compiled by a pool of that many worker processes.
+
+           Returns:
+               a dictionary of MIB names (keys) which Python modules
+               failed to compile and :py:class:`~pysmi.error.PySmiWriterError`
+               exceptions (values)
+        """
+        pendingFiles, self._pendingFiles = self._pendingFiles, []
+
+        if not pendingFiles:
+            return {}
+
+        pyfiles = [pyfile for mibname, pyfile in pendingFiles]
+
+        if self.pyCompileWorkers > 1 and ProcessPoolExecutor is not None:
+            debug.logger & debug.flagWriter and debug.logger(
+                'compiling %s Python modules with %s worker processes' % (len(pyfiles), self.pyCompileWorkers))
+
+            executor = ProcessPoolExecutor(max_workers=self.pyCompileWorkers)
+
+            try:
+                results = list(executor.map(_compileInWorker, [self] * len(pyfiles), pyfiles,
+                                            chunksize=max(1, len(pyfiles) // (self.pyCompileWorkers * 4))))
+
+            finally:
+                executor.shutdown()
+
+        else:
+            results = [_compileInWorker(self, pyfile) for pyfile in pyfiles]
+
+        failures = {}
+
+        for (mibname, pyfile), result in zip(pendingFiles, results):
+            if result is not None:
+                failures[mibname] = error.PySmiWriterError(result, file=pyfile, writer=self)
+
+        debug.logger & debug.flagWriter and debug.logger(
+            '%s Python modules compiled, %s failed' % (len(pyfiles) - len(failures), len(failures)))
+
+        return failures
+
+    def compileFile(self, pyfile):
+        """Byte-compile Python source file.
+
+           Args:
+               pyfile (str): Python source file name
+        """
         try:
-            fd, tfile = tempfile.mkstemp(dir=self._path)
-            os.write(fd, encode(data))
-            os.close(fd)
-            os.rename(tfile, pyfile)
+            with open(pyfile, 'rb') as f:
+                source = f.read()
 
-        except (OSError, IOError, UnicodeEncodeError):
-            exc = sys.exc_info()
-            if tfile and os.access(tfile, os.F_OK):
-                os.unlink(tfile)
+        except (OSError, IOError):
+            raise error.PySmiWriterError('failure reading file %s: %s' % (pyfile, sys.exc_info()[1]), file=pyfile, writer=self)
+
+        code = self.compileData(pyfile, source)
+
+        self._storeBytecode(pyfile, source, code)
+
+        if not self.pySource:
+            self._removeFile(pyfile)
+
+    def compileData(self, filename, data):
+        """Compile Python source into code object.
+
+           Args:
+               filename (str): file name to report in code object
+               data (bytes): Python source code
+
+           Returns:
+               code object
+
+           Raises:
+               PySmiWriterError: if Python source can not be compiled
+        """
+        try:
+            if sys.version_info[0:2] > (3, 1):
+                # noinspection PyArgumentList
+                return compile(data, filename, 'exec', dont_inherit=True,
+                               optimize=self.pyOptimizationLevel)
+
+            else:
+                return compile(data, filename, 'exec', 0, True)
+
+        except (SyntaxError, ValueError, TypeError):
+            raise error.PySmiWriterError('failure compiling %s: %s' % (filename, sys.exc_info()[1]), file=filename, writer=self)
+
+    def getBytecodeFile(self, pyfile):
+        """Return bytecode file name for Python source file.
+
+           Args:
+               pyfile (str): Python source file name
+
+           Returns:
+               bytecode file name
+        """
+        if not self.pySource:
+            # sourceless modules are only imported from source location
+            return os.path.splitext(pyfile)[0] + BYTECODE_SUFFIXES[0]
 
-            raise error.PySmiWriterError('failure writing file %s: %s' % (pyfile, exc[1]), file=pyfile, writer=self)
+        if cache_from_source is None:
+            return pyfile + (__debug__ and 'c' or 'o')
 
-        debug.logger & debug.flagWriter and debug.logger('created file %s' % pyfile)
+        if sys.version_info[0:2] > (3, 4) and self.pyOptimizationLevel >= 0:
+            return cache_from_source(pyfile, optimization=self.pyOptimizationLevel or '')
 
-        if self.pyCompile:
+        return cache_from_source(pyfile)
+
+    @staticmethod
+    def _genBytecodeHeader(mtime, size):
+        mtime = int(mtime) & 0xFFFFFFFF
+        size &= 0xFFFFFFFF
+
+        if sys.version_info[0:2] > (3, 6):
+            # PEP 552: timestamp-based pyc
+            return MAGIC_NUMBER + struct.pack('<III', 0, mtime, size)
+
+        elif sys.version_info[0:2] > (3, 2):
+            return MAGIC_NUMBER + struct.pack('<II', mtime, size)
+
+        else:
+            return MAGIC_NUMBER + struct.pack('<I', mtime)
+
+    def _storeBytecode(self, pyfile, source, code):
+        if self.pySource:
+            mtime = os.stat(pyfile).st_mtime
+
+        else:
+            mtime = time.time()
+
+        pycfile = self.getBytecodeFile(pyfile)
+
+        self._writeFile(pycfile, self._genBytecodeHeader(mtime, len(source)) + marshal.dumps(code))
+
+        debug.logger & debug.flagWriter and debug.logger('created file %s' % pycfile)
+
+    def _removeFile(self, filename):
+        if os.access(filename, os.F_OK):
             try:
-                if sys.version_info[0:2] > (3, 1):
-                    # noinspection PyArgumentList
-                    py_compile.compile(pyfile, doraise=True, optimize=self.pyOptimizationLevel)
+                os.unlink(filename)
 
-                else:
-                    py_compile.compile(pyfile, doraise=True)
+            except OSError:
+                raise error.PySmiWriterError(
+                    'failure removing file %s: %s' % (filename, sys.exc_info()[1]), file=filename, writer=self)
 
-            except (SyntaxError, py_compile.PyCompileError):
-                pass  # XXX
+    def _writeFile(self, filename, data):
+        dirname = os.path.dirname(filename)
 
-            except Exception:
-                if pyfile and os.access(pyfile, os.F_OK):
-                    os.unlink(pyfile)
+        tfile = None
 
-                raise error.PySmiWriterError('failure compiling %s: %s' % (pyfile, sys.exc_info()[1]), file=mibname, writer=self)
+        try:
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
 
-        debug.logger & debug.flagWriter and debug.logger('%s stored' % mibname)
+            fd, tfile = tempfile.mkstemp(dir=dirname)
+            os.write(fd, data)
+            os.close(fd)
+            os.rename(tfile, filename)
+
+        except (OSError, IOError):
+            exc = sys.exc_info()
+            if tfile and os.access(tfile, os.F_OK):
+                os.unlink(tfile)
+
+            raise error.PySmiWriterError('failure writing file %s: %s' % (filename, exc[1]), file=filename, writer=self)
 
     def getData(self, filename):
         return ''
@@ -14,9 +14,12 @@ import shutil
 from datetime import datetime
 from pysmi.reader import FileReader, getReadersFromUrls
 from pysmi.writer import CallbackWriter
-from pysmi.parser import SmiV1CompatParser
+from pysmi.lexer.header import scanHeader
+from pysmi.parser import SmiV1CompatParser, CachingParser
 from pysmi.codegen import JsonCodeGen
 from pysmi.compiler import MibCompiler
+from pysmi.cache import DirectoryCache
+from pysmi.compat import decode
 from pysmi import debug
 from pysmi import error
 
@@ -46,7 +49,7 @@ Usage: %s [--help]
       [--dry-run]
       <SOURCE [SOURCE...]> <DESTINATION>
 Where:
-    URI      - file, zip, http, https, ftp, sftp schemes are supported.
+    URI      - file, zip, tar, http, https, ftp, sftp schemes are supported.
                Use @mib@ placeholder token in URI to refer directly to
                the required MIB module when source does not support
                directory listing (e.g. HTTP).
@@ -79,6 +82,9 @@ Synopsis:
   MIB module name *if* there is no such file already or its revision date
   is older.
 
+  Only MIB header is scanned when it is well-formed, so MIBs with broken
+  bodies get copied as well.
+
 Documentation:
   http://snmplabs.com/pysmi
 %s
@@ -140,11 +146,42 @@ codeGenerator = JsonCodeGen()
 
 mibParser = SmiV1CompatParser(tempdir=cacheDirectory)
 
+if cacheDirectory:
+    mibParser = CachingParser(
+        mibParser, DirectoryCache(os.path.join(cacheDirectory, 'asts'))
+    )
+
 fileWriter = CallbackWriter(lambda *x: None)
 
 
 def getMibRevision(mibDir, mibFile):
 
+    try:
+        fp = open(os.path.join(mibDir, mibFile), 'rb')
+        mibData = fp.read()
+        fp.close()
+
+    except (OSError, IOError):
+        raise error.PySmiError('Can\'t read MIB "%s": %s' % (os.path.join(mibDir, mibFile), sys.exc_info()[1]))
+
+    # MIB header is normally enough to tell MIB name and revision
+    try:
+        mibInfo = scanHeader(decode(mibData))
+
+    except error.PySmiError:
+        if verboseFlag:
+            sys.stderr.write('Failed to scan MIB "%s" header, parsing the whole MIB: '
+                             '%s\r\n' % (os.path.join(mibDir, mibFile), sys.exc_info()[1]))
+
+    else:
+        try:
+            revision = datetime.strptime(mibInfo.revision, '%Y-%m-%d %H:%M')
+
+        except Exception:
+            revision = datetime.fromtimestamp(0)
+
+        return mibInfo.name, revision
+
     mibCompiler = MibCompiler(
         mibParser,
         codeGenerator,
@@ -10,13 +10,14 @@
 import os
 import sys
 import getopt
-from pysmi.reader import getReadersFromUrls
+from pysmi.reader import getReadersFromUrls, HttpReader, FtpReader, CachingReader
 from pysmi.searcher import AnyFileSearcher, PyFileSearcher, PyPackageSearcher, StubSearcher
 from pysmi.borrower import AnyFileBorrower, PyFileBorrower
 from pysmi.writer import PyFileWriter, FileWriter, CallbackWriter
-from pysmi.parser import SmiV1CompatParser
+from pysmi.parser import SmiV1CompatParser, CachingParser
 from pysmi.codegen import PySnmpCodeGen, JsonCodeGen, NullCodeGen
 from pysmi.compiler import MibCompiler
+from pysmi.cache import DirectoryCache
 from pysmi import debug
 from pysmi import error
 
@@ -48,6 +49,7 @@ pyOptimizationLevel = 0
 ignoreErrorsFlag = False
 buildIndexFlag = False
 writeMibsFlag = True
+workersCount = 0
 
 helpMessage = """\
 Usage: %s [--help]
@@ -73,9 +75,10 @@ Usage: %s [--help]
       [--no-mib-writes]
       [--generate-mib-texts]
       [--keep-texts-layout]
+      [--workers=<N>]
       <MIB-NAME> [MIB-NAME [...]]]
 Where:
-    URI      - file, zip, http, https, ftp, sftp schemes are supported. 
+    URI      - file, zip, tar, http, https, ftp, sftp schemes are supported. 
                Use @mib@ placeholder token in URI to refer directly to
                the required MIB module when source does not support
                directory listing (e.g. HTTP).
@@ -95,7 +98,8 @@ try:
          'destination-directory=', 'cache-directory=', 'no-dependencies',
          'no-python-compile', 'python-optimization-level=', 'ignore-errors',
          'build-index', 'rebuild', 'dry-run', 'no-mib-writes',
-         'generate-mib-texts', 'disable-fuzzy-source', 'keep-texts-layout']
+         'generate-mib-texts', 'disable-fuzzy-source', 'keep-texts-layout',
+         'workers=']
     )
 
 except getopt.GetoptError:
@@ -194,6 +198,14 @@ Software documentation and support at http://snmplabs.com/pysmi
     if opt[0] == '--keep-texts-layout':
         keepTextsLayout = True
 
+    if opt[0] == '--workers':
+        try:
+            workersCount = int(opt[1])
+
+        except ValueError:
+            sys.stderr.write('ERROR: number of workers must be an integer\r\n%s\r\n' % helpMessage)
+            sys.exit(EX_USAGE)
+
 if not mibSources:
     mibSources = ['file:///usr/share/snmp/mibs',
                   'http://mibs.snmplabs.com/asn1/@mib@']
@@ -244,10 +256,11 @@ if dstFormat == 'pysnmp':
 
     searchers.append(StubSearcher(*mibStubs))
 
-    codeGenerator = PySnmpCodeGen()
+    codeGenerator = PySnmpCodeGen(nativeEmitter=True)
 
     fileWriter = PyFileWriter(dstDirectory).setOptions(pyCompile=pyCompileFlag,
-                                                       pyOptimizationLevel=pyOptimizationLevel)
+                                                       pyOptimizationLevel=pyOptimizationLevel,
+                                                       pyCompileWorkers=workersCount > 1 and workersCount or 0)
 
 elif dstFormat == 'json':
     if not mibStubs:
@@ -317,6 +330,7 @@ Generate OID->MIB index: %s
 Generate texts in MIBs: %s
 Keep original texts layout: %s
 Try various file names while searching for MIB module: %s
+Parallel parser processes: %s
 """ % (', '.join(mibSources),
        ', '.join([x[0] for x in mibBorrowers if x[1] == genMibTextsFlag]),
        ', '.join(mibSearchers),
@@ -336,23 +350,46 @@ Try various file names while searching for MIB module: %s
        buildIndexFlag and 'yes' or 'no',
        genMibTextsFlag and 'yes' or 'no',
        keepTextsLayout and 'yes' or 'no',
-       doFuzzyMatchingFlag and 'yes' or 'no'))
+       doFuzzyMatchingFlag and 'yes' or 'no',
+       workersCount > 1 and workersCount or 'not used'))
 
 # Initialize compiler infrastructure
 
+mibParser = SmiV1CompatParser(tempdir=cacheDirectory)
+
+if cacheDirectory:
+    mibParser = CachingParser(
+        mibParser, DirectoryCache(os.path.join(cacheDirectory, 'asts'))
+    )
+
+if cacheDirectory and hasattr(codeGenerator, 'setBytecodeCache'):
+    codeGenerator.setBytecodeCache(
+        DirectoryCache(os.path.join(cacheDirectory, 'templates'))
+    )
+
 mibCompiler = MibCompiler(
-    SmiV1CompatParser(tempdir=cacheDirectory),
+    mibParser,
     codeGenerator,
     fileWriter
 )
 
+if cacheDirectory:
+    mibCompiler.setSymbolTableCache(
+        DirectoryCache(os.path.join(cacheDirectory, 'symtables'))
+    )
+
 try:
-    mibCompiler.addSources(
-        *getReadersFromUrls(
-            *mibSources, **dict(fuzzyMatching=doFuzzyMatchingFlag)
-        )
+    readers = getReadersFromUrls(
+        *mibSources, **dict(fuzzyMatching=doFuzzyMatchingFlag)
     )
 
+    if cacheDirectory:
+        readers = [isinstance(x, (HttpReader, FtpReader)) and CachingReader(
+            x, DirectoryCache(os.path.join(cacheDirectory, 'mibs'))) or x
+                   for x in readers]
+
+    mibCompiler.addSources(*readers)
+
     mibCompiler.addSearchers(*searchers)
 
     mibCompiler.addBorrowers(*borrowers)
@@ -365,7 +402,8 @@ try:
                            genTexts=genMibTextsFlag,
                            textFilter=keepTextsLayout and (lambda symbol, text: text) or None,
                            writeMibs=writeMibsFlag,
-                           ignoreErrors=ignoreErrorsFlag)
+                           ignoreErrors=ignoreErrorsFlag,
+                           workers=workersCount)
     )
 
     if buildIndexFlag:
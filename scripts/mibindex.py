@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+# SNMP SMI/MIB index building tool
+#
+import os
+import sys
+import getopt
+from pysmi.reader import FileReader
+from pysmi import debug
+from pysmi import error
+
+# sysexits.h
+EX_OK = 0
+EX_USAGE = 64
+EX_SOFTWARE = 70
+
+# Defaults
+quietFlag = False
+verboseFlag = False
+recursiveFlag = True
+staleOnlyFlag = False
+dryrunFlag = False
+
+helpMessage = """\
+Usage: %s [--help]
+      [--version]
+      [--verbose]
+      [--quiet]
+      [--debug=<%s>]
+      [--no-recursion]
+      [--stale-only]
+      [--dry-run]
+      <DIRECTORY [DIRECTORY...]>
+""" % (
+    sys.argv[0],
+    '|'.join([x for x in sorted(debug.flagMap)])
+)
+
+try:
+    opts, directories = getopt.getopt(
+        sys.argv[1:], 'hv',
+        ['help', 'version', 'verbose', 'quiet', 'debug=',
+         'no-recursion', 'stale-only', 'dry-run']
+    )
+
+except getopt.GetoptError:
+    sys.exit(EX_USAGE)
+
+for opt in opts:
+    if opt[0] == '-h' or opt[0] == '--help':
+        sys.stderr.write("""\
+Synopsis:
+  SNMP SMI/MIB files indexing tool. Scans MIB files in the given
+  directory(ies), figures out canonical MIB module name of each file
+  and writes MIB name to file name mapping into the .index file in
+  each directory. The index file lets pysmi locate MIBs which are
+  not named after their canonical MIB names.
+
+Documentation:
+  http://snmplabs.com/pysmi
+%s
+""" % helpMessage)
+        sys.exit(EX_OK)
+
+    if opt[0] == '-v' or opt[0] == '--version':
+        from pysmi import __version__
+
+        sys.stderr.write("""\
+SNMP SMI/MIB library version %s, written by Ilya Etingof <etingof@gmail.com>
+Python interpreter: %s
+Software documentation and support at http://snmplabs.com/pysmi
+%s
+""" % (__version__, sys.version, helpMessage))
+        sys.exit(EX_OK)
+
+    if opt[0] == '--quiet':
+        quietFlag = True
+
+    if opt[0] == '--verbose':
+        verboseFlag = True
+
+    if opt[0] == '--debug':
+        debug.setLogger(debug.Debug(*opt[1].split(',')))
+
+    if opt[0] == '--no-recursion':
+        recursiveFlag = False
+
+    if opt[0] == '--stale-only':
+        staleOnlyFlag = True
+
+    if opt[0] == '--dry-run':
+        dryrunFlag = True
+
+if not directories:
+    sys.stderr.write('ERROR: MIB directory argument(s) not given\r\n%s\r\n' % helpMessage)
+    sys.exit(EX_USAGE)
+
+exitCode = EX_OK
+
+for directory in directories:
+    if not os.path.isdir(directory):
+        sys.stderr.write('ERROR: %s is not a directory\r\n%s\r\n' % (directory, helpMessage))
+        sys.exit(EX_USAGE)
+
+    reader = FileReader(directory, recursive=recursiveFlag)
+
+    indexFile = os.path.join(directory, reader.indexFile)
+
+    if (staleOnlyFlag and os.path.exists(indexFile) and
+            not reader.isIndexStale()):
+        if verboseFlag:
+            sys.stderr.write('MIB index "%s" is up to date\r\n' % indexFile)
+
+        continue
+
+    if verboseFlag:
+        sys.stderr.write('Indexing "%s"...\r\n' % directory)
+
+    try:
+        mibIndex = reader.buildIndex()
+
+        if not dryrunFlag:
+            reader.saveIndex(indexFile, mibIndex)
+
+    except error.PySmiError:
+        sys.stderr.write('ERROR: %s\r\n' % sys.exc_info()[1])
+        exitCode = EX_SOFTWARE
+        continue
+
+    if verboseFlag:
+        for mibname in sorted(mibIndex):
+            sys.stderr.write('%s -> %s\r\n' % (mibname, mibIndex[mibname]))
+
+    if not quietFlag:
+        sys.stderr.write('%s "%s": %d MIB(s) indexed\r\n' % (
+            dryrunFlag and 'WOULD WRITE' or 'WROTE', indexFile, len(mibIndex)))
+
+sys.exit(exitCode)
@@ -113,6 +113,7 @@ params.update({
         'pysmi.searcher',
         'pysmi.lexer',
         'pysmi.parser',
+        'pysmi.parser.tables',
         'pysmi.codegen',
         'pysmi.borrower',
         'pysmi.writer'
@@ -125,7 +126,8 @@ params.update({
         ],
     },
     'scripts': [os.path.join('scripts', 'mibdump.py'),
-                os.path.join('scripts', 'mibcopy.py')]
+                os.path.join('scripts', 'mibcopy.py'),
+                os.path.join('scripts', 'mibindex.py')]
 })
 
 # handle unittest discovery feature
@@ -153,4 +155,25 @@ if unittest:
 
     params['cmdclass'] = {'test': PyTest}
 
+
+class BuildParserTables(Command):
+    description = 'regenerate pre-built parser tables'
+    user_options = []
+
+    def initialize_options(self): pass
+
+    def finalize_options(self): pass
+
+    def run(self):
+        from pysmi.parser.smi import writeParserTables, checkParserTables
+
+        writeParserTables(os.path.join('pysmi', 'parser', 'tables'))
+
+        staleModules = checkParserTables()
+        if staleModules:
+            raise SystemExit('stale parser tables: %s' % ', '.join(staleModules))
+
+
+params.setdefault('cmdclass', {})['build_tables'] = BuildParserTables
+
 setup(**params)
@@ -12,6 +12,21 @@ except ImportError:
 
 suite = unittest.TestLoader().loadTestsFromNames(
     ['test_zipreader',
+     'test_tarreader',
+     'test_filereader',
+     'test_ftpreader',
+     'test_httpreader',
+     'test_compiler',
+     'test_pyfilewriter',
+     'test_codegentemplates',
+     'test_pysnmpemitter',
+     'test_parsercache',
+     'test_headerscanner',
+     'test_parsertables',
+     'test_parserpool',
+     'test_parserthreads',
+     'test_parsertexts',
+     'test_symtable',
      'test_agentcapabilities_smiv2_pysnmp',
      'test_imports_smiv2_pysnmp',
      'test_modulecompliance_smiv2_pysnmp',
@@ -0,0 +1,148 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import gc
+import os
+import sys
+import shutil
+import tempfile
+import weakref
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi.codegen.jsondoc import JsonCodeGen
+from pysmi.codegen.pysnmp import PySnmpCodeGen
+from pysmi.codegen import jenv
+from pysmi.cache import DirectoryCache
+from pysmi import error
+
+
+class CodegenTemplatesTestCase(unittest.TestCase):
+    """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+testObject OBJECT-TYPE
+    SYNTAX          Integer32
+    MAX-ACCESS      read-only
+    STATUS          current
+    DESCRIPTION     "Test object"
+  ::= { 1 3 }
+
+END
+ """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, self.path)
+
+        ast = parserFactory()().parse(self.__class__.__doc__)[0]
+        mibInfo, symtable = SymtableCodeGen().genCode(ast, {})
+
+        self.ast = ast
+        self.symtable = {mibInfo.name: symtable}
+
+    def testEnvironmentReused(self):
+        template = jenv.getTemplate(PySnmpCodeGen.TEMPLATE_NAME)
+
+        self.assertTrue(jenv.getTemplate(PySnmpCodeGen.TEMPLATE_NAME) is template)
+
+        codegen = PySnmpCodeGen()
+
+        mibInfo, text = codegen.genCode(self.ast, self.symtable)
+        mibInfo, otherText = PySnmpCodeGen().genCode(self.ast, self.symtable)
+
+        self.assertEqual(text, otherText)
+
+        self.assertTrue(jenv.getTemplate(PySnmpCodeGen.TEMPLATE_NAME) is template)
+
+    def testCustomTemplate(self):
+        dstTemplate = os.path.join(self.path, 'custom.j2')
+
+        with open(dstTemplate, 'w') as fp:
+            fp.write('{{ mib.meta.module | capfirst }}')
+
+        mibInfo, text = JsonCodeGen().genCode(self.ast, self.symtable, dstTemplate=dstTemplate)
+
+        self.assertEqual(text, 'TEST-MIB')
+
+    def testMissingTemplate(self):
+        self.assertRaises(
+            error.PySmiCodegenError, JsonCodeGen().genCode,
+            self.ast, self.symtable, dstTemplate=os.path.join(self.path, 'missing.j2')
+        )
+
+    def testBytecodeCache(self):
+        mibInfo, text = JsonCodeGen().genCode(self.ast, self.symtable)
+
+        cacheDir = os.path.join(self.path, 'templates')
+
+        codegen = JsonCodeGen()
+        codegen.setBytecodeCache(DirectoryCache(cacheDir))
+
+        mibInfo, cachedText = codegen.genCode(self.ast, self.symtable)
+
+        self.assertEqual(cachedText, text)
+        self.assertTrue(os.listdir(cacheDir))
+
+    def testEnvironmentReleased(self):
+        codegen = JsonCodeGen()
+        codegen.setBytecodeCache(DirectoryCache(os.path.join(self.path, 'templates')))
+
+        codegen.genCode(self.ast, self.symtable)
+
+        ref = weakref.ref(codegen._bytecodeCache)
+
+        del codegen
+
+        gc.collect()
+
+        # cache adapter and its environment are not kept around
+        self.assertTrue(ref() is None)
+
+    def testBytecodeReused(self):
+        store = {}
+        hits = []
+
+        class DictCache(object):
+            def get(self, key):
+                if key in store:
+                    hits.append(key)
+                return store.get(key)
+
+            def put(self, key, value):
+                store[key] = value
+
+        codegen = JsonCodeGen()
+        codegen.setBytecodeCache(DictCache())
+
+        mibInfo, text = codegen.genCode(self.ast, self.symtable)
+
+        self.assertTrue(store)
+        self.assertFalse(hits)
+
+        # as if in another process
+        codegen = JsonCodeGen()
+        codegen.setBytecodeCache(DictCache())
+
+        mibInfo, cachedText = codegen.genCode(self.ast, self.symtable)
+
+        self.assertEqual(cachedText, text)
+        self.assertEqual(sorted(hits), sorted(store))
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
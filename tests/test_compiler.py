@@ -0,0 +1,386 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import json
+import shutil
+import tempfile
+
+try:
+    import asyncio
+
+except ImportError:
+    asyncio = None
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.reader.callback import CallbackReader
+from pysmi.writer.callback import CallbackWriter
+from pysmi.searcher.stub import StubSearcher
+from pysmi.parser.smi import parserFactory
+from pysmi.codegen.jsondoc import JsonCodeGen
+from pysmi.compiler import MibCompiler, AsyncMibCompiler
+from pysmi.cache import DirectoryCache, NotFoundCache
+from pysmi import error
+
+
+class CompilerTestCase(unittest.TestCase):
+
+    mibs = {
+        'SNMPv2-SMI': """
+SNMPv2-SMI DEFINITIONS ::= BEGIN
+
+iso OBJECT IDENTIFIER ::= { 1 }
+org OBJECT IDENTIFIER ::= { iso 3 }
+dod OBJECT IDENTIFIER ::= { org 6 }
+internet OBJECT IDENTIFIER ::= { dod 1 }
+private OBJECT IDENTIFIER ::= { internet 4 }
+enterprises OBJECT IDENTIFIER ::= { private 1 }
+
+END
+""",
+        'TEST-BASE-MIB': """
+TEST-BASE-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  enterprises
+    FROM SNMPv2-SMI;
+
+testBase OBJECT IDENTIFIER ::= { enterprises 12345 }
+
+END
+""",
+        'TEST-MIB': """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  testBase
+    FROM TEST-BASE-MIB;
+
+testObjects OBJECT IDENTIFIER ::= { testBase 1 }
+
+END
+""",
+        'OTHER-TEST-MIB': """
+OTHER-TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  testObjects
+    FROM TEST-MIB;
+
+otherTestObjects OBJECT IDENTIFIER ::= { testObjects 2 }
+
+END
+""",
+        'BROKEN-TEST-MIB': """
+BROKEN-TEST-MIB DEFINITIONS ::= BEGIN
+
+brokenObject OBJECT IDENTIFIER := { 1 2 }
+
+END
+"""
+    }
+
+    def compileMibs(self, *mibnames, **options):
+        compilerClass = options.pop('compilerClass', MibCompiler)
+
+        written = {}
+
+        def putData(mibname, data, cbCtx):
+            mib = json.loads(data)
+            mib.pop('meta', None)
+            written[mibname] = mib
+
+        mibCompiler = compilerClass(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(putData)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        processed = mibCompiler.compile(*mibnames, **options)
+
+        return processed, written
+
+    def testSerialCompile(self):
+        processed, written = self.compileMibs('OTHER-TEST-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['OTHER-TEST-MIB'], 'compiled')
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(processed['SNMPv2-TC'], 'missing')
+        self.assertEqual(
+            written['OTHER-TEST-MIB']['otherTestObjects']['oid'],
+            '1.3.6.1.4.1.12345.1.2'
+        )
+
+    def testEarlyWrites(self):
+        log = []
+
+        def getData(mibname, cbCtx):
+            log.append(('read', mibname))
+            return self.mibs.get(mibname)
+
+        def putData(mibname, data, cbCtx):
+            log.append(('write', mibname))
+
+        mibCompiler = MibCompiler(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(putData)
+        )
+
+        mibCompiler.addSources(CallbackReader(getData))
+
+        processed = mibCompiler.compile(
+            'SNMPv2-SMI', 'OTHER-TEST-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['OTHER-TEST-MIB'], 'compiled')
+
+        # base MIB gets written before its distant dependents are even read
+        self.assertTrue(
+            log.index(('write', 'SNMPv2-SMI')) < log.index(('read', 'TEST-BASE-MIB'))
+        )
+
+    def testWritesPostponedOnFailure(self):
+        processed, written = self.compileMibs('SNMPv2-SMI', 'BROKEN-TEST-MIB')
+
+        self.assertEqual(processed['SNMPv2-SMI'], 'unprocessed')
+        self.assertFalse(written)
+
+    def testSymbolTableCache(self):
+        cacheDir = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, cacheDir)
+
+        parsed = []
+
+        class Parser(parserFactory()):
+            def parse(self, data, **kwargs):
+                mibs = parserFactory().parse(self, data, **kwargs)
+                parsed.extend([x[0] for x in mibs])
+                return mibs
+
+        mibCompiler = MibCompiler(
+            Parser(), JsonCodeGen(), CallbackWriter(lambda *x: None)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        mibCompiler.addSearchers(StubSearcher('SNMPv2-SMI', 'TEST-BASE-MIB'))
+
+        mibCompiler.setSymbolTableCache(DirectoryCache(cacheDir))
+
+        processed = mibCompiler.compile('TEST-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(sorted(parsed), ['SNMPv2-SMI', 'TEST-BASE-MIB', 'TEST-MIB'])
+
+        del parsed[:]
+
+        processed = mibCompiler.compile('TEST-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(processed['TEST-BASE-MIB'], 'untouched')
+
+        # only the MIB being transformed needs AST
+        self.assertEqual(parsed, ['TEST-MIB'])
+
+    def testParallelCompile(self):
+        mibnames = 'OTHER-TEST-MIB', 'TEST-MIB', 'BROKEN-TEST-MIB'
+
+        serialProcessed, serialWritten = self.compileMibs(
+            *mibnames, ignoreErrors=True)
+
+        processed, written = self.compileMibs(
+            *mibnames, ignoreErrors=True, workers=2)
+
+        self.assertEqual(processed, serialProcessed)
+        self.assertEqual(written, serialWritten)
+        self.assertEqual(processed['BROKEN-TEST-MIB'], 'failed')
+
+    def testParallelCompileFailure(self):
+        processed, written = self.compileMibs(
+            'TEST-MIB', 'BROKEN-TEST-MIB', workers=2)
+
+        self.assertEqual(processed['TEST-MIB'], 'unprocessed')
+        self.assertEqual(processed['BROKEN-TEST-MIB'], 'failed')
+        self.assertFalse(written)
+
+    def testNotFoundCache(self):
+        cacheDir = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, cacheDir)
+
+        lookups = []
+
+        def getData(mibname, cbCtx):
+            lookups.append(mibname)
+            return self.mibs.get(mibname)
+
+        class MissingMibReader(CallbackReader):
+            def getData(self, mibname, **options):
+                try:
+                    return CallbackReader.getData(self, mibname, **options)
+
+                except error.PySmiReaderFileNotFoundError:
+                    sys.exc_info()[1].missing = True
+                    raise
+
+        reader = MissingMibReader(getData)
+
+        for ttl in (300, 300, -1):
+            mibCompiler = MibCompiler(
+                parserFactory()(), JsonCodeGen(), CallbackWriter(lambda *x: None)
+            )
+
+            mibCompiler.addSources(reader)
+
+            mibCompiler.setNotFoundCache(NotFoundCache(ttl, DirectoryCache(cacheDir)))
+
+            processed = mibCompiler.compile('UNKNOWN-MIB')
+
+            self.assertEqual(processed['UNKNOWN-MIB'], 'missing')
+
+        # second lookup is answered by the cache, third one has expired
+        self.assertEqual(lookups, ['UNKNOWN-MIB', 'UNKNOWN-MIB'])
+
+    def testNotFoundCacheIgnoresFailures(self):
+        lookups = []
+
+        def getData(mibname, cbCtx):
+            lookups.append(mibname)
+            return self.mibs.get(mibname)
+
+        mibCompiler = MibCompiler(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(lambda *x: None)
+        )
+
+        mibCompiler.addSources(CallbackReader(getData))
+
+        mibCompiler.setNotFoundCache(NotFoundCache(300))
+
+        for _ in range(2):
+            processed = mibCompiler.compile('UNKNOWN-MIB')
+
+            self.assertEqual(processed['UNKNOWN-MIB'], 'missing')
+
+        # MIB is not known to be missing for sure
+        self.assertEqual(lookups, ['UNKNOWN-MIB', 'UNKNOWN-MIB'])
+
+    def testIncrementalCompile(self):
+        log = []
+
+        def putData(mibname, data, cbCtx):
+            log.append(('write', mibname))
+
+        mibCompiler = MibCompiler(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(putData)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        for mibname, status in mibCompiler.icompile('OTHER-TEST-MIB', 'BROKEN-TEST-MIB'):
+            log.append((status, mibname))
+
+        # each MIB is reported right after it is written
+        self.assertEqual(
+            log[:6],
+            [('write', 'SNMPv2-SMI'), ('compiled', 'SNMPv2-SMI'),
+             ('write', 'TEST-BASE-MIB'), ('compiled', 'TEST-BASE-MIB'),
+             ('write', 'TEST-MIB'), ('compiled', 'TEST-MIB')]
+        )
+
+        self.assertTrue(('failed', 'BROKEN-TEST-MIB') in log)
+        self.assertTrue(('missing', 'SNMPv2-TC') in log)
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def testAsyncCompile(self):
+        mibnames = 'OTHER-TEST-MIB', 'TEST-MIB', 'BROKEN-TEST-MIB'
+
+        serialProcessed, serialWritten = self.compileMibs(
+            *mibnames, ignoreErrors=True)
+
+        processed, written = self.compileMibs(
+            *mibnames, ignoreErrors=True, compilerClass=AsyncMibCompiler)
+
+        self.assertEqual(processed, serialProcessed)
+        self.assertEqual(written, serialWritten)
+
+        processed, written = self.compileMibs(
+            *mibnames, ignoreErrors=True, workers=2, compilerClass=AsyncMibCompiler)
+
+        self.assertEqual(processed, serialProcessed)
+        self.assertEqual(written, serialWritten)
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def testCompileAsync(self):
+        mibCompiler = AsyncMibCompiler(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(lambda *x: None)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            processed = loop.run_until_complete(
+                mibCompiler.compileAsync('TEST-MIB', ignoreErrors=True, loop=loop))
+
+        finally:
+            loop.close()
+
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(processed['SNMPv2-SMI'], 'compiled')
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def testConcurrentCompileAsync(self):
+        mibCompiler = AsyncMibCompiler(
+            parserFactory()(), JsonCodeGen(), CallbackWriter(lambda *x: None)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        loop = asyncio.new_event_loop()
+
+        results = []
+
+        def compileAll():
+            # called by the running loop which is picked up by default
+            fetched = asyncio.gather(
+                *[mibCompiler.compileAsync(x, ignoreErrors=True)
+                  for x in ('TEST-MIB', 'OTHER-TEST-MIB') * 4]
+            )
+
+            fetched.add_done_callback(lambda x: (results.extend(x.result()), loop.stop()))
+
+        loop.call_soon(compileAll)
+
+        try:
+            loop.run_forever()
+
+        finally:
+            loop.close()
+
+        self.assertEqual(len(results), 8)
+
+        for processed in results:
+            self.assertEqual(processed['TEST-MIB'], 'compiled')
+
+        self.assertEqual(results[1]['OTHER-TEST-MIB'], 'compiled')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
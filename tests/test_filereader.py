@@ -0,0 +1,209 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import os
+import time
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.reader.localfile import FileReader
+from pysmi import error
+
+
+class FileReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.mtime = time.time() - 100
+
+        self.addCleanup(shutil.rmtree, self.path)
+
+        os.mkdir(os.path.join(self.path, 'subdir'))
+
+        self.putFile('testA.txt', 'testA')
+        self.putFile(os.path.join('subdir', 'TEST-B-MIB.my'), 'testB')
+
+    def putFile(self, filename, data):
+        f = os.path.join(self.path, filename)
+
+        fp = open(f, 'w')
+        fp.write(data)
+        fp.close()
+
+        # make sure directory mtime changes
+        self.mtime += 1
+        os.utime(os.path.dirname(f), (self.mtime, self.mtime))
+
+    def testGetFile(self):
+        reader = FileReader(self.path)
+
+        mibinfo, data = reader.getData('testA')
+
+        self.assertEqual(mibinfo.file, 'testA.txt')
+        self.assertEqual(data, 'testA')
+
+    def testGetFileInSubdir(self):
+        reader = FileReader(self.path)
+
+        mibinfo, data = reader.getData('TEST-B')
+
+        self.assertEqual(mibinfo.file, 'TEST-B-MIB.my')
+        self.assertEqual(data, 'testB')
+
+    def testGetFileCaseInsensitive(self):
+        reader = FileReader(self.path)
+
+        mibinfo, data = reader.getData('TESTA')
+
+        self.assertEqual(mibinfo.file, 'testA.txt')
+
+    def testGetMissingFile(self):
+        reader = FileReader(self.path)
+
+        self.assertRaises(error.PySmiReaderFileNotFoundError, reader.getData, 'testC')
+
+    def testListingReused(self):
+        reader = FileReader(self.path)
+
+        reader.getData('testA')
+
+        listdir = os.listdir
+
+        def failingListdir(path):
+            raise AssertionError('directory %s listed again' % path)
+
+        os.listdir = failingListdir
+
+        try:
+            mibinfo, data = reader.getData('TEST-B')
+
+        finally:
+            os.listdir = listdir
+
+        self.assertEqual(data, 'testB')
+
+    def testListingInvalidated(self):
+        reader = FileReader(self.path)
+
+        self.assertRaises(error.PySmiReaderFileNotFoundError, reader.getData, 'testC')
+
+        self.putFile(os.path.join('subdir', 'testC'), 'testC')
+
+        mibinfo, data = reader.getData('testC')
+
+        self.assertEqual(data, 'testC')
+
+
+    def testWriteIndex(self):
+        self.putFile(os.path.join('subdir', 'vendor.mib'), 'VENDOR-MIB DEFINITIONS ::= BEGIN END')
+
+        reader = FileReader(self.path)
+
+        self.assertEqual(reader.writeIndex(), {'VENDOR-MIB': os.path.join('subdir', 'vendor.mib')})
+
+        self.assertEqual(
+            FileReader.loadIndex(os.path.join(self.path, FileReader.indexFile)),
+            {'VENDOR-MIB': os.path.join('subdir', 'vendor.mib')}
+        )
+
+        self.assertFalse(FileReader(self.path).isIndexStale())
+
+        mibinfo, data = FileReader(self.path).getData('VENDOR-MIB')
+
+        self.assertEqual(mibinfo.file, os.path.join('subdir', 'vendor.mib'))
+
+    def testStaleIndex(self):
+        FileReader(self.path).writeIndex()
+
+        indexFile = os.path.join(self.path, FileReader.indexFile)
+        os.utime(indexFile, (self.mtime, self.mtime))
+
+        self.putFile(os.path.join('subdir', 'v1.txt'), 'VENDOR-MIB DEFINITIONS ::= BEGIN END')
+
+        reader = FileReader(self.path)
+
+        self.assertTrue(reader.isIndexStale())
+
+        reader.setOptions(autoIndex=False)
+
+        # index file does not know about new MIB, fuzzy matching still works
+        self.assertRaises(error.PySmiReaderFileNotFoundError, reader.getData, 'VENDOR-MIB')
+
+        reader._rebuildIndex()
+
+        mibinfo, data = reader.getData('VENDOR-MIB')
+
+        self.assertEqual(mibinfo.file, os.path.join('subdir', 'v1.txt'))
+
+        self.assertFalse(FileReader(self.path).isIndexStale())
+
+    def testStaleIndexNonRecursive(self):
+        FileReader(self.path, recursive=False).writeIndex()
+
+        indexFile = os.path.join(self.path, FileReader.indexFile)
+        os.utime(indexFile, (self.mtime, self.mtime))
+        os.utime(self.path, (self.mtime, self.mtime))
+
+        self.assertFalse(FileReader(self.path, recursive=False).isIndexStale())
+
+        self.putFile('v1.txt', 'VENDOR-MIB DEFINITIONS ::= BEGIN END')
+
+        self.assertTrue(FileReader(self.path, recursive=False).isIndexStale())
+
+    def testHandWrittenIndexNeverStale(self):
+        self.putFile(FileReader.indexFile, 'TEST-A-MIB testA.txt\n')
+        self.putFile(os.path.join('subdir', 'testC'), 'testC')
+
+        self.assertFalse(FileReader(self.path).isIndexStale())
+
+        mibinfo, data = FileReader(self.path).getData('TEST-A-MIB')
+
+        self.assertEqual(mibinfo.file, 'testA.txt')
+
+    def testMemoryMappedRead(self):
+
+        class MmapFileReader(FileReader):
+            mmapThreshold = 1
+
+        f = os.path.join(self.path, 'testC.txt')
+
+        fp = open(f, 'wb')
+        fp.write(b'testC \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xff')
+        fp.close()
+
+        mibinfo, data = MmapFileReader(self.path).getData('testC')
+
+        self.assertEqual(data, b'testC \xd1\x82\xd0\xb5\xd1\x81\xd1\x82'.decode('utf-8'))
+
+        mibinfo, data = FileReader(self.path).getData('testC')
+
+        self.assertEqual(data, b'testC \xd1\x82\xd0\xb5\xd1\x81\xd1\x82'.decode('utf-8'))
+
+    def testOversizedFile(self):
+
+        class SmallFileReader(FileReader):
+            maxMibSize = 5
+
+        reader = SmallFileReader(self.path, ignoreErrors=False)
+
+        self.assertRaises(error.PySmiError, reader.getData, 'testA')
+
+        reader = SmallFileReader(self.path)
+
+        self.assertRaises(IOError, reader.readFile, os.path.join(self.path, 'testA.txt'))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
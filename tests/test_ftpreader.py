@@ -0,0 +1,180 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import ftplib
+import socket
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.reader.ftpclient import FtpReader
+from pysmi import error
+
+
+class FakeFtp(object):
+    files = {
+        '/mibs/TEST-MIB.txt': 'TEST-MIB DEFINITIONS ::= BEGIN\nEND',
+        '/mibs/other-mib': 'OTHER-MIB DEFINITIONS ::= BEGIN\nEND'
+    }
+
+    log = []
+
+    def connect(self, host, port, timeout):
+        self.log.append('CONNECT')
+
+    def login(self, user, password):
+        self.log.append('LOGIN')
+
+    def close(self):
+        self.log.append('CLOSE')
+
+    def mlsd(self, path='', facts=()):
+        self.log.append('MLSD %s' % path)
+
+        for f in sorted(self.files):
+            if f.startswith(path + '/'):
+                yield f[len(path) + 1:], {'type': 'file', 'modify': '20200101120000'}
+
+        yield '.', {'type': 'cdir'}
+
+    def sendcmd(self, cmd):
+        self.log.append(cmd)
+        raise ftplib.error_perm('500 unknown command')
+
+    def retrlines(self, cmd, callback):
+        self.log.append(cmd)
+
+        if self.log.count('DROP'):
+            self.log.remove('DROP')
+            raise EOFError()
+
+        try:
+            data = self.files[cmd.split()[1]]
+
+        except KeyError:
+            raise ftplib.error_perm('550 no such file')
+
+        for line in data.split('\n'):
+            callback(line)
+
+
+class FtpReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ftp = ftplib.FTP
+        ftplib.FTP = FakeFtp
+        del FakeFtp.log[:]
+
+        self.reader = FtpReader('localhost', '/mibs/@mib@')
+
+    def tearDown(self):
+        ftplib.FTP = self.ftp
+
+    def testConnectionReused(self):
+        mibinfo, data = self.reader.getData('TEST-MIB')
+
+        self.assertEqual(mibinfo.file, 'TEST-MIB.txt')
+        self.assertEqual(data, 'TEST-MIB DEFINITIONS ::= BEGIN\nEND')
+
+        mibinfo, data = self.reader.getData('OTHER-MIB')
+
+        self.assertEqual(mibinfo.file, 'other-mib')
+
+        self.assertEqual(
+            FakeFtp.log,
+            ['CONNECT', 'LOGIN', 'MLSD /mibs',
+             'RETR /mibs/TEST-MIB.txt', 'RETR /mibs/other-mib']
+        )
+
+    def testMtimeFromListing(self):
+        mibinfo, data = self.reader.getData('TEST-MIB')
+
+        self.assertEqual(mibinfo.mtime, 1577880000)
+
+    def getDataFailure(self, reader, mibname):
+        try:
+            reader.getData(mibname)
+
+        except error.PySmiReaderFileNotFoundError:
+            return sys.exc_info()[1]
+
+        self.fail('MIB found')
+
+    def testMissingMib(self):
+        exc = self.getDataFailure(self.reader, 'UNKNOWN-MIB')
+
+        self.assertTrue(exc.missing)
+
+        # nothing fetched remotely
+        self.assertEqual(FakeFtp.log, ['CONNECT', 'LOGIN', 'MLSD /mibs'])
+
+    def testMissingMibWithoutListing(self):
+        reader = FtpReader('localhost', '/mibs/@mib@.txt')
+
+        exc = self.getDataFailure(reader, 'UNKNOWN-MIB')
+
+        self.assertTrue(exc.missing)
+
+    def testConnectFailure(self):
+        connect = FakeFtp.connect
+
+        def failingConnect(self, host, port, timeout):
+            raise socket.error('connection refused')
+
+        FakeFtp.connect = failingConnect
+
+        try:
+            exc = self.getDataFailure(self.reader, 'UNKNOWN-MIB')
+
+        finally:
+            FakeFtp.connect = connect
+
+        self.assertFalse(getattr(exc, 'missing', False))
+
+    def testReconnect(self):
+        self.reader.getData('TEST-MIB')
+
+        FakeFtp.log.append('DROP')
+
+        mibinfo, data = self.reader.getData('OTHER-MIB')
+
+        self.assertEqual(mibinfo.file, 'other-mib')
+
+        self.assertEqual(
+            FakeFtp.log[-6:],
+            ['RETR /mibs/TEST-MIB.txt', 'RETR /mibs/other-mib', 'CLOSE',
+             'CONNECT', 'LOGIN', 'RETR /mibs/other-mib']
+        )
+
+
+    def testRevalidate(self):
+        mibinfo, data = self.reader.getData('TEST-MIB')
+
+        sendcmd = FakeFtp.sendcmd
+        FakeFtp.sendcmd = lambda self, cmd: '213 20200101120000'
+
+        try:
+            self.assertRaises(
+                error.PySmiReaderFileNotModifiedError, self.reader.getDataIfModified, mibinfo)
+
+            mibinfo.lastModified -= 1
+
+            mibinfo, data = self.reader.getDataIfModified(mibinfo)
+
+        finally:
+            FakeFtp.sendcmd = sendcmd
+
+        self.assertEqual(data, 'TEST-MIB DEFINITIONS ::= BEGIN\nEND')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
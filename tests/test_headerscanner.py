@@ -0,0 +1,73 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.lexer.header import scanHeader
+from pysmi import error
+
+
+class HeaderScannerTestCase(unittest.TestCase):
+
+    def testModuleIdentity(self):
+        mibInfo = scanHeader("""
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  MODULE-IDENTITY, -- FROM NOWHERE-MIB
+  enterprises
+    FROM SNMPv2-SMI
+  DisplayString FROM SNMPv2-TC
+  Counter32 FROM SNMPv2-SMI;
+
+testModule MODULE-IDENTITY
+ LAST-UPDATED "200001100000Z"
+ ORGANIZATION "AGENTX"
+ CONTACT-INFO "Test REVISION"
+ DESCRIPTION  "Test"
+ REVISION     "9901100000Z"
+ DESCRIPTION  "Initial revision"
+ REVISION     "9801100000Z"
+ DESCRIPTION  "Older revision"
+ ::= { enterprises 1 }
+
+END
+""")
+        self.assertEqual(mibInfo.name, 'TEST-MIB')
+        self.assertEqual(mibInfo.imported, ('SNMPv2-SMI', 'SNMPv2-TC'))
+        self.assertEqual(mibInfo.revision, '1999-01-10 00:00')
+
+    def testMacros(self):
+        mibInfo = scanHeader("""
+TEST-SMI DEFINITIONS ::= BEGIN
+
+MODULE-IDENTITY MACRO ::=
+BEGIN
+    TYPE NOTATION ::= "REVISION" value(Update ExtUTCTime)
+    VALUE NOTATION ::= value(VALUE OBJECT IDENTIFIER)
+END
+
+iso OBJECT IDENTIFIER ::= { 1 }
+
+END
+""")
+        self.assertEqual(mibInfo.name, 'TEST-SMI')
+        self.assertEqual(mibInfo.imported, ())
+        self.assertEqual(mibInfo.revision, None)
+
+    def testMalformedHeader(self):
+        self.assertRaises(error.PySmiLexerError, scanHeader, 'TEST-MIB ::= BEGIN END')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,96 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import sys
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.parser.dialect import smiV1Relaxed
+from pysmi.parser.cache import CachingParser
+from pysmi.cache import DirectoryCache, FileCache
+
+
+class CachingParserTestCase(unittest.TestCase):
+    """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+testObject OBJECT-TYPE
+    SYNTAX          Integer32
+    MAX-ACCESS      read-only
+    STATUS          current
+    DESCRIPTION     "Test object"
+  ::= { 1 3 }
+
+END
+ """
+
+    def setUp(self):
+        self.cacheDir = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, self.cacheDir)
+
+        self.parsed = parsed = []
+
+        class Parser(parserFactory()):
+            def parse(self, data, **kwargs):
+                parsed.append(data)
+                return parserFactory().parse(self, data, **kwargs)
+
+        self.parser = Parser()
+
+        self.ast = parserFactory()().parse(self.__class__.__doc__)
+
+    def checkCache(self, cache):
+        parser = CachingParser(self.parser, cache)
+
+        self.assertEqual(parser.parse(self.__class__.__doc__), self.ast)
+        self.assertEqual(parser.parse(self.__class__.__doc__), self.ast)
+        self.assertEqual(len(self.parsed), 1)
+
+        # another process picks up what's been cached
+        parser = CachingParser(self.parser, cache.__class__(cache._path))
+
+        self.assertEqual(parser.parse(self.__class__.__doc__), self.ast)
+        self.assertEqual(len(self.parsed), 1)
+
+    def testDirectoryCache(self):
+        self.checkCache(DirectoryCache(self.cacheDir))
+
+    def testFileCache(self):
+        self.checkCache(FileCache(os.path.join(self.cacheDir, 'asts')))
+
+    def testGrammarOptions(self):
+        cache = DirectoryCache(self.cacheDir)
+
+        CachingParser(self.parser, cache).parse(self.__class__.__doc__)
+
+        parsed = self.parsed
+
+        class RelaxedParser(parserFactory(**smiV1Relaxed)):
+            def parse(self, data, **kwargs):
+                parsed.append(data)
+                return parserFactory(**smiV1Relaxed).parse(self, data, **kwargs)
+
+        CachingParser(RelaxedParser(), cache).parse(self.__class__.__doc__)
+
+        self.assertEqual(len(self.parsed), 2)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
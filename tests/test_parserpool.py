@@ -0,0 +1,101 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import pickle
+import sys
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.parser.dialect import smiV1Relaxed
+from pysmi.parser.pool import ParserPool
+from pysmi.lexer.smi import lexerFactory
+
+
+class CustomParser(parserFactory(**smiV1Relaxed)):
+    pass
+
+
+class ParserPoolTestCase(unittest.TestCase):
+    """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+testObject OBJECT-TYPE
+    SYNTAX          Integer32
+    MAX-ACCESS      read-only
+    STATUS          current
+    DESCRIPTION     "Test object"
+  ::= { 1 3 }
+
+END
+ """
+
+    def testFactoriesMemoized(self):
+        self.assertTrue(parserFactory(**smiV1Relaxed) is parserFactory(**smiV1Relaxed))
+        self.assertTrue(lexerFactory(**smiV1Relaxed) is lexerFactory(**smiV1Relaxed))
+        self.assertFalse(parserFactory(**smiV1Relaxed) is parserFactory())
+
+    def testPickleSpecializedParser(self):
+        parser = pickle.loads(pickle.dumps(parserFactory(**smiV1Relaxed)()))
+
+        self.assertTrue(parser.__class__ is parserFactory(**smiV1Relaxed))
+
+    def testPickleParserSubclass(self):
+        parser = pickle.loads(pickle.dumps(CustomParser()))
+
+        self.assertTrue(parser.__class__ is CustomParser)
+
+    def testCheckoutCheckin(self):
+        pool = ParserPool(maxIdle=1, **smiV1Relaxed)
+
+        parser = pool.checkout()
+
+        self.assertTrue(isinstance(parser, parserFactory(**smiV1Relaxed)))
+
+        anotherParser = pool.checkout()
+
+        self.assertFalse(parser is anotherParser)
+
+        pool.checkin(parser)
+        pool.checkin(anotherParser)
+
+        self.assertTrue(pool.checkout() is parser)
+        self.assertFalse(pool.checkout() is anotherParser)
+
+    def testConcurrentParse(self):
+        pool = ParserPool()
+
+        ast = parserFactory()().parse(self.__class__.__doc__)
+
+        results = []
+
+        def parse():
+            for _ in range(10):
+                results.append(pool.parse(self.__class__.__doc__))
+
+        threads = [threading.Thread(target=parse) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [ast] * 40)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,37 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory, checkParserTables
+from pysmi.parser.dialect import smiV2, smiV1, smiV1Relaxed
+
+
+class ParserTablesTestCase(unittest.TestCase):
+
+    def testTablesUpToDate(self):
+        self.assertEqual(
+            checkParserTables(), [],
+            'pre-built parser tables are stale, run "python setup.py build_tables"'
+        )
+
+    def testTablesAssigned(self):
+        self.assertEqual(parserFactory(**smiV2).tabModule, 'pysmi.parser.tables.smiv2tab')
+        self.assertEqual(parserFactory(**smiV1).tabModule, 'pysmi.parser.tables.smiv1tab')
+        self.assertEqual(parserFactory(**smiV1Relaxed).tabModule, 'pysmi.parser.tables.smiv1relaxedtab')
+        self.assertEqual(parserFactory(supportIndex=True).tabModule, None)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,85 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.parser.dialect import smiV1Relaxed
+from pysmi import error
+
+
+class ParserTextsTestCase(unittest.TestCase):
+    """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  MODULE-IDENTITY, OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+testModule MODULE-IDENTITY
+ LAST-UPDATED "200001100000Z"
+ ORGANIZATION "AGENTX"
+ CONTACT-INFO "Test
+               contact"
+ DESCRIPTION  "Test"
+ REVISION     "200001100000Z"
+ DESCRIPTION  "Initial revision"
+ ::= { 1 3 }
+
+testObject OBJECT-TYPE
+    SYNTAX          Integer32
+    MAX-ACCESS      read-only
+    STATUS          current
+    DESCRIPTION     "Test
+                     object"
+    REFERENCE       "ABC"
+  ::= { testModule 1 }
+
+END
+"""
+
+    def setUp(self):
+        self.parser = parserFactory(**smiV1Relaxed)()
+
+    def testTextsKept(self):
+        moduleIdentity, objectType = self.parser.parse(self.__class__.__doc__)[0][3]
+
+        self.assertEqual(moduleIdentity[3], ('ORGANIZATION', 'AGENTX'))
+        self.assertEqual(objectType[6], ('DESCRIPTION', 'Test\n                     object'))
+        self.assertEqual(objectType[7], ('REFERENCE', 'ABC'))
+
+    def testTextsSkipped(self):
+        moduleIdentity, objectType = self.parser.parse(self.__class__.__doc__, genTexts=False)[0][3]
+
+        self.assertEqual(moduleIdentity[3], ('ORGANIZATION', ''))
+        self.assertEqual(moduleIdentity[4], ('CONTACT-INFO', ''))
+        self.assertEqual(moduleIdentity[6], ('Revisions', [('200001100000Z', ('DESCRIPTION', 'Initial revision'))]))
+        self.assertEqual(objectType[6], ('DESCRIPTION', ''))
+        self.assertEqual(objectType[7], ('REFERENCE', ''))
+
+    def testLineNumbersKept(self):
+        mib = self.__class__.__doc__.replace('::= { testModule 1 }', ':= { testModule 1 }')
+
+        for genTexts in (True, False):
+            try:
+                self.parser.parse(mib, genTexts=genTexts)
+
+            except error.PySmiParserError:
+                self.assertTrue('line 24' in str(sys.exc_info()[1]), sys.exc_info()[1])
+
+            else:
+                self.fail('parser error not raised')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,124 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.parser.dialect import smiV1Relaxed
+from pysmi import error
+
+
+class ParserThreadsTestCase(unittest.TestCase):
+
+    mibs = [
+        """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  MODULE-IDENTITY, OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+testModule MODULE-IDENTITY
+ LAST-UPDATED "200001100000Z"
+ ORGANIZATION "AGENTX"
+ CONTACT-INFO "Test"
+ DESCRIPTION  "Test"
+ REVISION     "200001100000Z"
+ DESCRIPTION  "Initial revision"
+ ::= { 1 3 }
+
+testObject OBJECT-TYPE
+    SYNTAX          Integer32 (0..10)
+    MAX-ACCESS      read-only
+    STATUS          current
+    DESCRIPTION     "Test object"
+  ::= { testModule 1 }
+
+END
+""",
+        """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE
+    FROM RFC-1212;
+
+TestType ::= INTEGER { one(1), two(2) }
+
+testObject OBJECT-TYPE
+    SYNTAX      TestType
+    ACCESS      read-only
+    STATUS      mandatory
+    DESCRIPTION "Test object"
+  ::= { 1 3 4 }
+
+END
+""",
+        """
+BROKEN-MIB DEFINITIONS ::= BEGIN
+
+-- line 4 follows
+
+
+brokenObject OBJECT IDENTIFIER := { 1 2 }
+
+END
+"""
+    ]
+
+    def parse(self, parser, mib):
+        try:
+            return parser.parse(mib)
+
+        except error.PySmiError:
+            return str(sys.exc_info()[1])
+
+    def testConcurrentParse(self):
+        parser = parserFactory(**smiV1Relaxed)()
+
+        expected = [self.parse(parser, mib) for mib in self.mibs]
+
+        self.assertTrue('line 7' in expected[-1], expected[-1])
+
+        results = {}
+
+        def worker(idx):
+            results[idx] = [self.parse(parser, self.mibs[(idx + x) % len(self.mibs)])
+                            for x in range(30)]
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for idx in results:
+            self.assertEqual(
+                results[idx],
+                [expected[(idx + x) % len(self.mibs)] for x in range(30)]
+            )
+
+        self.assertEqual(len(results), 8)
+
+    def testErrorDoesNotAffectNextParse(self):
+        parser = parserFactory(**smiV1Relaxed)()
+
+        failure = self.parse(parser, self.mibs[-1])
+
+        self.assertEqual(self.parse(parser, self.mibs[-1]), failure)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,255 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import sys
+import shutil
+import tempfile
+import py_compile
+import subprocess
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.reader.callback import CallbackReader
+from pysmi.parser.smi import parserFactory
+from pysmi.codegen.jsondoc import JsonCodeGen
+from pysmi.writer.pyfile import PyFileWriter
+from pysmi.compiler import MibCompiler
+from pysmi import error
+
+
+class BrokenCodeGen(JsonCodeGen):
+    def genCode(self, ast, symbolTable, **kwargs):
+        mibInfo, data = JsonCodeGen.genCode(self, ast, symbolTable, **kwargs)
+
+        if mibInfo.name == 'BROKEN-MIB':
+            data = 'x = (\n'
+
+        return mibInfo, data
+
+
+class PyFileWriterTestCase(unittest.TestCase):
+
+    data = """\
+x = 1
+y = x + 1
+"""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def listFiles(self):
+        files = []
+        for root, dirs, filenames in os.walk(self.path):
+            files.extend([os.path.relpath(os.path.join(root, x), self.path)
+                          for x in filenames])
+        return sorted(files)
+
+    def loadBytecode(self, pycfile):
+        import importlib.machinery
+
+        loader = importlib.machinery.SourcelessFileLoader('TEST-MIB', pycfile)
+
+        ctx = {}
+        exec(loader.get_code('TEST-MIB'), ctx)
+        return ctx
+
+    def testSourceOnly(self):
+        writer = PyFileWriter(self.path).setOptions(pyCompile=False)
+
+        writer.putData('TEST-MIB', self.data)
+
+        self.assertEqual(self.listFiles(), ['TEST-MIB.py'])
+
+    @unittest.skipIf(sys.version_info[0:2] < (3, 7), 'needs PEP 552 pyc')
+    def testSourceAndBytecode(self):
+        writer = PyFileWriter(self.path)
+
+        writer.putData('TEST-MIB', self.data)
+
+        pyfile = os.path.join(self.path, 'TEST-MIB.py')
+        pycfile = writer.getBytecodeFile(pyfile)
+
+        self.assertTrue(os.path.exists(pyfile))
+        self.assertTrue(os.path.exists(pycfile))
+
+        refpycfile = os.path.join(self.path, 'ref.pyc')
+
+        py_compile.compile(pyfile, cfile=refpycfile, doraise=True)
+
+        with open(pycfile, 'rb') as f:
+            pycData = f.read()
+
+        with open(refpycfile, 'rb') as f:
+            self.assertEqual(pycData, f.read())
+
+    @unittest.skipIf(sys.version_info[0:2] < (3, 7), 'needs PEP 552 pyc')
+    def testBytecodeLocation(self):
+        # importlib submodules must not be loaded by chance
+        subprocess.check_call(
+            [sys.executable, '-c',
+             'import sys; sys.path.insert(0, sys.argv[2]); '
+             'from pysmi.writer.pyfile import PyFileWriter; '
+             'PyFileWriter(sys.argv[1]).putData("TEST-MIB", "x = 1\\n")',
+             self.path, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+        )
+
+        import importlib.util
+
+        pycfile = importlib.util.cache_from_source(os.path.join(self.path, 'TEST-MIB.py'))
+
+        self.assertEqual(
+            self.listFiles(),
+            sorted(['TEST-MIB.py', os.path.relpath(pycfile, self.path)])
+        )
+
+    @unittest.skipIf(sys.version_info[0:2] < (3, 7), 'needs PEP 552 pyc')
+    def testOptimizationLevel(self):
+        writer = PyFileWriter(self.path).setOptions(pyOptimizationLevel=2)
+
+        writer.putData('TEST-MIB', self.data)
+
+        pycfile = writer.getBytecodeFile(os.path.join(self.path, 'TEST-MIB.py'))
+
+        self.assertTrue(pycfile.endswith('.opt-2.pyc'), pycfile)
+        self.assertEqual(self.loadBytecode(pycfile)['y'], 2)
+
+    @unittest.skipIf(sys.version_info[0:2] < (3, 7), 'needs PEP 552 pyc')
+    def testBytecodeOnly(self):
+        with open(os.path.join(self.path, 'TEST-MIB.py'), 'w') as f:
+            f.write('stale = True\n')
+
+        writer = PyFileWriter(self.path).setOptions(pySource=False)
+
+        writer.putData('TEST-MIB', self.data)
+
+        self.assertEqual(self.listFiles(), ['TEST-MIB.pyc'])
+
+        ctx = self.loadBytecode(os.path.join(self.path, 'TEST-MIB.pyc'))
+
+        self.assertEqual(ctx['y'], 2)
+
+    def testBrokenSource(self):
+        writer = PyFileWriter(self.path).setOptions(pySource=False)
+
+        self.assertRaises(error.PySmiWriterError, writer.putData, 'TEST-MIB', 'x = (\n')
+
+        self.assertEqual(self.listFiles(), ['TEST-MIB.py'])
+
+    def testDeferredCompile(self):
+        writer = PyFileWriter(self.path).setOptions(pyCompileWorkers=1)
+
+        writer.putData('TEST-MIB', self.data)
+        writer.putData('BROKEN-MIB', 'x = (\n')
+
+        self.assertEqual(self.listFiles(), ['BROKEN-MIB.py', 'TEST-MIB.py'])
+
+        failures = writer.flush()
+
+        self.assertEqual(list(failures), ['BROKEN-MIB'])
+        self.assertTrue('failure compiling' in str(failures['BROKEN-MIB']))
+
+        pycfile = writer.getBytecodeFile(os.path.join(self.path, 'TEST-MIB.py'))
+
+        self.assertTrue(os.path.exists(pycfile))
+        self.assertEqual(len(self.listFiles()), 3)
+
+        self.assertEqual(writer.flush(), {})
+
+    @unittest.skipIf(sys.version_info[0:2] < (3, 7), 'needs PEP 552 pyc')
+    def testParallelCompile(self):
+        writer = PyFileWriter(self.path).setOptions(pyCompileWorkers=2, pySource=False)
+
+        for idx in range(5):
+            writer.putData('TEST-MIB-%s' % idx, self.data)
+
+        self.assertEqual(writer.flush(), {})
+
+        self.assertEqual(self.listFiles(), ['TEST-MIB-%s.pyc' % idx for idx in range(5)])
+
+        ctx = self.loadBytecode(os.path.join(self.path, 'TEST-MIB-4.pyc'))
+
+        self.assertEqual(ctx['y'], 2)
+
+    def testDryRun(self):
+        writer = PyFileWriter(self.path)
+
+        writer.putData('TEST-MIB', self.data, dryRun=True)
+
+        self.assertEqual(self.listFiles(), [])
+
+
+class CompilerFailuresTestCase(unittest.TestCase):
+
+    mibs = {
+        'TEST-MIB': """
+TEST-MIB DEFINITIONS ::= BEGIN
+
+testObjects OBJECT IDENTIFIER ::= { 1 3 6 }
+
+END
+""",
+        'BROKEN-MIB': """
+BROKEN-MIB DEFINITIONS ::= BEGIN
+
+brokenObjects OBJECT IDENTIFIER ::= { 1 3 7 }
+
+END
+"""
+    }
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def getCompiler(self, **options):
+        mibCompiler = MibCompiler(
+            parserFactory()(), BrokenCodeGen(), PyFileWriter(self.path).setOptions(**options)
+        )
+
+        mibCompiler.addSources(
+            CallbackReader(lambda mibname, cbCtx: self.mibs.get(mibname))
+        )
+
+        return mibCompiler
+
+    def testCompileFailure(self):
+        processed = self.getCompiler().compile('TEST-MIB', 'BROKEN-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(processed['BROKEN-MIB'], 'failed')
+        self.assertTrue('BROKEN-MIB' in str(processed['BROKEN-MIB'].error))
+
+    def testDeferredCompileFailure(self):
+        processed = self.getCompiler(pyCompileWorkers=2).compile('TEST-MIB', 'BROKEN-MIB', ignoreErrors=True)
+
+        self.assertEqual(processed['TEST-MIB'], 'compiled')
+        self.assertEqual(processed['BROKEN-MIB'], 'failed')
+
+    def testIncrementalDeferredCompileFailure(self):
+        processed = list(self.getCompiler(pyCompileWorkers=1).icompile('TEST-MIB', 'BROKEN-MIB', ignoreErrors=True))
+
+        self.assertEqual(
+            sorted([(mibname, str(status)) for mibname, status in processed if mibname in self.mibs]),
+            [('BROKEN-MIB', 'compiled'), ('BROKEN-MIB', 'failed'), ('TEST-MIB', 'compiled')]
+        )
+        # writer failure supersedes the earlier report
+        self.assertEqual([str(status) for mibname, status in processed if mibname == 'BROKEN-MIB'][-1], 'failed')
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
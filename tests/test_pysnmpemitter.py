@@ -0,0 +1,422 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import os
+import sys
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.parser.dialect import smiV1Relaxed
+from pysmi.codegen.pysnmp import PySnmpCodeGen
+from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi import error
+from pysnmp.smi.builder import MibBuilder
+
+
+class ParityMixIn(object):
+
+    def genCode(self, mib, **kwargs):
+        ast = parserFactory(**smiV1Relaxed)().parse(mib)[0]
+        mibInfo, symtable = SymtableCodeGen().genCode(ast, {}, **kwargs)
+
+        return [PySnmpCodeGen(nativeEmitter=nativeEmitter).genCode(
+                ast, {mibInfo.name: symtable}, **kwargs)[1]
+                for nativeEmitter in (False, True)]
+
+    def testParity(self):
+        for genTexts in (True, False):
+            text, nativeText = self.genCode(self.__class__.__doc__, genTexts=genTexts)
+
+            self.assertEqual(nativeText, text)
+
+
+class NativeEmitterTestCase(ParityMixIn, unittest.TestCase):
+    """
+RICH-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  MODULE-IDENTITY, OBJECT-TYPE, NOTIFICATION-TYPE, OBJECT-IDENTITY,
+  Integer32, Unsigned32, Counter64, enterprises, Bits
+    FROM SNMPv2-SMI
+  TEXTUAL-CONVENTION
+    FROM SNMPv2-TC
+  MODULE-COMPLIANCE, OBJECT-GROUP, NOTIFICATION-GROUP, AGENT-CAPABILITIES
+    FROM SNMPv2-CONF;
+
+richModule MODULE-IDENTITY
+ LAST-UPDATED "201901100000Z"
+ ORGANIZATION "Rich Org"
+ CONTACT-INFO "Somebody
+               somewhere"
+ DESCRIPTION  "A rather long description that goes well beyond seventy nine characters so that it gets wrapped by the filter.
+
+  Second paragraph."
+ REVISION     "201901100000Z"
+ DESCRIPTION  "Third revision"
+ REVISION     "9901100000Z"
+ DESCRIPTION  "Second revision"
+ REVISION     "9801100000Z"
+ DESCRIPTION  "Initial revision"
+ ::= { 1 3 6 1 4 1 12345 }
+
+RichString ::= TEXTUAL-CONVENTION
+    DISPLAY-HINT "255a"
+    STATUS       current
+    DESCRIPTION  "Rich string"
+    SYNTAX       OCTET STRING (SIZE (0..255))
+
+RichEnum ::= TEXTUAL-CONVENTION
+    STATUS       deprecated
+    DESCRIPTION  "Rich enum"
+    SYNTAX       INTEGER { one(1), two(2), three(3) }
+
+RichSingleEnum ::= TEXTUAL-CONVENTION
+    STATUS       current
+    DESCRIPTION  "Single"
+    SYNTAX       INTEGER { only(1) }
+
+RichRange ::= TEXTUAL-CONVENTION
+    STATUS       current
+    DESCRIPTION  "Rich range"
+    SYNTAX       Integer32 (1..10 | 20..30)
+
+RichPlain ::= TEXTUAL-CONVENTION
+    STATUS       current
+    DESCRIPTION  "Rich plain"
+    SYNTAX       Unsigned32
+
+RichType ::= INTEGER (0..100)
+
+richObjects OBJECT-IDENTITY
+    STATUS      current
+    DESCRIPTION "Objects"
+    REFERENCE   "RFC 0000"
+    ::= { richModule 1 }
+
+richScalar OBJECT-TYPE
+    SYNTAX      Integer32 (0..10 | 100)
+    UNITS       "seconds"
+    MAX-ACCESS  read-write
+    STATUS      current
+    DESCRIPTION "Scalar"
+    DEFVAL      { 5 }
+    ::= { richObjects 1 }
+
+richHex OBJECT-TYPE
+    SYNTAX      OCTET STRING (SIZE (4))
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Hex"
+    DEFVAL      { 'DEADBEEF'H }
+    ::= { richObjects 2 }
+
+richHexInt OBJECT-TYPE
+    SYNTAX      Integer32
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Hex int"
+    DEFVAL      { '1F'H }
+    ::= { richObjects 3 }
+
+richBin OBJECT-TYPE
+    SYNTAX      OCTET STRING
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Bin"
+    DEFVAL      { '1010'B }
+    ::= { richObjects 4 }
+
+richString OBJECT-TYPE
+    SYNTAX      RichString
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "String"
+    DEFVAL      { "hello" }
+    ::= { richObjects 5 }
+
+richOid OBJECT-TYPE
+    SYNTAX      OBJECT IDENTIFIER
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Oid"
+    DEFVAL      { richObjects }
+    ::= { richObjects 6 }
+
+richEnum OBJECT-TYPE
+    SYNTAX      INTEGER { up(1), down(2), testing(3) }
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Enum"
+    DEFVAL      { down }
+    ::= { richObjects 7 }
+
+richBits OBJECT-TYPE
+    SYNTAX      BITS { first(0), second(1), third(2) }
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Bits"
+    ::= { richObjects 8 }
+
+richSingleBit OBJECT-TYPE
+    SYNTAX      BITS { alone(0) }
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Bit"
+    ::= { richObjects 9 }
+
+richTable OBJECT-TYPE
+    SYNTAX      SEQUENCE OF RichEntry
+    MAX-ACCESS  not-accessible
+    STATUS      current
+    DESCRIPTION "Table"
+    ::= { richObjects 10 }
+
+richEntry OBJECT-TYPE
+    SYNTAX      RichEntry
+    MAX-ACCESS  not-accessible
+    STATUS      current
+    DESCRIPTION "Entry"
+    INDEX       { richIndex, IMPLIED richName }
+    ::= { richTable 1 }
+
+RichEntry ::= SEQUENCE {
+    richIndex   Integer32,
+    richName    RichString,
+    richCounter Counter64,
+    richStatus  RichEnum
+}
+
+richIndex OBJECT-TYPE
+    SYNTAX      Integer32 (1..2147483647)
+    MAX-ACCESS  not-accessible
+    STATUS      current
+    DESCRIPTION "Index"
+    ::= { richEntry 1 }
+
+richName OBJECT-TYPE
+    SYNTAX      RichString
+    MAX-ACCESS  read-create
+    STATUS      current
+    DESCRIPTION "Name"
+    ::= { richEntry 2 }
+
+richCounter OBJECT-TYPE
+    SYNTAX      Counter64
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Counter"
+    ::= { richEntry 3 }
+
+richStatus OBJECT-TYPE
+    SYNTAX      RichEnum
+    MAX-ACCESS  read-create
+    STATUS      current
+    DESCRIPTION "Status"
+    ::= { richEntry 4 }
+
+richAugTable OBJECT-TYPE
+    SYNTAX      SEQUENCE OF RichAugEntry
+    MAX-ACCESS  not-accessible
+    STATUS      current
+    DESCRIPTION "Augmenting table"
+    ::= { richObjects 11 }
+
+richAugEntry OBJECT-TYPE
+    SYNTAX      RichAugEntry
+    MAX-ACCESS  not-accessible
+    STATUS      current
+    DESCRIPTION "Augmenting entry"
+    AUGMENTS    { richEntry }
+    ::= { richAugTable 1 }
+
+RichAugEntry ::= SEQUENCE {
+    richExtra   Unsigned32
+}
+
+richExtra OBJECT-TYPE
+    SYNTAX      Unsigned32
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Extra"
+    ::= { richAugEntry 1 }
+
+richNotifications OBJECT IDENTIFIER ::= { richModule 2 }
+
+richEvent NOTIFICATION-TYPE
+    OBJECTS     { richScalar, richName, richCounter }
+    STATUS      current
+    DESCRIPTION "Event"
+    ::= { richNotifications 1 }
+
+richLoneEvent NOTIFICATION-TYPE
+    OBJECTS     { richScalar }
+    STATUS      current
+    DESCRIPTION "Lone event"
+    ::= { richNotifications 2 }
+
+richEmptyEvent NOTIFICATION-TYPE
+    STATUS      obsolete
+    DESCRIPTION "Empty event"
+    ::= { richNotifications 3 }
+
+richConformance OBJECT IDENTIFIER ::= { richModule 3 }
+
+richGroup OBJECT-GROUP
+    OBJECTS     { richScalar, richHex, richName }
+    STATUS      current
+    DESCRIPTION "Group"
+    ::= { richConformance 1 }
+
+richLoneGroup OBJECT-GROUP
+    OBJECTS     { richCounter }
+    STATUS      current
+    DESCRIPTION "Lone group"
+    ::= { richConformance 2 }
+
+richNotificationGroup NOTIFICATION-GROUP
+    NOTIFICATIONS { richEvent, richLoneEvent }
+    STATUS      current
+    DESCRIPTION "Notification group"
+    ::= { richConformance 3 }
+
+richCompliance MODULE-COMPLIANCE
+    STATUS      current
+    DESCRIPTION "Compliance"
+    MODULE      -- this module
+    MANDATORY-GROUPS { richGroup, richNotificationGroup }
+    ::= { richConformance 4 }
+
+richCapabilities AGENT-CAPABILITIES
+    PRODUCT-RELEASE "Rich agent 1.0"
+    STATUS      current
+    DESCRIPTION "Capabilities"
+    REFERENCE   "Rich reference"
+    SUPPORTS    RICH-MIB
+    INCLUDES    { richGroup }
+    ::= { richConformance 5 }
+
+END
+ """
+
+    def testLoadable(self):
+        text, nativeText = self.genCode(self.__class__.__doc__, genTexts=True)
+
+        mibBuilder = MibBuilder()
+        mibBuilder.loadTexts = True
+
+        ctx = {'mibBuilder': mibBuilder}
+
+        exec(compile(nativeText, 'test', 'exec'), ctx, ctx)
+
+        self.assertEqual(ctx['richEntry'].getIndexNames(),
+                         ((0, 'RICH-MIB', 'richIndex'), (1, 'RICH-MIB', 'richName')))
+
+    def testCustomTemplate(self):
+        path = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, path)
+
+        dstTemplate = os.path.join(path, 'custom.j2')
+
+        with open(dstTemplate, 'w') as fp:
+            fp.write('{{ mib.meta.module }}')
+
+        text, nativeText = self.genCode(
+            self.__class__.__doc__, dstTemplate=dstTemplate)
+
+        self.assertEqual(nativeText, 'RICH-MIB')
+
+
+class NativeEmitterSmiV1TestCase(ParityMixIn, unittest.TestCase):
+    """
+RICH-V1-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  enterprises, Counter, Gauge, TimeTicks, IpAddress
+    FROM RFC1155-SMI
+  OBJECT-TYPE
+    FROM RFC-1212
+  TRAP-TYPE
+    FROM RFC-1215
+  DisplayString
+    FROM RFC1213-MIB;
+
+richV1 OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 54321 }
+
+RichV1Type ::= INTEGER { on(1), off(2) }
+
+RichV1Octets ::= OCTET STRING (SIZE (0..16))
+
+richV1Scalar OBJECT-TYPE
+    SYNTAX  RichV1Type
+    ACCESS  read-write
+    STATUS  mandatory
+    DESCRIPTION "V1 scalar"
+    DEFVAL  { on }
+    ::= { richV1 1 }
+
+richV1Gauge OBJECT-TYPE
+    SYNTAX  Gauge
+    ACCESS  read-only
+    STATUS  mandatory
+    ::= { richV1 2 }
+
+richV1Address OBJECT-TYPE
+    SYNTAX  IpAddress
+    ACCESS  read-only
+    STATUS  deprecated
+    DESCRIPTION "Address"
+    ::= { richV1 3 }
+
+richV1Trap TRAP-TYPE
+    ENTERPRISE  richV1
+    VARIABLES   { richV1Scalar, richV1Gauge }
+    DESCRIPTION "Trap"
+    ::= 1
+
+END
+ """
+
+
+class NativeEmitterFailureTestCase(unittest.TestCase):
+    """
+BITS-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE, Bits
+    FROM SNMPv2-SMI;
+
+testBits OBJECT-TYPE
+    SYNTAX      BITS { first(0), second(1), third(2) }
+    MAX-ACCESS  read-only
+    STATUS      current
+    DESCRIPTION "Bits"
+    DEFVAL      { { first, third } }
+    ::= { 1 3 }
+
+END
+ """
+
+    def testSameFailure(self):
+        ast = parserFactory()().parse(self.__class__.__doc__)[0]
+        mibInfo, symtable = SymtableCodeGen().genCode(ast, {})
+
+        for nativeEmitter in (False, True):
+            self.assertRaises(
+                error.PySmiCodegenError,
+                PySnmpCodeGen(nativeEmitter=nativeEmitter).genCode,
+                ast, {mibInfo.name: symtable}
+            )
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,74 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.parser.smi import parserFactory
+from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi import error
+
+
+class PostponedSymbolsTestCase(unittest.TestCase):
+
+    def genSymtable(self, declarations):
+        mib = """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  Integer32
+    FROM SNMPv2-SMI;
+
+%s
+
+END
+""" % declarations
+
+        ast = parserFactory()().parse(mib)[0]
+
+        mibInfo, symtable = SymtableCodeGen().genCode(ast, {})
+
+        return symtable
+
+    def testTransitiveResolution(self):
+        symtable = self.genSymtable("""
+TestTypeC ::= TestTypeB
+TestTypeB ::= TestTypeA
+TestTypeA ::= Integer32
+""")
+
+        self.assertEqual(symtable['_symtable_order'], ['TestTypeA', 'TestTypeB', 'TestTypeC'])
+
+    def testManyDependents(self):
+        symtable = self.genSymtable(
+            '\n'.join(['TestType%s ::= TestTypeBase' % x for x in range(50)]) +
+            '\nTestTypeBase ::= Integer32\n'
+        )
+
+        self.assertEqual(
+            symtable['_symtable_order'],
+            ['TestTypeBase'] + ['TestType%s' % x for x in range(50)]
+        )
+
+    def testUnknownParent(self):
+        self.assertRaises(
+            error.PySmiSemanticError,
+            self.genSymtable,
+            """
+TestTypeB ::= TestTypeA
+TestTypeC ::= TestTypeB
+"""
+        )
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,157 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysmi/license.html
+#
+import sys
+import os
+import shutil
+import tarfile
+import tempfile
+from io import BytesIO
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.reader.tarreader import TarReader
+from pysmi.reader.url import getReadersFromUrls
+from pysmi import error
+
+
+class TarReaderTestCase(unittest.TestCase):
+
+    members = [
+        ('mibs/TEST-MIB.txt', b'TEST-MIB DEFINITIONS ::= BEGIN\nEND\n'),
+        ('mibs/vendor/OTHER-MIB', b'OTHER-MIB DEFINITIONS ::= BEGIN\nEND\n'),
+        ('other/TEST-MIB.txt', b'TEST-MIB duplicate\n')
+    ]
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def makeTar(self, filename, mode):
+        filename = os.path.join(self.path, filename)
+
+        archive = tarfile.open(filename, mode)
+
+        archive.addfile(tarfile.TarInfo('mibs'))
+
+        for name, data in self.members:
+            member = tarfile.TarInfo(name)
+            member.size = len(data)
+            member.mtime = 1000000000
+            archive.addfile(member, BytesIO(data))
+
+        archive.close()
+
+        return filename
+
+    def checkReader(self, tarReader):
+        mibinfo, data = tarReader.getData('TEST-MIB')
+
+        self.assertEqual(mibinfo.file, 'TEST-MIB.txt')
+        self.assertEqual(mibinfo.mtime, 1000000000)
+        self.assertEqual(data, 'TEST-MIB DEFINITIONS ::= BEGIN\nEND\n')
+
+        mibinfo, data = tarReader.getData('OTHER-MIB')
+
+        self.assertEqual(data, 'OTHER-MIB DEFINITIONS ::= BEGIN\nEND\n')
+
+        self.assertRaises(error.PySmiReaderFileNotFoundError, tarReader.getData, 'UNKNOWN-MIB')
+
+    def testPlainTar(self):
+        tarReader = TarReader(self.makeTar('mibs.tar', 'w'))
+
+        self.checkReader(tarReader)
+
+        tarReader.close()
+
+    def testCompressedTar(self):
+        tarReader = TarReader(self.makeTar('mibs.tar.gz', 'w:gz'))
+
+        self.checkReader(tarReader)
+
+        tarReader.close()
+
+    def testSpillFile(self):
+
+        class SpillingTarReader(TarReader):
+            maxMemorySize = 10
+
+        tarReader = SpillingTarReader(self.makeTar('mibs.tgz', 'w:gz'))
+
+        self.checkReader(tarReader)
+
+        tarReader.close()
+
+    def testOversizedMib(self):
+
+        class SmallTarReader(TarReader):
+            maxMibSize = 20
+
+        for filename, mode in (('mibs.tar', 'w'), ('mibs.tar.bz2', 'w:bz2')):
+            tarReader = SmallTarReader(self.makeTar(filename, mode))
+
+            self.assertRaises(error.PySmiReaderFileNotFoundError, tarReader.getData, 'TEST-MIB')
+
+            tarReader.close()
+
+    def testTruncatedArchive(self):
+        self.members = self.members + [
+            ('mibs/BIG-MIB', b''.join([b'-- %d\n' % idx for idx in range(20000)]))
+        ]
+
+        filename = self.makeTar('mibs.tar.gz', 'w:gz')
+
+        with open(filename, 'rb') as fileObj:
+            data = fileObj.read()
+
+        # cut off within large MIB file
+        with open(filename, 'wb') as fileObj:
+            fileObj.write(data[:len(data) // 2])
+
+        tarReader = TarReader(filename, ignoreErrors=False)
+
+        # temporary storage is not kept for failed archive
+        self.assertTrue(tarReader._fileObj is None)
+
+        self.assertRaises(error.PySmiError, tarReader.getData, 'TEST-MIB')
+
+    def testBrokenArchive(self):
+        filename = os.path.join(self.path, 'broken.tar.gz')
+
+        with open(filename, 'wb') as fileObj:
+            fileObj.write(b'garbage')
+
+        tarReader = TarReader(filename)
+
+        self.assertRaises(error.PySmiReaderFileNotFoundError, tarReader.getData, 'TEST-MIB')
+
+        tarReader = TarReader(filename, ignoreErrors=False)
+
+        self.assertRaises(error.PySmiError, tarReader.getData, 'TEST-MIB')
+
+    def testReadersFromUrls(self):
+        filename = self.makeTar('mibs.tar.gz', 'w:gz')
+
+        for url in (filename, 'tar://' + filename):
+            readers = getReadersFromUrls(url)
+
+            self.assertTrue(isinstance(readers[0], TarReader), url)
+
+            self.checkReader(readers[0])
+
+            readers[0].close()
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
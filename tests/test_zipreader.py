@@ -6,6 +6,8 @@
 #
 import sys
 import os
+import shutil
+import zipfile
 import tempfile
 
 try:
@@ -20,7 +22,11 @@ try:
 except ImportError:
     from io import StringIO
 
+from io import BytesIO
+
+from pysmi.reader import zipreader
 from pysmi.reader.zipreader import ZipReader
+from pysmi import error
 
 
 class ZipReaderTestCase(unittest.TestCase):
@@ -217,6 +223,121 @@ class ZipReaderTestCase(unittest.TestCase):
             except Exception:
                 pass
 
+    def makeZip(self, members):
+        fileObj = BytesIO()
+
+        archive = zipfile.ZipFile(fileObj, 'w', zipfile.ZIP_DEFLATED)
+
+        for filename, data in members:
+            archive.writestr(filename, data)
+
+        archive.close()
+
+        return fileObj.getvalue()
+
+    def makeVendorZip(self):
+        path = tempfile.mkdtemp()
+
+        self.addCleanup(shutil.rmtree, path)
+
+        filename = os.path.join(path, 'vendor.zip')
+
+        with open(filename, 'wb') as fileObj:
+            fileObj.write(self.makeZip(
+                [('mibs/TOP-MIB', 'TOP\n')] +
+                [('mibs/bundle%d.zip' % x,
+                  self.makeZip([('BUNDLE%d-MIB%d' % (x, y), 'BUNDLE%d-%d\n' % (x, y))
+                                for y in range(3)]))
+                 for x in range(3)]
+            ))
+
+        return filename
+
+    def countArchives(self):
+        opened = []
+
+        zipFile = zipfile.ZipFile
+
+        def countingZipFile(*args, **kwargs):
+            opened.append(args[0])
+            return zipFile(*args, **kwargs)
+
+        zipreader.zipfile.ZipFile = countingZipFile
+
+        self.addCleanup(setattr, zipreader.zipfile, 'ZipFile', zipFile)
+
+        return opened
+
+    def testInnerArchivesKept(self):
+        filename = self.makeVendorZip()
+
+        opened = self.countArchives()
+
+        zipReader = ZipReader(filename)
+
+        self.addCleanup(zipReader.close)
+
+        # outer archive plus each inner one
+        self.assertEqual(len(opened), 4)
+
+        for _ in range(2):
+            for x in range(3):
+                for y in range(3):
+                    mibinfo, data = zipReader.getData('BUNDLE%d-MIB%d' % (x, y))
+
+                    self.assertEqual(data, 'BUNDLE%d-%d\n' % (x, y))
+
+            mibinfo, data = zipReader.getData('TOP-MIB')
+
+            self.assertEqual(data, 'TOP\n')
+
+        self.assertEqual(len(opened), 4)
+
+    def testInnerArchivesEvicted(self):
+        filename = self.makeVendorZip()
+
+        zipReader = ZipReader(filename)
+
+        # room for a single inner archive
+        class SmallCacheZipReader(ZipReader):
+            maxCacheSize = max(
+                size for _, size in zipReader._innerArchives.values())
+
+        zipReader.close()
+
+        opened = self.countArchives()
+
+        zipReader = SmallCacheZipReader(filename)
+
+        self.addCleanup(zipReader.close)
+
+        self.assertEqual(len(zipReader._innerArchives), 1)
+
+        zipReader.getData('BUNDLE0-MIB0')
+        zipReader.getData('BUNDLE1-MIB0')
+
+        self.assertEqual(list(zipReader._innerArchives), [('mibs/bundle1.zip',)])
+
+        del opened[:]
+
+        mibinfo, data = zipReader.getData('BUNDLE1-MIB2')
+
+        self.assertEqual(data, 'BUNDLE1-2\n')
+        self.assertEqual(len(opened), 0)
+
+        mibinfo, data = zipReader.getData('BUNDLE2-MIB2')
+
+        self.assertEqual(data, 'BUNDLE2-2\n')
+        self.assertEqual(len(opened), 1)
+
+    def testClose(self):
+        zipReader = ZipReader(self.makeVendorZip())
+
+        zipReader.close()
+
+        self.assertRaises(error.PySmiReaderFileNotFoundError, zipReader.getData, 'TOP-MIB')
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':